@@ -5,18 +5,75 @@ This library converts Python classes, modules, and project structures into clean
 UML diagrams, flowcharts, class relationships, and architectural visualizations.
 """
 
+from typing import TYPE_CHECKING
+
 from .core import diagram
-from .generators import UMLDiagramGenerator, FlowchartGenerator, ClassDiagramGenerator
-from .exporters import SVGExporter, PNGExporter, PDFExporter, HTMLExporter
+from .exporters import HTMLExporter, PDFExporter, PNGExporter, SVGExporter
+from .generators import ClassDiagramGenerator, FlowchartGenerator, UMLDiagramGenerator
+from .registry import lazy_attributes, register_exporter, register_generator
+
+if TYPE_CHECKING:
+    from .exporters import (
+        DOTExporter,
+        MermaidExporter,
+        OutputManifest,
+        PlantUMLExporter,
+        SVGZExporter,
+        TileExporter,
+    )
+    from .generators import (
+        CallGraphGenerator,
+        DiagramSnapshot,
+        ImportTimeGenerator,
+        ObjectGraphGenerator,
+        ProfileGraphGenerator,
+        RenderBudget,
+        SequenceDiagramGenerator,
+    )
+    from .site import SiteBuilder
+
+# Imported on first access; most of these pull in heavy standard library modules.
+__getattr__ = lazy_attributes(__name__, {
+    "CallGraphGenerator": ".generators.call_graph:CallGraphGenerator",
+    "SequenceDiagramGenerator": ".generators.sequence:SequenceDiagramGenerator",
+    "ImportTimeGenerator": ".generators.import_time:ImportTimeGenerator",
+    "ProfileGraphGenerator": ".generators.profile_graph:ProfileGraphGenerator",
+    "ObjectGraphGenerator": ".generators.object_graph:ObjectGraphGenerator",
+    "DiagramSnapshot": ".generators.snapshot:DiagramSnapshot",
+    "RenderBudget": ".generators.budget:RenderBudget",
+    "SVGZExporter": ".exporters.svgz:SVGZExporter",
+    "TileExporter": ".exporters.tiles:TileExporter",
+    "MermaidExporter": ".exporters.text:MermaidExporter",
+    "DOTExporter": ".exporters.text:DOTExporter",
+    "PlantUMLExporter": ".exporters.text:PlantUMLExporter",
+    "OutputManifest": ".exporters.manifest:OutputManifest",
+    "SiteBuilder": ".site:SiteBuilder",
+})
 
 __version__ = "0.1.2"
 __all__ = [
     "diagram",
+    "register_generator",
+    "register_exporter",
     "UMLDiagramGenerator",
     "FlowchartGenerator",
     "ClassDiagramGenerator",
+    "CallGraphGenerator",
+    "SequenceDiagramGenerator",
+    "ImportTimeGenerator",
+    "ProfileGraphGenerator",
+    "ObjectGraphGenerator",
+    "DiagramSnapshot",
+    "RenderBudget",
     "SVGExporter",
+    "SVGZExporter",
     "PNGExporter",
     "PDFExporter",
     "HTMLExporter",
+    "TileExporter",
+    "MermaidExporter",
+    "DOTExporter",
+    "PlantUMLExporter",
+    "OutputManifest",
+    "SiteBuilder",
 ]
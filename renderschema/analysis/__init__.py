@@ -0,0 +1,29 @@
+"""Shared analysis helpers used by the diagram generators."""
+
+from typing import TYPE_CHECKING
+
+from ..registry import lazy_attributes
+from .members import MemberEnumerator
+from .types import TypeIndex, qualified_name
+
+if TYPE_CHECKING:
+    from .imports import capture_import_log, parse_import_log
+    from .index import RelationshipIndex
+    from .tracing import CallTracer
+
+__getattr__ = lazy_attributes(__name__, {
+    "CallTracer": ".tracing:CallTracer",
+    "RelationshipIndex": ".index:RelationshipIndex",
+    "capture_import_log": ".imports:capture_import_log",
+    "parse_import_log": ".imports:parse_import_log",
+})
+
+__all__ = [
+    "CallTracer",
+    "MemberEnumerator",
+    "RelationshipIndex",
+    "TypeIndex",
+    "capture_import_log",
+    "parse_import_log",
+    "qualified_name",
+]
@@ -0,0 +1,275 @@
+"""Class analysis of past revisions read straight from a git repository."""
+
+import subprocess
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from .source import analyze_source, module_name
+from .types import extract_relationships
+
+
+class GitRepository:
+    """
+    Read-only access to the objects of a local git repository.
+
+    File contents are read by blob id through one long-running
+    ``git cat-file --batch`` process, so no revision is ever checked out.
+    """
+
+    def __init__(self, path: Union[str, Path] = ".") -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            path: Any directory inside the repository.
+        """
+        self.path = Path(path)
+        self._batch: Optional[subprocess.Popen[bytes]] = None
+
+    def resolve(self, revision: str) -> str:
+        """Return the commit id a revision (tag, branch, sha, ...) points to."""
+        spec = f"{revision}^{{commit}}"
+        return self._git("rev-parse", "--verify", "--quiet", spec).decode().strip()
+
+    def tree(self, revision: str, root: str = "") -> str:
+        """Return the id of the tree at ``root`` in ``revision``."""
+        path = root.strip("/")
+        spec = f"{revision}:{path}" if path else f"{revision}^{{tree}}"
+        return self._git("rev-parse", "--verify", "--quiet", spec).decode().strip()
+
+    def tags(self, pattern: Optional[str] = None) -> List[str]:
+        """
+        List tags, oldest first.
+
+        Args:
+            pattern: Optional ``fnmatch``-style pattern such as ``"v*"``.
+        """
+        ref = f"refs/tags/{pattern}" if pattern else "refs/tags"
+        output = self._git(
+            "for-each-ref", "--sort=creatordate", "--format=%(refname:short)", ref
+        )
+        return output.decode().split()
+
+    def list_files(self, revision: str, root: str = "") -> List[Tuple[str, str]]:
+        """
+        List the files of a revision.
+
+        Args:
+            revision: Revision to list.
+            root: Only list files below this directory.
+
+        Returns:
+            ``(path, blob_id)`` pairs with POSIX paths relative to the
+            repository root.
+        """
+        args = ["ls-tree", "-r", "-z", "--full-tree", revision]
+        if root.strip("/"):
+            args += ["--", root.strip("/")]
+        files = []
+        for entry in self._git(*args).split(b"\0"):
+            if not entry:
+                continue
+            meta, _, path = entry.partition(b"\t")
+            _, kind, blob = meta.split()
+            if kind == b"blob":
+                files.append((path.decode("utf-8", "surrogateescape"), blob.decode()))
+        return files
+
+    def read_blob(self, blob: str) -> bytes:
+        """Return the contents of a blob."""
+        if self._batch is None:
+            self._batch = subprocess.Popen(
+                ["git", "-C", str(self.path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        stdin: IO[bytes] = self._batch.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = self._batch.stdout  # type: ignore[assignment]
+        stdin.write(blob.encode() + b"\n")
+        stdin.flush()
+        header = stdout.readline().split()
+        if len(header) != 3:
+            raise ValueError(f"Unknown git object: {blob}")
+        data = stdout.read(int(header[2]))
+        stdout.read(1)  # trailing newline
+        return data
+
+    def close(self) -> None:
+        """Stop the background ``git cat-file`` process."""
+        if self._batch is not None:
+            self._batch.stdin.close()  # type: ignore[union-attr]
+            self._batch.wait()
+            self._batch.stdout.close()  # type: ignore[union-attr]
+            self._batch = None
+
+    def __enter__(self) -> "GitRepository":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _git(self, *args: str) -> bytes:
+        """Run a git command and return its output."""
+        result = subprocess.run(
+            ["git", "-C", str(self.path), *args], capture_output=True
+        )
+        if result.returncode != 0:
+            message = result.stderr.decode(errors="replace").strip()
+            raise ValueError(f"git {' '.join(args)} failed: {message or 'not found'}")
+        return result.stdout
+
+
+class HistoryAnalyzer:
+    """
+    Analyze the classes of any revision of a repository.
+
+    Static analysis results are cached by blob id, so a file that is
+    identical across many revisions is read and parsed only once, and
+    snapshots are cached by tree id, so revisions whose sources did not
+    change at all cost nothing beyond a ``git rev-parse``.
+
+    Example:
+        >>> with HistoryAnalyzer(".", root="src") as history:
+        ...     for snapshot in history.snapshots(history.repository.tags("v*")):
+        ...         ClassDiagramGenerator.from_analysis(snapshot).export(
+        ...             f"docs/history/{snapshot['name']}.svg"
+        ...         )
+    """
+
+    def __init__(
+        self, repository: Union[str, Path, GitRepository] = ".", root: str = ""
+    ) -> None:
+        """
+        Initialize the analyzer.
+
+        Args:
+            repository: The repository or a path inside it.
+            root: Directory that module names are relative to, e.g. ``"src"``.
+        """
+        if not isinstance(repository, GitRepository):
+            repository = GitRepository(repository)
+        self.repository = repository
+        self.root = root.strip("/")
+        self._blobs: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._trees: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def parsed_blobs(self) -> int:
+        """Number of distinct files analyzed so far."""
+        return len(self._blobs)
+
+    def snapshot(self, revision: str) -> Dict[str, Any]:
+        """
+        Analyze the classes of a revision.
+
+        Args:
+            revision: Tag, branch or commit to analyze.
+
+        Returns:
+            Class diagram data (``classes`` and ``relationships``) that can
+            be rendered with ``ClassDiagramGenerator.from_analysis()``, plus
+            the resolved ``revision`` commit id and source ``tree`` id.
+        """
+        commit = self.repository.resolve(revision)
+        tree = self.repository.tree(commit, self.root)
+        cached = self._trees.get(tree)
+        if cached is None:
+            classes: List[Dict[str, Any]] = []
+            for path, blob in self.repository.list_files(tree):
+                module = module_name(path)
+                if module is None:
+                    continue
+                key = (blob, module)
+                described = self._blobs.get(key)
+                if described is None:
+                    described = analyze_source(
+                        self.repository.read_blob(blob),
+                        module,
+                        is_package=path.endswith("__init__.py"),
+                    )
+                    self._blobs[key] = described
+                classes.extend(described)
+            cached = {
+                "classes": classes,
+                "relationships": extract_relationships(classes),
+            }
+            self._trees[tree] = cached
+
+        return {
+            "type": "snapshot",
+            "name": revision,
+            "revision": commit,
+            "tree": tree,
+            **cached,
+        }
+
+    def snapshots(self, revisions: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Yield ``snapshot()`` for each revision, in order."""
+        for revision in revisions:
+            yield self.snapshot(revision)
+
+    def close(self) -> None:
+        """Release the underlying repository."""
+        self.repository.close()
+
+    def __enter__(self) -> "HistoryAnalyzer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def diff_snapshots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine two snapshots into one diagram that highlights their differences.
+
+    Classes and relationships that only exist in ``new`` get
+    ``"change": "added"``, those only in ``old`` get ``"change": "removed"``.
+
+    Args:
+        old: Earlier snapshot.
+        new: Later snapshot.
+
+    Returns:
+        Class diagram data for ``ClassDiagramGenerator.from_analysis()``.
+    """
+    old_ids = {cls["id"] for cls in old["classes"]}
+    new_ids = {cls["id"] for cls in new["classes"]}
+    classes = [
+        cls if cls["id"] in old_ids else dict(cls, change="added")
+        for cls in new["classes"]
+    ] + [
+        dict(cls, change="removed")
+        for cls in old["classes"] if cls["id"] not in new_ids
+    ]
+
+    def key(rel: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (rel["type"], rel["from"], rel["to"], rel.get("label"))
+
+    old_rels = {key(rel) for rel in old["relationships"]}
+    new_rels = {key(rel) for rel in new["relationships"]}
+    relationships = [
+        rel if key(rel) in old_rels else dict(rel, change="added")
+        for rel in new["relationships"]
+    ] + [
+        dict(rel, change="removed")
+        for rel in old["relationships"] if key(rel) not in new_rels
+    ]
+
+    return {
+        "type": "diff",
+        "name": f"{old['name']}..{new['name']}",
+        "classes": classes,
+        "relationships": relationships,
+    }
@@ -0,0 +1,149 @@
+"""Parsing and capturing ``python -X importtime`` logs."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+# "import time:       457 |       9168 |   json.decoder"; the name is indented
+# by two spaces per nesting level. Header and "cached" lines do not match.
+_LINE = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S.*?)\s*$")
+
+
+def parse_import_log(log: Union[str, Iterable[str]]) -> List[Dict[str, Any]]:
+    """
+    Build the import tree recorded in an ``-X importtime`` log.
+
+    The interpreter prints each module after the modules it imported, so
+    children are collected per nesting level until their parent appears.
+    Lines that are not import timings are ignored, which allows parsing a
+    program's complete stderr.
+
+    Args:
+        log: The log text, or an iterable of its lines.
+
+    Returns:
+        The top-level imports in order, each a dictionary with ``name``,
+        ``self`` and ``cumulative`` times in microseconds and its
+        ``children``.
+    """
+    lines = log.splitlines() if isinstance(log, str) else log
+    pending: Dict[int, List[Dict[str, Any]]] = {}
+    for line in lines:
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = {
+            "name": name,
+            "self": int(self_us),
+            "cumulative": int(cumulative),
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    # A truncated log leaves imports whose parent never finished; keep them
+    # as roots rather than dropping them.
+    return [node for depth in sorted(pending) for node in pending[depth]]
+
+
+def capture_import_log(
+    module: str,
+    python: Optional[str] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    timeout: Optional[float] = 60,
+) -> str:
+    """
+    Import a module in a fresh interpreter and return its importtime log.
+
+    The child interpreter sees the current ``sys.path`` through
+    ``PYTHONPATH``, so anything importable here is importable there.
+
+    Args:
+        module: Dotted name of the module to import.
+        python: Interpreter to run; defaults to ``sys.executable``.
+        cwd: Working directory of the child process.
+        timeout: Seconds to wait for the import.
+
+    Returns:
+        The log written to the child's stderr.
+
+    Raises:
+        ValueError: If ``module`` is not a dotted module name or the import
+            fails.
+    """
+    if not re.fullmatch(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)*", module):
+        raise ValueError(f"Not a module name: {module!r}")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [entry for entry in sys.path if entry] + [env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+        timeout=timeout,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not _LINE.match(line)]
+        raise ValueError(
+            f"Importing {module} failed: {errors[-1] if errors else result.returncode}"
+        )
+    return result.stderr
+
+
+def mark_hot_chains(roots: Sequence[Dict[str, Any]], count: int = 3) -> None:
+    """
+    Mark the most expensive import chains with ``hot = True``.
+
+    A chain starts at one of the ``count`` slowest top-level imports and
+    repeatedly descends into the slowest child.
+
+    Args:
+        roots: Top-level imports from ``parse_import_log``.
+        count: Number of chains to mark.
+    """
+    for node in sorted(roots, key=lambda node: -node["cumulative"])[:count]:
+        node["hot"] = True
+        while node["children"]:
+            node = max(node["children"], key=lambda child: child["cumulative"])
+            node["hot"] = True
+
+
+def diff_import_trees(
+    roots: Sequence[Dict[str, Any]], baseline: Sequence[Dict[str, Any]]
+) -> List[str]:
+    """
+    Annotate an import tree with the times of a baseline run.
+
+    Every node gains ``baseline_self`` and ``baseline_cumulative``, which
+    are None for modules the baseline did not import.
+
+    Args:
+        roots: Top-level imports of the current run; updated in place.
+        baseline: Top-level imports of the baseline run.
+
+    Returns:
+        Names of modules imported by the baseline but not by this run.
+    """
+    before: Dict[str, Dict[str, Any]] = {}
+    stack = list(baseline)
+    while stack:
+        node = stack.pop()
+        before.setdefault(node["name"], node)
+        stack.extend(node["children"])
+    seen = set()
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        seen.add(node["name"])
+        old = before.get(node["name"])
+        node["baseline_self"] = old["self"] if old else None
+        node["baseline_cumulative"] = old["cumulative"] if old else None
+        stack.extend(node["children"])
+    return sorted(name for name in before if name not in seen)
@@ -0,0 +1,292 @@
+"""Persistent relationship index for neighbourhood queries on large class graphs."""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+# SQLite's default limit on host parameters is 999.
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classes (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    module TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS classes_name ON classes (name);
+CREATE TABLE IF NOT EXISTS relationships (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    type TEXT NOT NULL,
+    label TEXT,
+    declared_by TEXT
+);
+CREATE INDEX IF NOT EXISTS relationships_source ON relationships (source);
+CREATE INDEX IF NOT EXISTS relationships_target ON relationships (target);
+"""
+
+# An association inherited from an indexed base is only drawn from that base,
+# as in ``extract_relationships``.
+_DRAWN = (
+    "(declared_by IS NULL OR declared_by = source"
+    " OR declared_by NOT IN (SELECT id FROM classes))"
+)
+
+
+class RelationshipIndex:
+    """
+    Store analyzed classes and their relationships in an SQLite database.
+
+    The index is built once from analysis data and then answers
+    neighbourhood queries with indexed lookups, without re-analyzing the
+    project. Query results use the ``analyze()`` data format, so they can be
+    rendered directly by ``ClassDiagramGenerator``.
+
+    Example:
+        >>> data = diagram(mypackage, diagram_type="class", recursive=True).analyze()
+        >>> with RelationshipIndex("classes.db") as index:
+        ...     index.add(data)
+        >>> with RelationshipIndex("classes.db") as index:
+        ...     ClassDiagramGenerator.from_index(index, "app.orders.Order", hops=2)
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        """
+        Open (or create) an index.
+
+        Args:
+            path: Database file, or ``":memory:"`` for a temporary index.
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def add(self, data: Dict[str, Any]) -> None:
+        """
+        Add or replace analyzed classes and their outgoing relationships.
+
+        Every inheritance and association of the added classes is stored,
+        including those to classes that are not indexed yet, so modules can
+        be added one at a time: an edge appears in query results once both
+        of its classes have been added.
+
+        Args:
+            data: Data in the format returned by ``ClassDiagramGenerator.analyze()``.
+        """
+        classes = [cls for cls in data.get("classes", []) if not cls.get("stub")]
+        ids = [cls["id"] for cls in classes]
+        with self._lock, self._connection:
+            for start in range(0, len(ids), _BATCH):
+                batch = ids[start:start + _BATCH]
+                marks = _placeholders(batch)
+                self._connection.execute(
+                    f"DELETE FROM relationships WHERE source IN ({marks})", batch
+                )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO classes (id, name, module, data) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (cls["id"], cls["name"], cls.get("module", ""), json.dumps(cls))
+                    for cls in classes
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO relationships (source, target, type, label, declared_by) "
+                "VALUES (?, ?, ?, ?, ?)",
+                _relationship_rows(classes, data.get("relationships", [])),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM classes").fetchone()
+        count: int = row[0]
+        return count
+
+    def find(self, name: str) -> List[str]:
+        """Return the ids of classes with the given id or short name."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM classes WHERE id = ? OR name = ? ORDER BY id",
+                (name, name),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def neighbourhood(
+        self,
+        class_id: str,
+        hops: int = 1,
+        kinds: Optional[Sequence[str]] = None,
+        direction: str = "both",
+    ) -> Dict[str, Any]:
+        """
+        Collect the classes within ``hops`` relationships of a class.
+
+        Args:
+            class_id: Qualified id (or unique short name) of the center class.
+            hops: Maximum number of relationships between the center and any
+                included class.
+            kinds: Relationship types to follow, e.g. ``["inheritance"]``.
+                Defaults to all.
+            direction: ``"out"`` follows relationships from a class,
+                ``"in"`` towards it, ``"both"`` either way.
+
+        Returns:
+            Class diagram data containing the neighbourhood's classes and
+            every relationship between them.
+
+        Raises:
+            ValueError: If the class is unknown or its short name is ambiguous.
+        """
+        if direction not in ("in", "out", "both"):
+            raise ValueError(
+                f"Unknown direction: {direction}. Available: in, out, both"
+            )
+        matches = self.find(class_id)
+        if len(matches) != 1:
+            problem = "Unknown class" if not matches else "Ambiguous class name"
+            raise ValueError(f"{problem}: {class_id}")
+        center = matches[0]
+
+        kind_filter = ""
+        kind_args: List[str] = []
+        if kinds:
+            kind_filter = f" AND type IN ({_placeholders(kinds)})"
+            kind_args = list(kinds)
+
+        # Only indexed classes are walked through; an edge to an external
+        # base such as ``Exception`` must not link its unrelated subclasses.
+        seen: Set[str] = {center}
+        frontier = [center]
+        with self._lock:
+            for _ in range(hops):
+                found: Set[str] = set()
+                for start in range(0, len(frontier), _BATCH):
+                    batch = frontier[start:start + _BATCH]
+                    marks = _placeholders(batch)
+                    if direction in ("out", "both"):
+                        found.update(row[0] for row in self._connection.execute(
+                            "SELECT target FROM relationships "
+                            f"WHERE source IN ({marks}) AND {_DRAWN}{kind_filter} "
+                            "AND target IN (SELECT id FROM classes)",
+                            batch + kind_args,
+                        ))
+                    if direction in ("in", "both"):
+                        found.update(row[0] for row in self._connection.execute(
+                            "SELECT source FROM relationships "
+                            f"WHERE target IN ({marks}) AND {_DRAWN}{kind_filter} "
+                            "AND source IN (SELECT id FROM classes)",
+                            batch + kind_args,
+                        ))
+                frontier = sorted(found - seen)
+                if not frontier:
+                    break
+                seen.update(frontier)
+
+            members = sorted(seen)
+            classes = self._fetch_classes(members)
+            relationships = self._fetch_relationships(
+                set(classes), kind_filter, kind_args
+            )
+
+        return {
+            "type": "neighbourhood",
+            "name": center,
+            "classes": [classes[member] for member in members if member in classes],
+            "relationships": relationships,
+        }
+
+    def _fetch_classes(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load the stored descriptions of the given classes."""
+        classes: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), _BATCH):
+            batch = ids[start:start + _BATCH]
+            rows = self._connection.execute(
+                f"SELECT id, data FROM classes WHERE id IN ({_placeholders(batch)})",
+                batch,
+            )
+            for class_id, data in rows:
+                classes[class_id] = json.loads(data)
+        return classes
+
+    def _fetch_relationships(
+        self, ids: Set[str], kind_filter: str, kind_args: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Load the relationships whose source and target are both in ``ids``."""
+        members = sorted(ids)
+        relationships = []
+        for start in range(0, len(members), _BATCH):
+            batch = members[start:start + _BATCH]
+            rows = self._connection.execute(
+                "SELECT source, target, type, label FROM relationships "
+                f"WHERE source IN ({_placeholders(batch)}) AND {_DRAWN}{kind_filter} "
+                "ORDER BY rowid",
+                batch + kind_args,
+            )
+            for source, target, kind, label in rows:
+                if target in ids:
+                    rel = {"type": kind, "from": source, "to": target}
+                    if label is not None:
+                        rel["label"] = label
+                    relationships.append(rel)
+        return relationships
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self) -> "RelationshipIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _relationship_rows(
+    classes: List[Dict[str, Any]], relationships: Iterable[Dict[str, Any]]
+) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
+    """
+    Collect the stored edges of ``classes``.
+
+    Edges come from each class's ``base_ids`` and ``associations``, which
+    still include targets outside the analyzed batch, plus any listed
+    ``relationships`` not derived from them.
+    """
+    rows: Dict[Tuple[str, str, str, Optional[str]], Optional[str]] = {}
+    for cls in classes:
+        for base in cls.get("base_ids", []):
+            rows[(cls["id"], base, "inheritance", None)] = None
+        for assoc in cls.get("associations", []):
+            key = (cls["id"], assoc["to"], assoc["type"], assoc.get("attribute"))
+            rows[key] = assoc.get("declared_by")
+    for rel in relationships:
+        rows.setdefault((rel["from"], rel["to"], rel["type"], rel.get("label")), None)
+    return [key + (declared_by,) for key, declared_by in rows.items()]
+
+
+def _placeholders(values: Iterable[Any]) -> str:
+    """Return ``?, ?, ...`` with one placeholder per value."""
+    return ", ".join("?" for _ in values)
@@ -0,0 +1,129 @@
+"""Descriptor-safe class member enumeration with per-class memoisation."""
+
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Type
+
+# Callback turning one raw ``__dict__`` entry into a member description, or
+# ``None`` to leave the member out.
+MemberDescriber = Callable[[Type, str, Any], Optional[Dict[str, Any]]]
+
+#: Entries the interpreter puts in every class ``__dict__``; they describe the
+#: class object itself rather than members written in the class body.
+INTERPRETER_ATTRIBUTES = frozenset({
+    "__abstractmethods__",
+    "__annotations__",
+    "__annotate__",
+    "__dict__",
+    "__doc__",
+    "__firstlineno__",
+    "__module__",
+    "__orig_bases__",
+    "__parameters__",
+    "__qualname__",
+    "__static_attributes__",
+    "__type_params__",
+    "__weakref__",
+})
+
+
+class MemberEnumerator:
+    """
+    Enumerate class members by reading each class's own ``__dict__`` once.
+
+    Unlike ``inspect.getmembers``, no attribute is fetched through ``getattr``,
+    so properties and other descriptors are never invoked. Entries the
+    interpreter adds to every class (``__dict__``, ``__doc__``, ``__module__``
+    and the like, see ``INTERPRETER_ATTRIBUTES``) are left out. Each class's
+    own members are described once; the merged view of a class reuses the
+    merged view of its base, so analysing many subclasses of one large base
+    only walks the base a single time.
+    """
+
+    def __init__(self, describe: MemberDescriber) -> None:
+        """
+        Initialize the enumerator.
+
+        Args:
+            describe: Callback receiving ``(defining_class, name, raw_value)``
+                and returning a member description or ``None`` to skip it.
+        """
+        self._describe = describe
+        self._own: weakref.WeakKeyDictionary[
+            Type, Dict[str, Optional[Dict[str, Any]]]
+        ] = weakref.WeakKeyDictionary()
+        self._merged: weakref.WeakKeyDictionary[
+            Type, Dict[str, Dict[str, Any]]
+        ] = weakref.WeakKeyDictionary()
+
+    def own_members(self, cls: Type) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Describe the members defined directly on ``cls``.
+
+        Args:
+            cls: Class to inspect.
+
+        Returns:
+            Mapping of member name to description. Skipped members map to
+            ``None`` so that they still shadow inherited members.
+        """
+        own = self._own.get(cls)
+        if own is None:
+            own = {
+                name: self._describe(cls, name, value)
+                for name, value in vars(cls).items()
+                if name not in INTERPRETER_ATTRIBUTES
+            }
+            self._own[cls] = own
+        return own
+
+    def members(self, cls: Type) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe all members of ``cls`` visible through its MRO, excluding
+        those inherited from ``object``.
+
+        Args:
+            cls: Class to inspect.
+
+        Returns:
+            Mapping of member name to description. Treat it as read-only; it
+            is shared with the memoised results of subclasses.
+        """
+        merged = self._merged.get(cls)
+        if merged is not None:
+            return merged
+
+        bases = [base for base in cls.__bases__ if base is not object]
+        if len(bases) == 1 and cls.__mro__[1] is bases[0]:
+            # Single inheritance: the MRO is cls followed by the base's MRO.
+            merged = dict(self.members(bases[0]))
+            self._overlay(merged, self.own_members(cls))
+        else:
+            merged = {}
+            for klass in reversed(cls.__mro__):
+                if klass is not object:
+                    self._overlay(merged, self.own_members(klass))
+
+        self._merged[cls] = merged
+        return merged
+
+    def sorted_members(self, cls: Type) -> List[Dict[str, Any]]:
+        """Return the member descriptions of ``cls`` ordered by name."""
+        merged = self.members(cls)
+        return [merged[name] for name in sorted(merged)]
+
+    def forget(self, cls: Type) -> None:
+        """Drop the memoised results for ``cls``, e.g. once a stream is done with it."""
+        self._own.pop(cls, None)
+        self._merged.pop(cls, None)
+
+    @staticmethod
+    def _overlay(
+        merged: Dict[str, Dict[str, Any]],
+        own: Dict[str, Optional[Dict[str, Any]]],
+    ) -> None:
+        """Apply a class's own members on top of its inherited ones."""
+        for name, description in own.items():
+            if description is None:
+                merged.pop(name, None)
+            else:
+                merged[name] = description
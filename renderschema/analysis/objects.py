@@ -0,0 +1,205 @@
+"""Bounded walks of live object graphs for memory diagrams."""
+
+import gc
+import sys
+import types
+import weakref
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from .tracing import _matches
+
+#: Types never counted or walked into. Classes, modules and functions are
+#: shared by the whole program, so walking them would reach most of the heap
+#: instead of what an object retains.
+SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.CodeType,
+    types.FrameType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.GetSetDescriptorType,
+    types.MemberDescriptorType,
+    weakref.ReferenceType,
+)
+
+
+def type_name(cls: type) -> str:
+    """Qualified name of a type; builtins are prefixed with ``builtins.``."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def object_graph(
+    root: Any,
+    max_objects: int = 100_000,
+    max_depth: Optional[int] = None,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Walk the objects reachable from ``root`` and aggregate them by type.
+
+    The walk is breadth-first over ``gc.get_referents`` and touches each
+    object once. Visited objects are remembered by id, and per-object
+    bookkeeping lives in integer arrays, so memory grows with the number of
+    visited objects but no object is kept alive by the result. Objects
+    waiting to be expanded are held through weak references where their
+    type supports them; the remaining ones are already reachable from
+    ``root``, so holding them allocates nothing new.
+
+    Objects whose type matches ``exclude`` (glob patterns or module names,
+    matched against qualified type names such as ``builtins.dict`` or
+    ``myapp.cache.LRUCache``) are neither counted nor walked into, and
+    neither are classes, modules and functions. With ``include``, only
+    matching types become groups of their own; other objects are walked
+    through and their size is attributed to the nearest included object
+    that reached them.
+
+    Retained sizes are approximated on the breadth-first tree: an object
+    retains everything first reached through it. Each group's ``retained``
+    size sums the subtrees of its objects that were reached from a
+    different group.
+
+    Args:
+        root: The object to inspect; it always forms its own group.
+        max_objects: Maximum number of objects visited.
+        max_depth: Maximum number of references followed from ``root``.
+        include: Type patterns shown as separate groups.
+        exclude: Type patterns skipped entirely.
+
+    Returns:
+        Dictionary with the type ``groups`` (count, shallow ``size`` and
+        ``retained`` size in bytes), reference ``edges`` between groups with
+        their counts, the number of ``objects`` visited and whether the
+        walk was ``truncated``.
+    """
+    include = list(include) if include is not None else None
+    exclude = list(exclude or ())
+
+    group_ids: Dict[str, int] = {}
+    group_names: List[str] = []
+    decisions: Dict[type, int] = {}  # type -> group index, -1 owned, -2 skipped
+
+    def classify(cls: type) -> int:
+        decision = decisions.get(cls)
+        if decision is None:
+            name = type_name(cls)
+            if issubclass(cls, SHARED_TYPES) or _matches(name, exclude):
+                decision = -2
+            elif include is not None and not _matches(name, include):
+                decision = -1
+            else:
+                decision = group_ids.setdefault(name, len(group_ids))
+                if decision == len(group_names):
+                    group_names.append(name)
+            decisions[cls] = decision
+        return decision
+
+    # Per visited object, in visiting order: BFS parent, shallow size and
+    # the group it is counted in (its own, or its owner's).
+    parents = array("q")
+    sizes = array("q")
+    owners = array("l")
+    own_group = array("b")
+    visited: Set[int] = set()
+
+    root_name = type_name(type(root))
+    group_ids[root_name + " (root)"] = 0
+    group_names.append(root_name + " (root)")
+    frontier: Deque[Tuple[int, int, Any]] = deque()
+
+    def visit(obj: Any, parent: int, group: int, owner: int, depth: int) -> None:
+        index = len(sizes)
+        visited.add(id(obj))
+        parents.append(parent)
+        own_group.append(group != -1)
+        try:
+            sizes.append(sys.getsizeof(obj, 0))
+        except TypeError:
+            sizes.append(0)
+        owners.append(owner if group == -1 else group)
+        try:
+            pending: Any = weakref.ref(obj)
+        except TypeError:
+            pending = obj
+        frontier.append((index, depth, pending))
+
+    # The walk's own containers must never be counted.
+    visited.update(map(id, (visited, frontier, parents, sizes, owners, own_group)))
+    visit(root, -1, 0, 0, 0)
+    truncated = False
+    while frontier:
+        index, depth, pending = frontier.popleft()
+        obj = pending() if isinstance(pending, weakref.ref) else pending
+        del pending
+        if obj is None or (max_depth is not None and depth >= max_depth):
+            continue
+        referents = gc.get_referents(obj)
+        del obj
+        owner = owners[index]
+        for child in referents:
+            if id(child) in visited:
+                continue
+            group = classify(type(child))
+            if group == -2:
+                continue
+            if len(sizes) >= max_objects:
+                truncated = True
+                break
+            visit(child, index, group, owner, depth + 1)
+        del referents
+        if truncated:
+            frontier.clear()
+    visited.clear()
+
+    count = [0] * len(group_names)
+    size = [0] * len(group_names)
+    retained = [0] * len(group_names)
+    edges: Dict[Tuple[int, int], int] = {}
+    for index in range(len(sizes)):
+        group = owners[index]
+        size[group] += sizes[index]
+        if own_group[index]:
+            count[group] += 1
+            parent = parents[index]
+            if parent >= 0 and owners[parent] != group:
+                key = (owners[parent], group)
+                edges[key] = edges.get(key, 0) + 1
+
+    # Subtree sizes, children before parents.
+    subtree = array("q", sizes)
+    for index in range(len(sizes) - 1, 0, -1):
+        subtree[parents[index]] += subtree[index]
+    for index in range(len(sizes)):
+        parent = parents[index]
+        if own_group[index] and (parent < 0 or owners[parent] != owners[index]):
+            retained[owners[index]] += subtree[index]
+
+    return {
+        "type": "object_graph",
+        "name": root_name,
+        "groups": [
+            {
+                "id": name,
+                "name": (
+                    name[9:] if name.startswith("builtins.")
+                    else name.rsplit(".", 1)[-1]
+                ),
+                "count": count[index],
+                "size": size[index],
+                "retained": retained[index],
+                "root": index == 0,
+            }
+            for index, name in enumerate(group_names)
+        ],
+        "edges": [
+            {"from": group_names[source], "to": group_names[target], "count": number}
+            for (source, target), number in edges.items()
+        ],
+        "objects": len(sizes),
+        "truncated": truncated,
+    }
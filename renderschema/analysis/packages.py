@@ -0,0 +1,334 @@
+"""Recursive package discovery and isolated, parallel module analysis."""
+
+import fnmatch
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import pkgutil
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+# Callable run inside a worker on each imported module. It must be picklable
+# (a module-level function or a ``functools.partial`` of one) and return
+# picklable data.
+ModuleAnalyzer = Callable[[Any], Dict[str, Any]]
+
+
+def _matches(name: str, patterns: Optional[Sequence[str]]) -> bool:
+    """Return whether a dotted module name matches any glob pattern."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns or ())
+
+
+def iter_submodules(
+    package: Any,
+    max_depth: Optional[int] = None,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> Iterator[str]:
+    """
+    Walk a package and yield the dotted names of the modules to analyze.
+
+    Subpackages are discovered from the file system without being imported.
+
+    Args:
+        package: An imported package (a module with ``__path__``).
+        max_depth: Deepest level to descend to, where the package itself is
+            depth 0 and its direct submodules are depth 1. ``None`` means no
+            limit.
+        include: Glob patterns (e.g. ``"pkg.models.*"``); when given, only
+            matching modules are yielded. Non-matching subpackages are still
+            searched.
+        exclude: Glob patterns for modules to skip. An excluded subpackage is
+            skipped together with everything below it.
+
+    Yields:
+        Dotted module names, the package itself first.
+    """
+    root = package.__name__
+    if _matches(root, exclude):
+        return
+    if include is None or _matches(root, include):
+        yield root
+
+    stack = [(list(getattr(package, "__path__", [])), root, 1)]
+    while stack:
+        paths, prefix, depth = stack.pop()
+        if max_depth is not None and depth > max_depth:
+            continue
+        for info in sorted(pkgutil.iter_modules(paths), key=lambda m: m.name):
+            name = f"{prefix}.{info.name}"
+            if _matches(name, exclude):
+                continue
+            if include is None or _matches(name, include):
+                yield name
+            if info.ispkg:
+                finder_path = getattr(info.module_finder, "path", "")
+                location = os.path.join(finder_path, info.name)
+                stack.append(([location], name, depth + 1))
+
+
+def _worker_main(conn: Any, analyzer: ModuleAnalyzer) -> None:
+    """Import and analyze module names received over ``conn`` until told to stop."""
+    while True:
+        try:
+            name = conn.recv()
+        except EOFError:
+            return
+        if name is None:
+            return
+        try:
+            module = importlib.import_module(name)
+            conn.send(("ok", name, analyzer(module)))
+        except BaseException as exc:  # noqa: B036 - report SystemExit etc. too
+            conn.send(("error", name, f"{type(exc).__name__}: {exc}"))
+
+
+class _Worker:
+    """A long-lived analysis process handling one module at a time."""
+
+    def __init__(self, context: Any, analyzer: ModuleAnalyzer) -> None:
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, analyzer), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.task: Optional[str] = None
+        self.deadline = 0.0
+
+    def submit(self, name: str, timeout: float) -> None:
+        self.task = name
+        self.deadline = time.monotonic() + timeout
+        self.conn.send(name)
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+
+def analyze_modules(
+    names: Sequence[str],
+    analyzer: ModuleAnalyzer,
+    workers: Optional[int] = None,
+    timeout: float = 30.0,
+    start_method: Optional[str] = "spawn",
+) -> List[Dict[str, Any]]:
+    """
+    Import and analyze modules, each in an isolated worker process.
+
+    At most ``workers`` processes run at once. A module whose import exceeds
+    ``timeout`` seconds, raises, or kills its worker is reported with a
+    non-``"ok"`` status and its worker is replaced; the remaining modules
+    are unaffected.
+
+    Args:
+        names: Dotted names of the modules to analyze.
+        analyzer: Picklable callable applied to each imported module.
+        workers: Maximum number of worker processes. ``0`` imports in the
+            current process without isolation or timeouts. ``None`` uses the
+            CPU count.
+        timeout: Seconds allowed per module.
+        start_method: ``multiprocessing`` start method for the workers.
+
+    Returns:
+        One result per module, in the order of ``names``, each a dictionary
+        with ``module``, ``status`` (``"ok"``, ``"error"``, ``"timeout"`` or
+        ``"crashed"``), ``data`` and ``error`` keys.
+    """
+    return list(iter_module_results(
+        names, analyzer, workers=workers, timeout=timeout, start_method=start_method
+    ))
+
+
+def iter_module_results(
+    names: Iterable[str],
+    analyzer: ModuleAnalyzer,
+    workers: Optional[int] = None,
+    timeout: float = 30.0,
+    start_method: Optional[str] = "spawn",
+    window: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily import and analyze modules, yielding results in input order.
+
+    Behaves like :func:`analyze_modules`, but consumes ``names`` lazily and
+    yields each result as soon as it and all earlier ones are done. At most
+    ``window`` modules are in flight or waiting to be yielded at any time,
+    which bounds memory regardless of the number of modules.
+
+    Args:
+        names: Dotted names of the modules to analyze.
+        analyzer: Picklable callable applied to each imported module.
+        workers: Maximum number of worker processes (``0`` for in-process).
+        timeout: Seconds allowed per module.
+        start_method: ``multiprocessing`` start method for the workers.
+        window: Maximum number of unyielded modules. Defaults to twice the
+            number of workers.
+
+    Yields:
+        Result dictionaries as described in :func:`analyze_modules`.
+    """
+    if workers == 0:
+        for name in names:
+            yield _analyze_in_process(name, analyzer)
+        return
+
+    context = multiprocessing.get_context(start_method)
+    pool_size = workers or os.cpu_count() or 1
+    window = max(window or 2 * pool_size, 1)
+    source = iter(names)
+    order: Deque[str] = deque()
+    pending: Deque[str] = deque()
+    results: Dict[str, Dict[str, Any]] = {}
+    idle: List[_Worker] = []
+    busy: List[_Worker] = []
+    started = 0
+
+    def record(
+        name: str, status: str, data: Any = None, error: Optional[str] = None
+    ) -> None:
+        results[name] = {
+            "module": name, "status": status, "data": data, "error": error
+        }
+
+    def refill() -> None:
+        while len(order) < window:
+            name = next(source, None)
+            if name is None:
+                return
+            order.append(name)
+            pending.append(name)
+
+    try:
+        refill()
+        while order:
+            while pending and (idle or started < pool_size):
+                if idle:
+                    worker = idle.pop()
+                else:
+                    worker = _Worker(context, analyzer)
+                    started += 1
+                worker.submit(pending.popleft(), timeout)
+                busy.append(worker)
+
+            if busy:
+                next_deadline = min(worker.deadline for worker in busy)
+                waitables: List[Any] = [w.conn for w in busy]
+                waitables += [w.process.sentinel for w in busy]
+                ready = set(wait(waitables, max(0.0, next_deadline - time.monotonic())))
+            else:
+                ready = set()
+
+            for worker in list(busy):
+                task = worker.task
+                assert task is not None
+                if worker.conn in ready:
+                    try:
+                        status, _, payload = worker.conn.recv()
+                    except (EOFError, OSError):
+                        status, payload = "crashed", None
+                    if status == "ok":
+                        record(task, "ok", data=payload)
+                    elif status == "error":
+                        record(task, "error", error=payload)
+                elif worker.process.sentinel in ready:
+                    status = "crashed"
+                elif time.monotonic() >= worker.deadline:
+                    status = "timeout"
+                else:
+                    continue
+
+                busy.remove(worker)
+                if status in ("ok", "error"):
+                    idle.append(worker)
+                    continue
+                worker.kill()
+                started -= 1
+                if status == "timeout":
+                    record(task, "timeout", error=f"Import exceeded {timeout}s")
+                else:
+                    code = worker.process.exitcode
+                    record(task, "crashed", error=f"Worker exited with code {code}")
+
+            while order and order[0] in results:
+                yield results.pop(order.popleft())
+            refill()
+    finally:
+        for worker in idle:
+            worker.stop()
+        for worker in busy:
+            worker.kill()
+
+
+def _analyze_in_process(name: str, analyzer: ModuleAnalyzer) -> Dict[str, Any]:
+    """Import and analyze a module in the current process."""
+    try:
+        data = analyzer(importlib.import_module(name))
+    except Exception as exc:
+        return {
+            "module": name,
+            "status": "error",
+            "data": None,
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+    return {"module": name, "status": "ok", "data": data, "error": None}
+
+
+def subpackage_of(module_name: str, package_name: str) -> str:
+    """
+    Return the direct subpackage of ``package_name`` that contains a module.
+
+    Plain modules directly inside the package, and the package itself,
+    belong to the package.
+    """
+    if module_name == package_name:
+        return package_name
+    head = module_name[len(package_name) + 1:].split(".", 1)[0]
+    candidate = f"{package_name}.{head}"
+    if candidate != module_name:
+        return candidate
+    # Only the (already imported) root package is imported to find the spec.
+    spec = importlib.util.find_spec(candidate)
+    is_package = spec is not None and spec.submodule_search_locations is not None
+    return candidate if is_package else package_name
+
+
+def merge_classes(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Concatenate the ``classes`` of every successfully analyzed module."""
+    classes: List[Dict[str, Any]] = []
+    for result in results:
+        if result["status"] == "ok":
+            classes.extend(result["data"].get("classes", []))
+    return classes
+
+
+def module_statuses(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Summarize per-module results without their analysis data."""
+    return [
+        {"name": r["module"], "status": r["status"], "error": r["error"]}
+        for r in results
+    ]
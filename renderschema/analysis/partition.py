@@ -0,0 +1,207 @@
+"""Partitioning of large class graphs into clusters rendered as separate pages."""
+
+import random
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+#: Name of the page holding the cluster graph; no cluster page may use it.
+OVERVIEW_PAGE = "overview"
+
+
+def page_stem(name: str) -> str:
+    """Return a file-system safe stem for a page or cluster name."""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "page"
+
+
+def partition_by_package(
+    classes: Sequence[Dict[str, Any]], depth: Optional[int] = None
+) -> Dict[str, List[str]]:
+    """
+    Group classes by the module (or package prefix) that defines them.
+
+    Args:
+        classes: Class descriptions with ``id`` and ``module`` keys.
+        depth: Number of leading module name components to group by, e.g.
+            ``2`` groups ``app.models.user`` under ``app.models``. ``None``
+            groups by full module name.
+
+    Returns:
+        Mapping of cluster name to the ids of its classes.
+    """
+    clusters: Dict[str, List[str]] = {}
+    for cls in classes:
+        module = cls.get("module", "")
+        key = ".".join(module.split(".")[:depth]) if depth else module
+        clusters.setdefault(key, []).append(cls["id"])
+    return clusters
+
+
+def detect_communities(
+    nodes: Sequence[str],
+    edges: Iterable[Tuple[str, str]],
+    max_iterations: int = 20,
+    seed: int = 0,
+) -> Dict[str, List[str]]:
+    """
+    Find densely connected groups of nodes with label propagation.
+
+    Each iteration is linear in the number of edges. Ties are broken towards
+    the smallest label and nodes are visited in a seeded order, so results
+    are deterministic for a given seed.
+
+    Args:
+        nodes: Node identifiers.
+        edges: Undirected edges as ``(node, node)`` pairs.
+        max_iterations: Upper bound on propagation rounds.
+        seed: Seed for the visiting order.
+
+    Returns:
+        Mapping of community name (its smallest member) to member ids.
+    """
+    neighbours: Dict[str, List[str]] = {node: [] for node in nodes}
+    for a, b in edges:
+        if a in neighbours and b in neighbours and a != b:
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+
+    labels = {node: node for node in nodes}
+    order = sorted(neighbours)
+    rng = random.Random(seed)
+
+    for _ in range(max_iterations):
+        rng.shuffle(order)
+        changed = False
+        for node in order:
+            if not neighbours[node]:
+                continue
+            counts: Dict[str, int] = {}
+            for neighbour in neighbours[node]:
+                label = labels[neighbour]
+                counts[label] = counts.get(label, 0) + 1
+            best = max(counts.values())
+            label = min(label for label, count in counts.items() if count == best)
+            if label != labels[node]:
+                labels[node] = label
+                changed = True
+        if not changed:
+            break
+
+    communities: Dict[str, List[str]] = {}
+    for node in nodes:
+        communities.setdefault(labels[node], []).append(node)
+    return {min(members): members for members in communities.values()}
+
+
+def split_oversized(
+    clusters: Dict[str, List[str]], max_size: int
+) -> Dict[str, List[str]]:
+    """
+    Split clusters larger than ``max_size`` into numbered chunks.
+
+    Args:
+        clusters: Mapping of cluster name to member ids.
+        max_size: Largest allowed cluster.
+
+    Returns:
+        Mapping in which no cluster exceeds ``max_size`` members.
+    """
+    result: Dict[str, List[str]] = {}
+    for name, members in clusters.items():
+        if len(members) <= max_size:
+            result[name] = members
+            continue
+        for part, start in enumerate(range(0, len(members), max_size), start=1):
+            result[f"{name} ({part})"] = members[start:start + max_size]
+    return result
+
+
+def build_pages(
+    classes: Sequence[Dict[str, Any]],
+    relationships: Sequence[Dict[str, Any]],
+    clusters: Dict[str, List[str]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build per-cluster diagram data plus an overview of the cluster graph.
+
+    A relationship that crosses clusters appears on the page of its source
+    class, with the target drawn as a stub that references the target's page.
+    Clusters whose file stem is taken, by the overview or by an earlier
+    cluster, get a ``-2``, ``-3``... suffix, so every page gets its own file.
+
+    Args:
+        classes: Class descriptions with ``id`` keys.
+        relationships: Relationships with ``from``/``to`` class ids.
+        clusters: Mapping of cluster name to member ids.
+
+    Returns:
+        ``(pages, overview)``: analysis data per cluster name, and analysis
+        data whose classes are the clusters themselves.
+    """
+    clusters = _unique_page_names(clusters)
+    cluster_of = {
+        member: name for name, members in clusters.items() for member in members
+    }
+    by_id = {cls["id"]: cls for cls in classes}
+
+    pages: Dict[str, Dict[str, Any]] = {
+        name: {
+            "type": "cluster",
+            "name": name,
+            "classes": [by_id[member] for member in members if member in by_id],
+            "relationships": [],
+        }
+        for name, members in clusters.items()
+    }
+    stubs: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in clusters}
+    cluster_edges: Dict[Tuple[str, str], int] = {}
+
+    for rel in relationships:
+        source = cluster_of.get(rel["from"])
+        target = cluster_of.get(rel["to"])
+        if source is None or target is None:
+            continue
+        pages[source]["relationships"].append(rel)
+        if source == target:
+            continue
+        cluster_edges[(source, target)] = cluster_edges.get((source, target), 0) + 1
+        if rel["to"] not in stubs[source]:
+            stubs[source][rel["to"]] = {
+                "id": rel["to"],
+                "name": by_id[rel["to"]]["name"] if rel["to"] in by_id else rel["to"],
+                "stub": True,
+                "page": target,
+            }
+
+    for name, page in pages.items():
+        page["classes"].extend(stubs[name].values())
+
+    overview = {
+        "type": "overview",
+        "name": OVERVIEW_PAGE,
+        "classes": [
+            {
+                "id": name,
+                "name": f"{name} ({len(members)})",
+                "page": name,
+            }
+            for name, members in clusters.items()
+        ],
+        "relationships": [
+            {"type": "association", "from": a, "to": b, "label": str(count)}
+            for (a, b), count in sorted(cluster_edges.items())
+        ],
+    }
+    return pages, overview
+
+
+def _unique_page_names(clusters: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Rename clusters whose page stem collides with the overview or another cluster."""
+    taken = {page_stem(OVERVIEW_PAGE)}
+    result: Dict[str, List[str]] = {}
+    for name, members in clusters.items():
+        unique, suffix = name, 2
+        while page_stem(unique) in taken:
+            unique, suffix = f"{name}-{suffix}", suffix + 1
+        taken.add(page_stem(unique))
+        result[unique] = members
+    return result
@@ -0,0 +1,207 @@
+"""Static class analysis of Python source code, without importing it."""
+
+import ast
+import builtins
+from typing import Any, Dict, List, Optional, Tuple
+
+# Annotation names (last dotted component) that wrap their arguments.
+_ASSOCIATION_WRAPPERS = {"Optional", "Union", "Type", "type", "ClassVar"}
+_MAPPING_WRAPPERS = {
+    "Dict", "dict", "Mapping", "MutableMapping", "DefaultDict", "OrderedDict",
+}
+_COLLECTION_WRAPPERS = _MAPPING_WRAPPERS | {
+    "List", "list", "Set", "set", "FrozenSet", "frozenset", "Tuple", "tuple",
+    "Iterable", "Iterator", "Sequence", "MutableSequence", "Collection",
+    "AbstractSet", "MutableSet", "Deque", "deque",
+}
+_BUILTIN_NAMES = frozenset(dir(builtins))
+
+
+def module_name(path: str, root: str = "") -> Optional[str]:
+    """
+    Return the dotted module name of a ``.py`` file path.
+
+    Args:
+        path: POSIX path of the file, relative to the repository root.
+        root: Directory that module names are relative to, e.g. ``"src"``.
+
+    Returns:
+        The module name, or None if the file is not a Python module under
+        ``root``.
+    """
+    root = root.strip("/")
+    if root:
+        if not path.startswith(root + "/"):
+            return None
+        path = path[len(root) + 1:]
+    if not path.endswith(".py"):
+        return None
+    parts = path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    if not parts or not all(part.isidentifier() for part in parts):
+        return None
+    return ".".join(parts)
+
+
+def analyze_source(
+    source: bytes, module: str, is_package: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Describe the top-level classes of a module from its source code.
+
+    Produces the same class descriptions as ``ClassDiagramGenerator``'s
+    runtime analysis: bases and class-level annotations are resolved through
+    the module's imports to qualified names. Only annotations declared on the
+    class itself are considered, since bases may live in other files.
+
+    Args:
+        source: Module source code.
+        module: Dotted name of the module.
+        is_package: Whether the source is a package's ``__init__.py``, which
+            affects relative imports.
+
+    Returns:
+        Class descriptions; empty if the source does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    resolver = NameResolver(tree, module, is_package)
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        class_id = f"{module}.{node.name}"
+        base_ids = [
+            target for target in map(resolver.resolve_base, node.bases)
+            if target and target != "builtins.object"
+        ]
+        associations = []
+        for statement in node.body:
+            if (
+                isinstance(statement, ast.AnnAssign)
+                and isinstance(statement.target, ast.Name)
+            ):
+                for kind, target in resolver.targets(statement.annotation):
+                    associations.append({
+                        "type": kind,
+                        "to": target,
+                        "attribute": statement.target.id,
+                        "declared_by": class_id,
+                    })
+        classes.append({
+            "id": class_id,
+            "name": node.name,
+            "module": module,
+            "bases": [target.rsplit(".", 1)[-1] for target in base_ids],
+            "base_ids": base_ids,
+            "associations": associations,
+        })
+    return classes
+
+
+class NameResolver:
+    """Resolve names used in a module to qualified names through its imports."""
+
+    def __init__(self, tree: ast.Module, module: str, is_package: bool) -> None:
+        self.module = module
+        self.package = module if is_package else module.rpartition(".")[0]
+        self.names: Dict[str, str] = {
+            node.name: f"{module}.{node.name}"
+            for node in tree.body if isinstance(node, ast.ClassDef)
+        }
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.names[alias.asname] = alias.name
+                    else:
+                        head = alias.name.split(".")[0]
+                        self.names[head] = head
+            elif isinstance(node, ast.ImportFrom):
+                source = self._absolute(node.module, node.level)
+                if source is None:
+                    continue
+                for alias in node.names:
+                    if alias.name != "*":
+                        local = alias.asname or alias.name
+                        self.names[local] = f"{source}.{alias.name}"
+
+    def _absolute(self, name: Optional[str], level: int) -> Optional[str]:
+        """Turn a possibly relative ``from`` import into an absolute module name."""
+        if not level:
+            return name
+        parts = self.package.split(".") if self.package else []
+        if level - 1 > len(parts):
+            return None
+        base = parts[:len(parts) - (level - 1)]
+        if name:
+            base.append(name)
+        return ".".join(base) or None
+
+    def resolve(self, node: ast.expr) -> Optional[str]:
+        """Return the qualified name an expression refers to, if known."""
+        if isinstance(node, ast.Name):
+            if node.id in self.names:
+                return self.names[node.id]
+            return None if node.id in _BUILTIN_NAMES else f"{self.module}.{node.id}"
+        if isinstance(node, ast.Attribute):
+            owner = self.resolve(node.value)
+            return f"{owner}.{node.attr}" if owner else None
+        return None
+
+    def resolve_base(self, node: ast.expr) -> Optional[str]:
+        """Resolve a base class expression, qualifying builtins like ``Exception``."""
+        if (
+            isinstance(node, ast.Name)
+            and node.id not in self.names
+            and node.id in _BUILTIN_NAMES
+        ):
+            return f"builtins.{node.id}"
+        return self.resolve(node)
+
+    def targets(self, annotation: ast.expr) -> List[Tuple[str, str]]:
+        """Find the classes an annotation refers to, like ``TypeIndex`` does."""
+        targets: List[Tuple[str, str]] = []
+        self._collect(annotation, "composition", targets)
+        return list(dict.fromkeys(targets))
+
+    def _collect(
+        self, node: ast.expr, kind: str, targets: List[Tuple[str, str]]
+    ) -> None:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            try:
+                node = ast.parse(node.value, mode="eval").body
+            except SyntaxError:
+                return
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            inner = "aggregation" if kind == "aggregation" else "association"
+            self._collect(node.left, inner, targets)
+            self._collect(node.right, inner, targets)
+        elif isinstance(node, ast.Subscript):
+            wrapper = (self.resolve_base(node.value) or "").rsplit(".", 1)[-1]
+            args = node.slice
+            # Python < 3.9 wraps subscripts in ast.Index.
+            if isinstance(args, getattr(ast, "Index", ())):  # pragma: no cover
+                args = args.value  # type: ignore[attr-defined]
+            items = list(args.elts) if isinstance(args, ast.Tuple) else [args]
+            if wrapper in _ASSOCIATION_WRAPPERS:
+                unions = ("Optional", "Union")
+                inner = (
+                    "aggregation" if kind == "aggregation" and wrapper in unions
+                    else "association"
+                )
+                for item in items:
+                    self._collect(item, inner, targets)
+            elif wrapper in _COLLECTION_WRAPPERS:
+                for item in items[1:] if wrapper in _MAPPING_WRAPPERS else items:
+                    self._collect(item, "aggregation", targets)
+            elif wrapper == "Annotated" and items:
+                self._collect(items[0], kind, targets)
+        elif isinstance(node, (ast.Name, ast.Attribute)):
+            target = self.resolve(node)
+            if target and not target.startswith(("typing.", "builtins.")):
+                targets.append((kind, target))
@@ -0,0 +1,418 @@
+"""Project-wide symbol table for static call resolution."""
+
+import ast
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .source import NameResolver, module_name
+
+# A call site as recorded by the scan: ("name", qualified_name) for calls
+# through module-level names, or ("self"/"super", [attribute, ...]) for calls
+# through the method's first argument.
+CallRef = Tuple[str, Any]
+
+# Files per task handed to a scanning process.
+_CHUNK_SIZE = 32
+
+
+def _scan_file(path: str, module: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract the symbols and raw call sites of one source file.
+
+    Runs in worker processes, so it returns plain picklable data.
+    """
+    try:
+        with open(path, "rb") as handle:
+            tree = ast.parse(handle.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    resolver = NameResolver(tree, module, is_package=path.endswith("__init__.py"))
+    functions: Dict[str, List[CallRef]] = {}
+    classes: Dict[str, Dict[str, Any]] = {}
+    variables: Dict[str, str] = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            _record_type(variables, node.target.id, resolver.resolve(node.annotation))
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constructor = resolver.resolve(node.value.func)
+                    _record_type(variables, target.id, constructor)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions[node.name] = _scan_calls(node, resolver, None)
+        elif isinstance(node, ast.ClassDef):
+            attributes: Dict[str, str] = {}
+            methods = []
+            for item in node.body:
+                if (
+                    isinstance(item, ast.AnnAssign)
+                    and isinstance(item.target, ast.Name)
+                ):
+                    annotation = resolver.resolve(item.annotation)
+                    _record_type(attributes, item.target.id, annotation)
+                elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods.append(item.name)
+                    functions[f"{node.name}.{item.name}"] = _scan_calls(
+                        item, resolver, attributes
+                    )
+            classes[node.name] = {
+                "bases": [base for base in map(resolver.resolve, node.bases) if base],
+                "methods": methods,
+                "attributes": attributes,
+            }
+
+    return {
+        "module": module,
+        "imports": dict(resolver.names),
+        "variables": variables,
+        "functions": functions,
+        "classes": classes,
+    }
+
+
+def _record_type(types: Dict[str, str], name: str, qualified: Optional[str]) -> None:
+    """Remember the first known type of a variable or attribute."""
+    if qualified and name not in types:
+        types[name] = qualified
+
+
+def _scan_calls(
+    function: ast.AST, resolver: NameResolver, attributes: Optional[Dict[str, str]]
+) -> List[CallRef]:
+    """
+    Record the call sites of a function.
+
+    Local variables annotated or assigned from a constructor call are
+    typed, so ``repo = Repository(); repo.save()`` resolves. For methods,
+    ``self.x: T`` and ``self.x = T(...)`` assignments type the instance
+    attributes of the class.
+    """
+    args = function.args  # type: ignore[attr-defined]
+    positional = getattr(args, "posonlyargs", []) + args.args
+    receiver = positional[0].arg if attributes is not None and positional else None
+    local_types: Dict[str, str] = {}
+    for arg in positional + args.kwonlyargs:
+        if arg.annotation is not None:
+            _record_type(local_types, arg.arg, resolver.resolve(arg.annotation))
+
+    calls: List[CallRef] = []
+    for node in ast.walk(function):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if isinstance(node, ast.AnnAssign):
+                value_type = resolver.resolve(node.annotation)
+            elif isinstance(node.value, ast.Call):
+                value_type = resolver.resolve(node.value.func)
+            else:
+                value_type = None
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    _record_type(local_types, target.id, value_type)
+                elif (
+                    attributes is not None
+                    and isinstance(target, ast.Attribute)
+                    and isinstance(target.value, ast.Name)
+                    and target.value.id == receiver
+                ):
+                    _record_type(attributes, target.attr, value_type)
+        elif isinstance(node, ast.Call):
+            call = _call_ref(node.func, resolver, receiver, local_types)
+            if call is not None:
+                calls.append(call)
+    return calls
+
+
+def _call_ref(
+    func: ast.expr,
+    resolver: NameResolver,
+    receiver: Optional[str],
+    local_types: Dict[str, str],
+) -> Optional[CallRef]:
+    """Describe the callee expression of a call, or None if it is not resolvable."""
+    chain: List[str] = []
+    while isinstance(func, ast.Attribute):
+        chain.append(func.attr)
+        func = func.value
+    chain.reverse()
+
+    if isinstance(func, ast.Call) and isinstance(func.func, ast.Name):
+        if func.func.id == "super" and chain:
+            return ("super", chain)
+        return None
+    if not isinstance(func, ast.Name):
+        return None
+    if func.id == receiver:
+        return ("self", chain) if chain else None
+    if func.id in local_types:
+        root: Optional[str] = local_types[func.id]
+    else:
+        root = resolver.resolve(func)
+    if root is None:
+        return None
+    return ("name", ".".join([root] + chain))
+
+
+class SymbolTable:
+    """
+    Index of the functions, classes and imports of a project.
+
+    The project is scanned once, in parallel, into plain per-module data;
+    calls are then resolved on demand and cached, so a call graph rooted at
+    any function only touches the functions it reaches.
+
+    Example:
+        >>> table = SymbolTable.build("src")
+        >>> nodes, edges = table.call_graph("app.cli.main", max_depth=3)
+    """
+
+    def __init__(self, modules: Iterable[Dict[str, Any]] = ()) -> None:
+        """
+        Initialize the table from scanned module data.
+
+        Args:
+            modules: Module data as produced by the scan.
+        """
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.functions: Dict[str, Dict[str, Any]] = {}
+        self.classes: Dict[str, Dict[str, Any]] = {}
+        self._callees: Dict[str, List[str]] = {}
+        for module in modules:
+            self.add_module(module)
+
+    @classmethod
+    def build(
+        cls,
+        root: Union[str, Path],
+        workers: Optional[int] = None,
+        exclude: Sequence[str] = ("tests", "build", "dist"),
+    ) -> "SymbolTable":
+        """
+        Scan every Python module below a directory.
+
+        Args:
+            root: Directory containing the project's top-level packages or
+                modules; module names are relative to it.
+            workers: Number of scanning processes. ``0`` scans in-process.
+                Defaults to the number of CPUs.
+            exclude: Directory names that are skipped.
+
+        Returns:
+            The populated symbol table.
+        """
+        root = Path(root)
+        files = []
+        for directory, subdirectories, filenames in os.walk(root):
+            subdirectories[:] = sorted(
+                name for name in subdirectories
+                if name not in exclude and not name.startswith(".")
+            )
+            for filename in sorted(filenames):
+                path = Path(directory, filename)
+                module = module_name(path.relative_to(root).as_posix())
+                if module is not None:
+                    files.append((str(path), module))
+
+        if workers == 0 or len(files) <= _CHUNK_SIZE:
+            scanned: Iterable[Optional[Dict[str, Any]]] = (
+                _scan_file(path, module) for path, module in files
+            )
+            return cls(data for data in scanned if data is not None)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            scanned = pool.map(
+                _scan_file,
+                [path for path, _ in files],
+                [module for _, module in files],
+                chunksize=_CHUNK_SIZE,
+            )
+            return cls(data for data in scanned if data is not None)
+
+    def add_module(self, data: Dict[str, Any]) -> None:
+        """Add the scanned data of one module and invalidate resolved calls."""
+        module = data["module"]
+        self.modules[module] = data
+        for name, calls in data["functions"].items():
+            owner = name.rpartition(".")[0]
+            self.functions[f"{module}.{name}"] = {
+                "module": module,
+                "class": f"{module}.{owner}" if owner else None,
+                "calls": calls,
+            }
+        for name, info in data["classes"].items():
+            self.classes[f"{module}.{name}"] = info
+        self._callees.clear()
+
+    def __contains__(self, function: str) -> bool:
+        return function in self.functions
+
+    def callees(self, function: str) -> List[str]:
+        """
+        Return the project functions called by ``function``, resolved and cached.
+
+        Args:
+            function: Qualified function id such as ``"app.models.User.save"``.
+        """
+        cached = self._callees.get(function)
+        if cached is not None:
+            return cached
+
+        info = self.functions[function]
+        owner = info["class"]
+        resolved: List[str] = []
+        for kind, ref in info["calls"]:
+            if kind == "name":
+                target = self.canonical(ref)
+            elif owner is None:
+                target = None
+            elif kind == "self":
+                target = self._resolve_chain(owner, ref, skip_self=False)
+            else:
+                target = self._resolve_chain(owner, ref, skip_self=True)
+            if target is not None:
+                resolved.append(target)
+
+        result = list(dict.fromkeys(resolved))
+        self._callees[function] = result
+        return result
+
+    def call_graph(
+        self, root: str, max_depth: Optional[int] = None
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, str]]]:
+        """
+        Collect the functions reachable from ``root`` breadth-first.
+
+        Args:
+            root: Qualified id of the root function.
+            max_depth: Maximum call depth to follow.
+
+        Returns:
+            ``(nodes, edges)``: ``(function, depth)`` pairs in discovery
+            order and ``(caller, callee)`` pairs.
+
+        Raises:
+            ValueError: If ``root`` is not in the table.
+        """
+        if root not in self.functions:
+            raise ValueError(f"Unknown function: {root}")
+
+        depths = {root: 0}
+        edges: List[Tuple[str, str]] = []
+        queue = deque([root])
+        while queue:
+            caller = queue.popleft()
+            depth = depths[caller]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for callee in self.callees(caller):
+                edges.append((caller, callee))
+                if callee not in depths:
+                    depths[callee] = depth + 1
+                    queue.append(callee)
+        return list(depths.items()), edges
+
+    def canonical(self, name: str, _hops: int = 0) -> Optional[str]:
+        """
+        Resolve a qualified name to a project function.
+
+        Follows re-exports through package imports and methods of typed
+        module-level instances; a class resolves to its ``__init__``.
+        """
+        if name in self.functions:
+            return name
+        if name in self.classes:
+            return self._lookup(name, "__init__")
+
+        owner, _, attribute = name.rpartition(".")
+        if owner in self.classes:
+            return self._lookup(owner, attribute)
+
+        if _hops > 8:
+            return None
+        parts = name.split(".")
+        for split in range(len(parts) - 1, 0, -1):
+            module = self.modules.get(".".join(parts[:split]))
+            if module is None:
+                continue
+            head, rest = parts[split], parts[split + 1:]
+            imported = module["imports"].get(head)
+            if imported is not None:
+                return self.canonical(".".join([imported] + rest), _hops + 1)
+            instance_type = module["variables"].get(head)
+            instance_class = (
+                self._canonical_class(instance_type) if instance_type else None
+            )
+            if instance_class is None or not rest:
+                return None
+            return self._resolve_chain(instance_class, rest, skip_self=False)
+        return None
+
+    def _resolve_chain(
+        self, owner: str, chain: List[str], skip_self: bool
+    ) -> Optional[str]:
+        """Resolve ``self.a.b.method`` by following typed attributes from ``owner``."""
+        current = owner
+        for attribute in chain[:-1]:
+            attribute_type = self._attribute_type(current, attribute)
+            resolved = self._canonical_class(attribute_type) if attribute_type else None
+            if resolved is None:
+                return None
+            current, skip_self = resolved, False
+        return self._lookup(current, chain[-1], skip_self)
+
+    def _canonical_class(self, name: str, _hops: int = 0) -> Optional[str]:
+        """Resolve a qualified name, possibly a re-export, to a project class."""
+        if name in self.classes:
+            return name
+        parts = name.split(".")
+        for split in range(len(parts) - 1, 0, -1):
+            module = self.modules.get(".".join(parts[:split]))
+            if module is not None:
+                imported = module["imports"].get(parts[split])
+                if imported is None or _hops > 8:
+                    return None
+                return self._canonical_class(
+                    ".".join([imported] + parts[split + 1:]), _hops + 1
+                )
+        return None
+
+    def _attribute_type(self, class_id: str, attribute: str) -> Optional[str]:
+        for klass in self._mro(class_id):
+            found: Optional[str] = self.classes[klass]["attributes"].get(attribute)
+            if found is not None:
+                return found
+        return None
+
+    def _lookup(
+        self, class_id: str, method: str, skip_self: bool = False
+    ) -> Optional[str]:
+        """Find the class in ``class_id``'s MRO that defines ``method``."""
+        mro = self._mro(class_id)
+        for klass in mro[1:] if skip_self else mro:
+            if method in self.classes[klass]["methods"]:
+                return f"{klass}.{method}"
+        return None
+
+    def _mro(self, class_id: str) -> List[str]:
+        """Approximate the MRO of a project class by a depth-first walk of its bases."""
+        order: List[str] = []
+        seen: Set[str] = set()
+        stack = [class_id]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            order.append(current)
+            bases = [
+                base
+                for base in map(self._canonical_class, self.classes[current]["bases"])
+                if base is not None
+            ]
+            stack.extend(reversed(bases))
+        return order
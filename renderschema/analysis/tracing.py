@@ -0,0 +1,486 @@
+"""Low-overhead runtime call tracing for sequence diagrams."""
+
+import dis
+import fnmatch
+import inspect
+import sys
+import threading
+from collections import deque
+from types import CodeType, FrameType, TracebackType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+#: A recorded call: ``(thread id, depth, caller, callee, method)``. The
+#: caller is None for calls entering the traced code from outside.
+CallEvent = Tuple[int, int, Optional[str], str, str]
+
+# Code objects that never produce a message: comprehensions, lambdas and
+# module bodies.
+_ANONYMOUS = (
+    "<module>", "<lambda>", "<listcomp>", "<dictcomp>", "<setcomp>", "<genexpr>"
+)
+
+# Code whose frames are suspended and resumed; a resume is not a new call.
+_SUSPENDABLE = (
+    inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+)
+
+_UNKNOWN = object()
+# Marks code whose filter decision is being made; calls made by the filter
+# itself may re-enter the hook.
+_PENDING = object()
+
+
+class CallTracer:
+    """
+    Record which objects call each other while code runs.
+
+    Uses ``sys.monitoring`` on Python 3.12+, where code that is filtered out
+    is disabled after its first call and costs nothing afterwards, and
+    ``sys.setprofile``/``threading.setprofile`` on older versions. Filter
+    decisions are cached per code object, only every ``1 / sample_rate``-th
+    top-level call is recorded (with everything it calls), and events go to
+    a ring buffer holding the most recent ``buffer_size`` calls, so a tracer
+    can stay enabled in a long-running service. A generator or coroutine is
+    recorded when it first runs; resuming it after a ``yield`` or ``await``
+    is not a new call.
+
+    Example:
+        >>> tracer = CallTracer(include=["shop"], sample_rate=0.1)
+        >>> with tracer:
+        ...     handle_requests()
+        >>> SequenceDiagramGenerator(tracer).export("checkout.svg")
+    """
+
+    def __init__(
+        self,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        classes: Optional[Sequence[str]] = None,
+        sample_rate: float = 1.0,
+        buffer_size: int = 10000,
+        backend: Optional[str] = None,
+    ) -> None:
+        """
+        Configure a tracer.
+
+        Args:
+            include: Module names or glob patterns to trace; a name also
+                matches its submodules. Defaults to all modules.
+            exclude: Module names or glob patterns never to trace.
+            classes: Class name patterns (short or qualified); when given,
+                only methods of matching classes are traced.
+            sample_rate: Fraction of top-level calls to record.
+            buffer_size: Number of most recent calls kept.
+            backend: ``"monitoring"`` or ``"profile"``; defaults to
+                ``"monitoring"`` where available.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be positive, got {buffer_size}")
+        if backend is None:
+            backend = "monitoring" if hasattr(sys, "monitoring") else "profile"
+        if backend not in ("monitoring", "profile"):
+            raise ValueError(
+                f"Unknown tracing backend: {backend}. Available: monitoring, profile"
+            )
+        if backend == "monitoring" and not hasattr(sys, "monitoring"):
+            raise ValueError("The monitoring backend requires Python 3.12+")
+
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.classes = list(classes or [])
+        self.sample_rate = sample_rate
+        self.backend = backend
+        self.events: Deque[CallEvent] = deque(maxlen=buffer_size)
+        self._sample_every = max(1, round(1 / sample_rate))
+        self._roots = 0
+        self._stacks: Dict[int, List[Optional[str]]] = {}
+        self._codes: Dict[CodeType, Any] = {}
+        self._starts: Dict[CodeType, int] = {}
+        self._tool_id: Optional[int] = None
+        self.running = False
+
+    def start(self) -> None:
+        """Start recording calls."""
+        if self.running:
+            return
+        self._stacks = {}
+        if self.backend == "monitoring":
+            self._start_monitoring()
+        else:
+            hook = self._profile_hook()
+            threading.setprofile(hook)
+            sys.setprofile(hook)
+        self.running = True
+
+    def stop(self) -> None:
+        """Stop recording calls; recorded events are kept."""
+        if not self.running:
+            return
+        if self.backend == "monitoring":
+            self._stop_monitoring()
+        else:
+            sys.setprofile(None)
+            threading.setprofile(None)
+        self.running = False
+
+    def clear(self) -> None:
+        """Discard recorded events."""
+        self.events.clear()
+
+    def __enter__(self) -> "CallTracer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    # -- recording -----------------------------------------------------------
+
+    def _enter(
+        self, code: CodeType, frame: Optional[FrameType], resumed: bool = False
+    ) -> bool:
+        """
+        Record a call of ``code``; return whether the code is traced.
+
+        A ``resumed`` generator or coroutine is put back on the call stack,
+        so the calls it makes have it as their caller, but is not recorded.
+        """
+        info = self._codes.get(code, _UNKNOWN)
+        if info is _UNKNOWN:
+            self._codes[code] = _PENDING
+            info = self._codes[code] = self._describe(code, frame)
+        if info is None:
+            return False
+        if info is _PENDING:
+            return True
+        ident = threading.get_ident()
+        stack = self._stacks.get(ident)
+        if stack is None:
+            stack = self._stacks[ident] = []
+        if not stack:
+            if resumed:
+                # Resumed outside any recorded call: not a sampled root.
+                stack.append(None)
+                return True
+            self._roots += 1
+            if self._roots % self._sample_every:
+                stack.append(None)
+                return True
+            caller = None
+        else:
+            caller = stack[-1]
+            if caller is None:
+                stack.append(None)
+                return True
+        participant, method = info
+        if not resumed:
+            self.events.append((ident, len(stack), caller, participant, method))
+        stack.append(participant)
+        return True
+
+    def _leave(self, code: CodeType) -> bool:
+        """Record the end of a call of ``code``; return whether it is traced."""
+        info = self._codes.get(code)
+        if info is None:
+            return False
+        if info is _PENDING:
+            return True
+        stack = self._stacks.get(threading.get_ident())
+        if stack:
+            stack.pop()
+        return True
+
+    def _resumed(self, frame: FrameType) -> bool:
+        """Return whether a generator or coroutine frame continues after a yield."""
+        code = frame.f_code
+        start = self._starts.get(code)
+        if start is None:
+            start = self._starts[code] = _start_offset(code)
+        return frame.f_lasti > start
+
+    def _profile_hook(self) -> Callable[[FrameType, str, Any], None]:
+        """Build the ``sys.setprofile`` hook."""
+        codes = self._codes
+        enter = self._enter
+        leave = self._leave
+        resumed = self._resumed
+
+        def hook(frame: FrameType, event: str, arg: Any) -> None:
+            # Runs for every call, including builtins: reject untraced code
+            # with a single dictionary lookup.
+            if event == "call":
+                code = frame.f_code
+                if codes.get(code, _UNKNOWN) is not None:
+                    # Every resume of a generator is reported as a call too.
+                    enter(
+                        code,
+                        frame,
+                        bool(code.co_flags & _SUSPENDABLE) and resumed(frame),
+                    )
+            elif event == "return":
+                code = frame.f_code
+                if codes.get(code) is not None:
+                    leave(code)
+
+        return hook
+
+    def _start_monitoring(self) -> None:
+        """Register the ``sys.monitoring`` callbacks."""
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        for tool_id in (monitoring.PROFILER_ID, 3, 4, 5):
+            try:
+                monitoring.use_tool_id(tool_id, "renderschema")
+            except ValueError:
+                continue
+            break
+        else:
+            raise RuntimeError("No free sys.monitoring tool id for tracing")
+        self._tool_id = tool_id
+        events = monitoring.events
+        disable = monitoring.DISABLE
+
+        def on_start(code: CodeType, offset: int) -> Any:
+            frame = sys._getframe(1) if code not in self._codes else None
+            return None if self._enter(code, frame) else disable
+
+        def on_resume(code: CodeType, offset: int, *args: Any) -> Any:
+            frame = sys._getframe(1) if code not in self._codes else None
+            return None if self._enter(code, frame, resumed=True) else disable
+
+        def on_return(code: CodeType, offset: int, value: Any) -> Any:
+            return None if self._leave(code) else disable
+
+        def on_unwind(code: CodeType, offset: int, exception: BaseException) -> None:
+            self._leave(code)
+
+        monitoring.register_callback(tool_id, events.PY_START, on_start)
+        monitoring.register_callback(tool_id, events.PY_RESUME, on_resume)
+        monitoring.register_callback(tool_id, events.PY_THROW, on_resume)
+        monitoring.register_callback(tool_id, events.PY_RETURN, on_return)
+        monitoring.register_callback(tool_id, events.PY_YIELD, on_return)
+        monitoring.register_callback(tool_id, events.PY_UNWIND, on_unwind)
+        # Locations disabled by an earlier tracer may be wanted by this one.
+        monitoring.restart_events()
+        monitoring.set_events(
+            tool_id,
+            events.PY_START | events.PY_RESUME | events.PY_THROW
+            | events.PY_RETURN | events.PY_YIELD | events.PY_UNWIND,
+        )
+
+    def _stop_monitoring(self) -> None:
+        """Unregister the ``sys.monitoring`` callbacks."""
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        tool_id = self._tool_id
+        monitoring.set_events(tool_id, 0)
+        events = monitoring.events
+        for event in (
+            events.PY_START, events.PY_RESUME, events.PY_THROW,
+            events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND,
+        ):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.free_tool_id(tool_id)
+        self._tool_id = None
+
+    # -- filtering -----------------------------------------------------------
+
+    def _describe(
+        self, code: CodeType, frame: Optional[FrameType]
+    ) -> Optional[Tuple[str, str]]:
+        """Return ``(participant, method)`` for traced code, else None."""
+        if code.co_name in _ANONYMOUS or frame is None:
+            return None
+        module = frame.f_globals.get("__name__") or ""
+        if module == __name__ or not self._module_traced(module):
+            return None
+
+        owner = self._owner(code, frame)
+        if owner is None:
+            if self.classes:
+                return None
+            return module, code.co_name
+        if self.classes and not any(
+            fnmatch.fnmatchcase(owner, pattern)
+            or fnmatch.fnmatchcase(f"{module}.{owner}", pattern)
+            for pattern in self.classes
+        ):
+            return None
+        return f"{module}.{owner}", code.co_name
+
+    def _module_traced(self, module: str) -> bool:
+        """Apply the include and exclude patterns to a module name."""
+        if self.include and not _matches(module, self.include):
+            return False
+        return not _matches(module, self.exclude)
+
+    @staticmethod
+    def _owner(code: CodeType, frame: FrameType) -> Optional[str]:
+        """Return the qualified name of the class defining ``code``, if any."""
+        qualname: Optional[str] = getattr(code, "co_qualname", None)
+        if qualname is not None:
+            owner = qualname.rpartition(".")[0]
+            if owner and "<locals>" not in owner.rsplit(".", 1)[-1]:
+                return owner
+            return None
+
+        # Before Python 3.11: find the defining class through the first argument.
+        if not code.co_argcount:
+            return None
+        first = frame.f_locals.get(code.co_varnames[0])
+        for cls in (first if isinstance(first, type) else type(first)).__mro__:
+            function = cls.__dict__.get(code.co_name)
+            function = getattr(function, "__func__", function)
+            if getattr(function, "__code__", None) is code:
+                return cls.__qualname__
+        return None
+
+
+def _start_offset(code: CodeType) -> int:
+    """Return the ``f_lasti`` of a frame of ``code`` that has not yet run."""
+    if sys.version_info < (3, 11):
+        return -1
+    # Generator bodies start at their first RESUME instruction.
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == "RESUME":
+            return instruction.offset
+    return 0
+
+
+def _matches(module: str, patterns: Iterable[str]) -> bool:
+    """Return whether a module matches a name (or its submodules) or glob."""
+    return any(
+        module == pattern
+        or module.startswith(pattern + ".")
+        or fnmatch.fnmatchcase(module, pattern)
+        for pattern in patterns
+    )
+
+
+def build_sequence(
+    events: Iterable[CallEvent], name: str = "trace", max_period: int = 4
+) -> Dict[str, Any]:
+    """
+    Turn recorded calls into sequence diagram data.
+
+    Calls are nested by depth per thread. Consecutive repetitions of the
+    same call, or of the same run of up to ``max_period`` calls (with
+    identical nested calls), are collapsed into a single ``loop`` fragment.
+
+    Args:
+        events: Calls recorded by ``CallTracer``.
+        name: Diagram name.
+        max_period: Longest run of calls detected as a repeated pattern.
+
+    Returns:
+        Dictionary with the participants in order of first appearance and
+        the collapsed messages of each thread.
+    """
+    roots: Dict[int, List[Dict[str, Any]]] = {}
+    stacks: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    count = 0
+    for ident, depth, caller, callee, method in events:
+        count += 1
+        stack = stacks.setdefault(ident, [])
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        message: Dict[str, Any] = {
+            "type": "call",
+            "from": caller,
+            "to": callee,
+            "method": method,
+            "messages": [],
+        }
+        if stack:
+            stack[-1][1]["messages"].append(message)
+        else:
+            roots.setdefault(ident, []).append(message)
+        stack.append((depth, message))
+
+    participants: Dict[str, None] = {}
+    threads = []
+    for ident, messages in roots.items():
+        collapsed, _ = _collapse(messages, max_period)
+        _collect_participants(collapsed, participants)
+        threads.append({"thread": ident, "messages": collapsed})
+
+    return {
+        "type": "sequence",
+        "name": name,
+        "participants": list(participants),
+        "threads": threads,
+        "calls": count,
+    }
+
+
+def _collapse(
+    messages: List[Dict[str, Any]], max_period: int
+) -> Tuple[List[Dict[str, Any]], List[Tuple[Any, ...]]]:
+    """Collapse repeated runs of sibling messages into loop fragments."""
+    keys = []
+    for message in messages:
+        message["messages"], child_keys = _collapse(message["messages"], max_period)
+        keys.append((
+            "call", message["from"], message["to"], message["method"], tuple(child_keys)
+        ))
+
+    result: List[Dict[str, Any]] = []
+    result_keys: List[Tuple[Any, ...]] = []
+    total = len(messages)
+    index = 0
+    while index < total:
+        best_period, best_repeats = 1, 1
+        for period in range(1, max_period + 1):
+            pattern = keys[index:index + period]
+            if len(pattern) < period:
+                break
+            repeats = 1
+            while (
+                keys[index + repeats * period:index + (repeats + 1) * period] == pattern
+            ):
+                repeats += 1
+            if repeats > 1 and repeats * period > best_repeats * best_period:
+                best_period, best_repeats = period, repeats
+        if best_repeats > 1:
+            body = messages[index:index + best_period]
+            result.append({"type": "loop", "count": best_repeats, "messages": body})
+            result_keys.append(
+                ("loop", best_repeats, tuple(keys[index:index + best_period]))
+            )
+            index += best_repeats * best_period
+        else:
+            result.append(messages[index])
+            result_keys.append(keys[index])
+            index += 1
+    return result, result_keys
+
+
+def _collect_participants(
+    messages: List[Dict[str, Any]], participants: Dict[str, None]
+) -> None:
+    """Add the participants of ``messages`` in order of first appearance."""
+    for message in messages:
+        if message["type"] == "call":
+            for participant in (message["from"], message["to"]):
+                if participant is not None:
+                    participants.setdefault(participant, None)
+        _collect_participants(message["messages"], participants)
@@ -0,0 +1,261 @@
+"""Type hint resolution backed by a qualified-name index of classes."""
+
+import collections.abc
+import sys
+import typing
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+# Origins of union hints; on Python 3.10+ ``X | Y`` produces types.UnionType.
+_UNION_ORIGINS: Tuple[Any, ...] = (Union,)
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    _UNION_ORIGINS += (UnionType,)
+
+
+# Containers whose element types are aggregated rather than composed.
+_COLLECTION_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    tuple,
+    dict,
+    collections.abc.Iterable,
+    collections.abc.Mapping,
+)
+
+
+def qualified_name(cls: Type) -> str:
+    """Return the ``module.QualName`` identifier of a class."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def extract_relationships(classes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Extract inheritance and association relationships between class descriptions.
+
+    Classes are matched by qualified name, so equally named classes from
+    different modules never produce edges to one another. An association
+    inherited from a base that is itself in the diagram is only drawn from
+    that base.
+    """
+    relationships = []
+    class_ids = {cls["id"] for cls in classes}
+
+    for cls in classes:
+        for base in cls["base_ids"]:
+            if base in class_ids:
+                relationships.append({
+                    "type": "inheritance",
+                    "from": cls["id"],
+                    "to": base,
+                })
+
+        for assoc in cls.get("associations", []):
+            if assoc["to"] not in class_ids:
+                continue
+            if assoc["declared_by"] != cls["id"] and assoc["declared_by"] in class_ids:
+                continue
+            relationships.append({
+                "type": assoc["type"],
+                "from": cls["id"],
+                "to": assoc["to"],
+                "label": assoc["attribute"],
+            })
+
+    return relationships
+
+
+class TypeIndex:
+    """
+    Index of classes keyed by qualified name, used to turn type hints into
+    relationship targets.
+
+    Classes are looked up by identity under their qualified name, so two
+    classes that share a short name in different modules never resolve to
+    each other. Resolved hints are cached per class, which keeps repeated
+    resolution O(1) per hint.
+    """
+
+    def __init__(self, classes: Iterable[Type] = ()) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            classes: Classes to index up front.
+        """
+        self._classes: Dict[str, Type] = {}
+        self._hints: weakref.WeakKeyDictionary[
+            Type, Dict[str, Tuple[Any, Type]]
+        ] = weakref.WeakKeyDictionary()
+        for cls in classes:
+            self.add(cls)
+
+    def add(self, cls: Type) -> str:
+        """
+        Add a class to the index.
+
+        Args:
+            cls: Class to index.
+
+        Returns:
+            The qualified name the class is indexed under.
+        """
+        name = qualified_name(cls)
+        self._classes[name] = cls
+        return name
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def get(self, name: str) -> Optional[Type]:
+        """Return the indexed class with the given qualified name, if any."""
+        return self._classes.get(name)
+
+    def resolve_hints(self, cls: Type) -> Dict[str, Tuple[Any, Type]]:
+        """
+        Resolve the type hints of a class and all of its bases.
+
+        Forward references are evaluated in the namespace of the module that
+        declared them. Hints that cannot be evaluated are kept as strings.
+
+        Args:
+            cls: Class whose hints should be resolved.
+
+        Returns:
+            Mapping of attribute name to ``(hint, declaring_class)``. Names
+            declared in several classes resolve to the most derived one.
+        """
+        try:
+            return self._hints[cls]
+        except (KeyError, TypeError):
+            pass
+
+        resolved: Dict[str, Tuple[Any, Type]] = {}
+        for klass in reversed(cls.__mro__):
+            if klass is object:
+                continue
+            annotations = klass.__dict__.get("__annotations__", {})
+            if not isinstance(annotations, dict) or not annotations:
+                continue
+            module_globals = self._module_namespace(klass)
+            local_ns = {klass.__name__: klass}
+            for name, hint in annotations.items():
+                resolved[name] = (
+                    self._evaluate(hint, module_globals, local_ns),
+                    klass,
+                )
+
+        try:
+            self._hints[cls] = resolved
+        except TypeError:
+            pass  # Class does not support weak references; skip caching
+        return resolved
+
+    def forget(self, cls: Type) -> None:
+        """Drop the cached hints of ``cls``."""
+        try:
+            self._hints.pop(cls, None)
+        except TypeError:
+            pass
+
+    def relationship_targets(
+        self, hint: Any, context: Type
+    ) -> List[Tuple[str, str]]:
+        """
+        Find the classes a type hint refers to.
+
+        A bare class reference is a composition, a class inside a container
+        (``List[X]``, ``Dict[str, X]``, ...) is an aggregation, and a class in
+        an ``Optional``/``Union`` or ``Type[...]`` is an association.
+
+        Args:
+            hint: Resolved type hint.
+            context: Class that declared the hint, used to resolve any
+                remaining string forward references.
+
+        Returns:
+            List of ``(relationship_type, qualified_name)`` pairs.
+        """
+        targets: List[Tuple[str, str]] = []
+        self._collect_targets(hint, "composition", context, targets)
+        return list(dict.fromkeys(targets))
+
+    def _collect_targets(
+        self,
+        hint: Any,
+        kind: str,
+        context: Type,
+        targets: List[Tuple[str, str]],
+    ) -> None:
+        """Recursively decompose a hint, appending targets in place."""
+        if isinstance(hint, (str, typing.ForwardRef)):
+            hint = self._resolve_forward_ref(hint, context)
+            if hint is None:
+                return
+
+        if isinstance(hint, type):
+            # Classes outside the index are kept too: the diagram decides which
+            # targets it contains, which lets results merge across modules.
+            if hint.__module__ not in ("builtins", "typing"):
+                targets.append((kind, qualified_name(hint)))
+            return
+
+        origin = typing.get_origin(hint)
+        args = typing.get_args(hint)
+        if origin is None or not args:
+            return
+
+        if origin in _UNION_ORIGINS:
+            inner_kind = "aggregation" if kind == "aggregation" else "association"
+            for arg in args:
+                if arg is not type(None):
+                    self._collect_targets(arg, inner_kind, context, targets)
+        elif origin is type or origin is typing.ClassVar:
+            for arg in args:
+                self._collect_targets(arg, "association", context, targets)
+        elif isinstance(origin, type) and issubclass(origin, _COLLECTION_ORIGINS):
+            if issubclass(origin, (dict, collections.abc.Mapping)):
+                args = args[1:]
+            for arg in args:
+                if arg is not Ellipsis:
+                    self._collect_targets(arg, "aggregation", context, targets)
+        elif origin is getattr(typing, "Annotated", None):
+            self._collect_targets(args[0], kind, context, targets)
+
+    def _resolve_forward_ref(
+        self, ref: Union[str, "typing.ForwardRef"], context: Type
+    ) -> Optional[Any]:
+        """Resolve a string reference relative to the declaring class's module."""
+        text = ref.__forward_arg__ if isinstance(ref, typing.ForwardRef) else ref
+        indexed = self._classes.get(f"{context.__module__}.{text}")
+        if indexed is not None:
+            return indexed
+        evaluated = self._evaluate(
+            text, self._module_namespace(context), {context.__name__: context}
+        )
+        return None if isinstance(evaluated, str) else evaluated
+
+    @staticmethod
+    def _module_namespace(cls: Type) -> Dict[str, Any]:
+        """Return the global namespace of the module that defines ``cls``."""
+        module = sys.modules.get(cls.__module__)
+        return vars(module) if module is not None else {}
+
+    @staticmethod
+    def _evaluate(
+        hint: Any, module_globals: Dict[str, Any], local_ns: Dict[str, Any]
+    ) -> Any:
+        """Evaluate a single annotation, returning it unchanged on failure."""
+        if isinstance(hint, typing.ForwardRef):
+            hint = hint.__forward_arg__
+        if not isinstance(hint, str):
+            return hint
+        try:
+            return eval(hint, module_globals, local_ns)  # noqa: S307
+        except Exception:
+            return hint
@@ -4,7 +4,7 @@ from typing import Any, Type, Union
 from pathlib import Path
 
 from .generators.base import BaseDiagramGenerator
-from .generators.uml import UMLDiagramGenerator
+from .registry import generators
 
 
 def diagram(
@@ -17,7 +17,9 @@ def diagram(
 
     Args:
         target: The Python class, object, module path, or project path to diagram.
-        diagram_type: Type of diagram to generate. Options: 'uml', 'flowchart', 'class'.
+        diagram_type: Type of diagram to generate. Built-in options: 'uml',
+            'flowchart', 'class', 'callgraph', 'sequence', 'importtime',
+            'profile', 'objects'; plugins can register more.
         **options: Additional configuration options for the diagram generator.
 
     Returns:
@@ -28,20 +30,11 @@ def diagram(
         >>> generator = diagram(MyClass)
         >>> generator.export("output.svg")
     """
-    from .generators.flowchart import FlowchartGenerator
-    from .generators.class_diagram import ClassDiagramGenerator
-
-    generators = {
-        "uml": UMLDiagramGenerator,
-        "flowchart": FlowchartGenerator,
-        "class": ClassDiagramGenerator,
-    }
-
-    generator_class = generators.get(diagram_type.lower())
+    generator_class = generators.get(diagram_type)
     if not generator_class:
         raise ValueError(
             f"Unknown diagram type: {diagram_type}. "
-            f"Available types: {', '.join(generators.keys())}"
+            f"Available types: {', '.join(generators.names())}"
         )
 
     return generator_class(target, **options)
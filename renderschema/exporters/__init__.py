@@ -1,17 +1,38 @@
 """Export modules for different output formats."""
 
-from .svg import SVGExporter
-from .png import PNGExporter
-from .pdf import PDFExporter
+from typing import TYPE_CHECKING, Any
+
+from ..registry import exporters, lazy_attributes
 from .html import HTMLExporter
+from .pdf import PDFExporter
+from .png import PNGExporter
+from .svg import SVGExporter
+
+if TYPE_CHECKING:
+    from .manifest import OutputManifest
+    from .svgz import SVGZExporter
+    from .text import DOTExporter, MermaidExporter, PlantUMLExporter, TextExporter
+    from .tiles import TileExporter, XYZTileExporter
+
+__getattr__ = lazy_attributes(__name__, {
+    "SVGZExporter": ".svgz:SVGZExporter",
+    "TileExporter": ".tiles:TileExporter",
+    "XYZTileExporter": ".tiles:XYZTileExporter",
+    "TextExporter": ".text:TextExporter",
+    "MermaidExporter": ".text:MermaidExporter",
+    "DOTExporter": ".text:DOTExporter",
+    "PlantUMLExporter": ".text:PlantUMLExporter",
+    "OutputManifest": ".manifest:OutputManifest",
+})
 
 
-def get_exporter(format: str):
+def get_exporter(format: str) -> Any:
     """
     Get the appropriate exporter for the specified format.
 
     Args:
-        format: Output format ('svg', 'png', 'pdf', 'html').
+        format: Output format ('svg', 'svgz', 'png', 'pdf', 'html', 'dzi', 'xyz',
+            'mmd', 'dot', 'puml', or a format registered by a plugin).
 
     Returns:
         Exporter instance for the specified format.
@@ -19,18 +40,11 @@ def get_exporter(format: str):
     Raises:
         ValueError: If the format is not supported.
     """
-    exporters = {
-        "svg": SVGExporter,
-        "png": PNGExporter,
-        "pdf": PDFExporter,
-        "html": HTMLExporter,
-    }
-
-    exporter_class = exporters.get(format.lower())
+    exporter_class = exporters.get(format)
     if not exporter_class:
         raise ValueError(
             f"Unsupported export format: {format}. "
-            f"Supported formats: {', '.join(exporters.keys())}"
+            f"Supported formats: {', '.join(exporters.names())}"
         )
 
     return exporter_class()
@@ -38,8 +52,16 @@ def get_exporter(format: str):
 
 __all__ = [
     "SVGExporter",
+    "SVGZExporter",
     "PNGExporter",
     "PDFExporter",
     "HTMLExporter",
+    "TileExporter",
+    "XYZTileExporter",
+    "TextExporter",
+    "MermaidExporter",
+    "DOTExporter",
+    "PlantUMLExporter",
+    "OutputManifest",
     "get_exporter",
 ]
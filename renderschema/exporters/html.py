@@ -1,16 +1,305 @@
 """HTML exporter for interactive diagram output."""
 
-from pathlib import Path
+import re
 from typing import Optional
 
+from ..themes import variable_rules
+from .output import OutputTarget, open_output, write_text
+
+#: Pan/zoom viewer driven entirely by the SVG viewBox. Input events only update
+#: a pending view; the viewBox attribute is written at most once per animation
+#: frame, so bursts of wheel or pointer events collapse into a single repaint.
+VIEWER_SCRIPT = """
+(function () {
+    'use strict';
+
+    function initViewer(container) {
+        if (container.rsViewer) {
+            return container.rsViewer;
+        }
+        const svg = container.querySelector('svg');
+        if (!svg) {
+            return null;
+        }
+        const minZoom = parseFloat(container.dataset.minZoom) || 0.1;
+        const maxZoom = parseFloat(container.dataset.maxZoom) || 40;
+        const zoomStep = parseFloat(container.dataset.zoomStep) || 1.2;
+
+        function readViewBox() {
+            const vb = svg.viewBox && svg.viewBox.baseVal;
+            if (vb && vb.width && vb.height) {
+                return { x: vb.x, y: vb.y, w: vb.width, h: vb.height };
+            }
+            const box = svg.getBBox();
+            return { x: box.x, y: box.y, w: box.width || 1, h: box.height || 1 };
+        }
+
+        const home = readViewBox();
+        const view = Object.assign({}, home);
+        let framePending = false;
+
+        svg.setAttribute('preserveAspectRatio', 'xMidYMid meet');
+
+        function applyView() {
+            framePending = false;
+            svg.setAttribute(
+                'viewBox',
+                view.x + ' ' + view.y + ' ' + view.w + ' ' + view.h
+            );
+        }
+
+        function scheduleRender() {
+            if (!framePending) {
+                framePending = true;
+                window.requestAnimationFrame(applyView);
+            }
+        }
+
+        // Screen pixels per SVG unit for the pending view ("meet" scaling).
+        function pixelScale() {
+            const rect = svg.getBoundingClientRect();
+            return Math.min(rect.width / view.w, rect.height / view.h) || 1;
+        }
+
+        // Map a client coordinate onto the pending view without touching layout.
+        function clientToSvg(clientX, clientY) {
+            const rect = svg.getBoundingClientRect();
+            const scale = pixelScale();
+            const offsetX = (rect.width - view.w * scale) / 2;
+            const offsetY = (rect.height - view.h * scale) / 2;
+            return {
+                x: view.x + (clientX - rect.left - offsetX) / scale,
+                y: view.y + (clientY - rect.top - offsetY) / scale
+            };
+        }
+
+        function zoomAt(factor, clientX, clientY) {
+            const zoom = home.w / view.w;
+            const target = Math.min(maxZoom, Math.max(minZoom, zoom * factor));
+            const applied = target / zoom;
+            if (applied === 1) {
+                return;
+            }
+            const anchor = clientToSvg(clientX, clientY);
+            view.x = anchor.x - (anchor.x - view.x) / applied;
+            view.y = anchor.y - (anchor.y - view.y) / applied;
+            view.w /= applied;
+            view.h /= applied;
+            scheduleRender();
+        }
+
+        function zoomAtCenter(factor) {
+            const rect = svg.getBoundingClientRect();
+            zoomAt(factor, rect.left + rect.width / 2, rect.top + rect.height / 2);
+        }
+
+        function panBy(dxPixels, dyPixels) {
+            const scale = pixelScale();
+            view.x -= dxPixels / scale;
+            view.y -= dyPixels / scale;
+            scheduleRender();
+        }
+
+        function reset() {
+            Object.assign(view, home);
+            scheduleRender();
+        }
+
+        // Center an element of the diagram with some surrounding context.
+        function focus(element) {
+            const box = element.getBBox();
+            const pad = 40 + Math.max(box.width, box.height);
+            const fitHeight = (box.height + 2 * pad) * home.w / home.h;
+            const w = Math.min(home.w, Math.max(box.width + 2 * pad, fitHeight));
+            const h = w * home.h / home.w;
+            view.x = box.x + box.width / 2 - w / 2;
+            view.y = box.y + box.height / 2 - h / 2;
+            view.w = w;
+            view.h = h;
+            scheduleRender();
+        }
+
+        // Large diagrams drop expensive rendering hints while moving.
+        let idleTimer = null;
+        function markInteracting() {
+            container.classList.add('rs-interacting');
+            window.clearTimeout(idleTimer);
+            idleTimer = window.setTimeout(function () {
+                container.classList.remove('rs-interacting');
+            }, 150);
+        }
+
+        container.addEventListener('wheel', function (e) {
+            e.preventDefault();
+            markInteracting();
+            // Normalise line/page deltas so trackpads and mice zoom alike.
+            const unit = e.deltaMode === 1 ? 16 : (e.deltaMode === 2 ? 400 : 1);
+            zoomAt(Math.exp(-e.deltaY * unit * 0.0015), e.clientX, e.clientY);
+        }, { passive: false });
+
+        const pointers = new Map();
+        let pinchDistance = 0;
+
+        function pinchState() {
+            const pts = Array.from(pointers.values());
+            return {
+                distance: Math.hypot(pts[0].x - pts[1].x, pts[0].y - pts[1].y),
+                x: (pts[0].x + pts[1].x) / 2,
+                y: (pts[0].y + pts[1].y) / 2
+            };
+        }
+
+        container.addEventListener('pointerdown', function (e) {
+            container.setPointerCapture(e.pointerId);
+            pointers.set(e.pointerId, { x: e.clientX, y: e.clientY });
+            if (pointers.size === 2) {
+                pinchDistance = pinchState().distance;
+            }
+            container.classList.add('rs-panning');
+        });
+
+        container.addEventListener('pointermove', function (e) {
+            const last = pointers.get(e.pointerId);
+            if (!last) {
+                return;
+            }
+            markInteracting();
+            if (pointers.size === 1) {
+                panBy(e.clientX - last.x, e.clientY - last.y);
+            }
+            pointers.set(e.pointerId, { x: e.clientX, y: e.clientY });
+            if (pointers.size === 2) {
+                const pinch = pinchState();
+                if (pinchDistance > 0) {
+                    zoomAt(pinch.distance / pinchDistance, pinch.x, pinch.y);
+                }
+                pinchDistance = pinch.distance;
+            }
+        });
+
+        function releasePointer(e) {
+            pointers.delete(e.pointerId);
+            pinchDistance = 0;
+            if (pointers.size === 0) {
+                container.classList.remove('rs-panning');
+            }
+        }
+        container.addEventListener('pointerup', releasePointer);
+        container.addEventListener('pointercancel', releasePointer);
+
+        container.addEventListener('dblclick', function (e) {
+            zoomAt(e.shiftKey ? 1 / zoomStep : zoomStep, e.clientX, e.clientY);
+        });
+
+        container.addEventListener('keydown', function (e) {
+            const panStep = 40;
+            switch (e.key) {
+                case '+':
+                case '=':
+                    zoomAtCenter(zoomStep);
+                    break;
+                case '-':
+                case '_':
+                    zoomAtCenter(1 / zoomStep);
+                    break;
+                case '0':
+                    reset();
+                    break;
+                case 'ArrowLeft':
+                    panBy(panStep, 0);
+                    break;
+                case 'ArrowRight':
+                    panBy(-panStep, 0);
+                    break;
+                case 'ArrowUp':
+                    panBy(0, panStep);
+                    break;
+                case 'ArrowDown':
+                    panBy(0, -panStep);
+                    break;
+                default:
+                    return;
+            }
+            e.preventDefault();
+            markInteracting();
+        });
+
+        applyView();
+        container.rsViewer = { focus: focus, reset: reset };
+        return container.rsViewer;
+    }
+
+    window.RenderSchemaViewer = { init: initViewer };
+    document.querySelectorAll('[data-rs-viewer]').forEach(initViewer);
+})();
+"""
+
+
+#: Viewer styles shared by standalone pages and static sites.
+VIEWER_STYLES = """
+        .container.rs-panning {
+            cursor: grabbing;
+        }
+        .container svg {
+            width: 100%;
+            height: 100%;
+        }
+        .container[data-degrade="true"].rs-interacting svg {
+            shape-rendering: optimizeSpeed;
+            text-rendering: optimizeSpeed;
+        }
+        .container[data-degrade="true"].rs-interacting text {
+            visibility: hidden;
+        }"""
+
+#: Cycles pages exported with theme="auto" between the viewer's preferred
+#: color scheme and a forced light or dark theme.
+THEME_TOGGLE_SCRIPT = """
+(function () {
+    'use strict';
+
+    const root = document.documentElement;
+    const button = document.querySelector('[data-rs-theme-toggle]');
+    const themes = ['auto', 'light', 'dark'];
+    let current = 0;
+
+    function apply() {
+        const theme = themes[current];
+        if (theme === 'auto') {
+            delete root.dataset.theme;
+        } else {
+            root.dataset.theme = theme;
+        }
+        button.textContent = 'Theme: ' + theme;
+    }
+
+    button.addEventListener('click', function () {
+        current = (current + 1) % themes.length;
+        apply();
+    });
+    apply();
+})();
+"""
+
 
 class HTMLExporter:
     """Export diagrams as interactive HTML files."""
 
+    #: Lowest and highest zoom factors relative to the initial view.
+    MIN_ZOOM = 0.1
+    MAX_ZOOM = 40.0
+
+    #: Zoom factor applied per keyboard or double-click step.
+    ZOOM_STEP = 1.2
+
+    #: Element count above which the viewer trades rendering quality for
+    #: responsiveness while the user is panning or zooming.
+    LARGE_DIAGRAM_ELEMENTS = 5000
+
     def export(
         self,
         content: str,
-        output_path: Path,
+        output_path: OutputTarget,
         theme: Optional[str] = "light",
         interactive: bool = True
     ) -> None:
@@ -19,27 +308,54 @@ class HTMLExporter:
 
         Args:
             content: SVG markup as a string.
-            output_path: Path where the HTML file should be saved.
-            theme: Theme setting ('light' or 'dark').
+            output_path: Path or binary file object the HTML is written to.
+            theme: Theme setting ('light', 'dark' or 'auto').
             interactive: Whether to include interactive features.
         """
         html = self.to_string(content, interactive=interactive, theme=theme)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding="utf-8")
+        with open_output(output_path) as handle:
+            write_text(handle, html)
+
+    def to_bytes(
+        self,
+        content: str,
+        theme: Optional[str] = "light",
+        interactive: bool = True
+    ) -> bytes:
+        """
+        Build the HTML document as UTF-8 bytes without writing a file.
+
+        Args:
+            content: SVG markup as a string.
+            theme: Theme setting ('light', 'dark' or 'auto').
+            interactive: Whether to include interactive features.
+
+        Returns:
+            The encoded HTML document.
+        """
+        html = self.to_string(content, interactive=interactive, theme=theme)
+        return html.encode("utf-8")
 
     def to_string(
         self,
         svg_content: str,
         interactive: bool = True,
-        theme: str = "light"
+        theme: Optional[str] = "light"
     ) -> str:
         """
         Convert SVG content to HTML string.
 
+        Interactive output embeds a viewBox-based viewer supporting wheel and
+        pinch zoom anchored at the cursor, drag panning with mouse or touch,
+        and keyboard navigation (``+``/``-`` to zoom, arrows to pan, ``0`` to
+        reset). With the ``'auto'`` theme the page follows the viewer's color
+        scheme and adds a button that switches between automatic, light and
+        dark.
+
         Args:
             svg_content: SVG markup as a string.
             interactive: Whether to include interactive features.
-            theme: Theme setting ('light' or 'dark').
+            theme: Theme setting ('light', 'dark' or 'auto').
 
         Returns:
             Complete HTML document as a string.
@@ -47,16 +363,16 @@ class HTMLExporter:
         # Remove XML declaration if present (not needed in HTML)
         if svg_content.strip().startswith('<?xml'):
             svg_content = svg_content[svg_content.index('?>') + 2:].strip()
-        
-        # Add explicit width and height to SVG if not present
-        if 'width=' not in svg_content:
-            import re
+
+        # Add explicit width and height to the root SVG element if not present
+        root_tag = re.search(r'<svg\b[^>]*>', svg_content)
+        if root_tag and 'width=' not in root_tag.group(0):
             # Match viewBox="minX minY width height"
-            viewbox_match = re.search(r'viewBox="[\d\s]+"', svg_content)
+            viewbox_match = re.search(r'viewBox="[-\d\s.]+"', svg_content)
             if viewbox_match:
                 viewbox_str = viewbox_match.group(0)
                 # Extract just the numbers
-                numbers = re.findall(r'\d+', viewbox_str)
+                numbers = re.findall(r'-?\d+(?:\.\d+)?', viewbox_str)
                 if len(numbers) >= 4:
                     width = numbers[2]
                     height = numbers[3]
@@ -67,34 +383,57 @@ class HTMLExporter:
                         svg_content,
                         count=1
                     )
-        
-        bg_color = "#0f172a" if theme == "dark" else "#f8fafc"
-        
-        interactive_script = ""
-        if interactive:
-            interactive_script = """
-<script>
-    const svg = document.querySelector('svg');
-    let isPanning = false;
-    let startPoint = { x: 0, y: 0 };
-    let scale = 1;
-
-    svg.addEventListener('mousedown', (e) => {
-        isPanning = true;
-        startPoint = { x: e.clientX, y: e.clientY };
-    });
 
-    document.addEventListener('mouseup', () => {
-        isPanning = false;
-    });
+        theme_styles = theme_toggle = theme_script = ""
+        if theme == "auto":
+            bg_color = "var(--rs-background)"
+            rules = variable_rules(root=":root").splitlines()
+            theme_styles = "\n" + "".join(
+                f"        {rule}\n" for rule in rules
+            ) + """        .rs-theme-toggle {
+            position: fixed;
+            top: 12px;
+            right: 12px;
+            z-index: 1;
+            padding: 4px 10px;
+            border: 1px solid var(--rs-divider);
+            border-radius: 4px;
+            background: var(--rs-surface);
+            color: var(--rs-text);
+            font: inherit;
+            cursor: pointer;
+        }"""
+            theme_toggle = (
+                '<button type="button" class="rs-theme-toggle" data-rs-theme-toggle>'
+                "Theme: auto</button>\n    "
+            )
+            theme_script = f"\n    <script>{THEME_TOGGLE_SCRIPT}</script>"
+        else:
+            bg_color = "#0f172a" if theme == "dark" else "#f8fafc"
 
-    svg.addEventListener('wheel', (e) => {
-        e.preventDefault();
-        const delta = e.deltaY > 0 ? 0.9 : 1.1;
-        scale *= delta;
-        svg.style.transform = `scale(${scale})`;
-    });
-</script>"""
+        if interactive:
+            container = self.viewer_container_attributes(svg_content)
+            layout_styles = """
+        body {
+            padding: 0;
+        }
+        .container {
+            width: 100vw;
+            height: 100vh;
+            overflow: hidden;
+            touch-action: none;
+            cursor: grab;
+            outline: none;
+        }""" + VIEWER_STYLES
+            interactive_script = f"<script>{VIEWER_SCRIPT}</script>"
+        else:
+            container = 'class="container"'
+            layout_styles = """
+        svg {
+            width: 90%;
+            height: auto;
+        }"""
+            interactive_script = ""
 
         return f"""<!DOCTYPE html>
 <html lang="en">
@@ -119,22 +458,40 @@ class HTMLExporter:
             display: flex;
             justify-content: center;
             align-items: center;
-        }}
-        svg {{
-            width: 90%;
-            height: auto;
-            cursor: {'grab' if interactive else 'default'};
-            transition: transform 0.1s ease;
-        }}
-        svg:active {{
-            cursor: {'grabbing' if interactive else 'default'};
-        }}
+        }}{layout_styles}{theme_styles}
     </style>
 </head>
 <body>
-    <div class="container">
+    {theme_toggle}<div {container}>
         {svg_content}
     </div>
-    {interactive_script}
+    {interactive_script}{theme_script}
 </body>
 </html>"""
+
+    def viewer_container_attributes(self, svg_content: str) -> str:
+        """
+        Build the attributes of the interactive viewer's container element.
+
+        Pages that embed diagrams themselves, such as static sites, use them
+        together with ``VIEWER_SCRIPT`` and ``VIEWER_STYLES``.
+
+        Args:
+            svg_content: The SVG shown in the container.
+
+        Returns:
+            The attributes, ready to be placed in the container's start tag.
+        """
+        # Every element starts with "<"; closing tags and comments make this an
+        # overestimate, which is the safe direction for the degrade decision.
+        element_count = svg_content.count("<")
+        degrade = element_count > self.LARGE_DIAGRAM_ELEMENTS
+        return (
+            'class="container" data-rs-viewer tabindex="0" role="application" '
+            'aria-label="Diagram viewer: drag to pan, scroll or pinch to zoom, '
+            '+ and - to zoom, arrow keys to pan, 0 to reset" '
+            f'data-min-zoom="{self.MIN_ZOOM}" data-max-zoom="{self.MAX_ZOOM}" '
+            f'data-zoom-step="{self.ZOOM_STEP}" '
+            f'data-element-count="{element_count}" '
+            f'data-degrade="{"true" if degrade else "false"}"'
+        )
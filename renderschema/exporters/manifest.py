@@ -0,0 +1,120 @@
+"""Content-fingerprint manifest that lets exports skip unchanged outputs."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Optional, Type, Union
+
+
+class OutputManifest:
+    """
+    Record a content fingerprint for every exported file.
+
+    When the fingerprint of a new export matches the recorded one and the
+    file still exists, the export can be skipped entirely, leaving the file
+    and its modification time untouched. Paths are stored relative to the
+    manifest file so the manifest can be cached alongside the outputs.
+
+    Example:
+        >>> with OutputManifest("docs/_diagrams/manifest.json") as manifest:
+        ...     diagram(MyClass).export(
+        ...         "docs/_diagrams/my_class.png", manifest=manifest
+        ...     )
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the manifest, loading it from ``path`` if it exists.
+
+        Args:
+            path: Location of the JSON manifest file.
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path.exists():
+            try:
+                stored = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                stored = {}
+            if stored.get("version") == self.VERSION:
+                self._entries = dict(stored.get("outputs", {}))
+
+    @staticmethod
+    def fingerprint(content: str, format: str, theme: Optional[str] = None) -> str:
+        """
+        Compute the fingerprint of an export.
+
+        Args:
+            content: The generated SVG markup.
+            format: Output format the SVG is exported to.
+            theme: Theme passed to the exporter.
+
+        Returns:
+            Hex digest covering the content, format, theme and library version.
+        """
+        from .. import __version__
+
+        digest = hashlib.sha256()
+        digest.update(f"{__version__}\0{format.lower()}\0{theme}\0".encode())
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def is_current(self, output_path: Union[str, Path], fingerprint: str) -> bool:
+        """Return whether ``output_path`` exists and was written from a fingerprint."""
+        output_path = Path(output_path)
+        key = self._key(output_path)
+        with self._lock:
+            recorded = self._entries.get(key)
+        return recorded == fingerprint and output_path.exists()
+
+    def record(self, output_path: Union[str, Path], fingerprint: str) -> None:
+        """Record that ``output_path`` was written from ``fingerprint``."""
+        key = self._key(Path(output_path))
+        with self._lock:
+            if self._entries.get(key) != fingerprint:
+                self._entries[key] = fingerprint
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically if anything was recorded since loading."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            temporary.write_text(
+                json.dumps(
+                    {"version": self.VERSION, "outputs": self._entries},
+                    indent=2,
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(temporary, self.path)
+            self._dirty = False
+
+    def __enter__(self) -> "OutputManifest":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.save()
+
+    def _key(self, output_path: Path) -> str:
+        """Return the manifest key for an output path."""
+        absolute = output_path.resolve()
+        try:
+            return absolute.relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return absolute.as_posix()
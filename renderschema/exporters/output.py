@@ -0,0 +1,46 @@
+"""Output targets shared by the file exporters."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Union
+
+#: Anything an exporter can write to: a path, or a binary file object such as
+#: ``io.BytesIO``, an open file or a socket's ``makefile("wb")``.
+OutputTarget = Union[str, Path, BinaryIO]
+
+#: Size of the pieces large text is encoded and written in.
+CHUNK_SIZE = 1 << 16
+
+
+def is_file_object(target: Any) -> bool:
+    """Return whether ``target`` is a writable file object rather than a path."""
+    return hasattr(target, "write")
+
+
+@contextmanager
+def open_output(target: OutputTarget) -> Iterator[BinaryIO]:
+    """
+    Open an export target for binary writing.
+
+    Paths are opened (creating parent directories) and closed afterwards.
+    File objects are written in place and left open for the caller.
+
+    Args:
+        target: Path or binary file object.
+
+    Yields:
+        A binary file object.
+    """
+    if is_file_object(target):
+        yield target  # type: ignore[misc]
+        return
+    path = Path(target)  # type: ignore[arg-type]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        yield handle
+
+
+def write_text(handle: BinaryIO, text: str) -> None:
+    """Encode ``text`` as UTF-8 and write it in bounded chunks."""
+    for start in range(0, len(text), CHUNK_SIZE):
+        handle.write(text[start:start + CHUNK_SIZE].encode("utf-8"))
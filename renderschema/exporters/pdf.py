@@ -1,7 +1,10 @@
 """PDF exporter for diagram output."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from ..themes import resolve_variables
+from .output import OutputTarget, is_file_object, open_output
 
 
 class PDFExporter:
@@ -10,7 +13,7 @@ class PDFExporter:
     def export(
         self,
         content: str,
-        output_path: Path,
+        output_path: OutputTarget,
         theme: Optional[str] = None
     ) -> None:
         """
@@ -18,22 +21,151 @@ class PDFExporter:
 
         Args:
             content: SVG markup as a string.
-            output_path: Path where the PDF file should be saved.
-            theme: Theme setting for rendering.
+            output_path: Path or binary file object the PDF is written to.
+            theme: Theme setting for rendering. SVG generated with the
+                ``"auto"`` theme is rendered in its light colors.
 
         Note:
             Requires cairosvg or similar library for SVG to PDF conversion.
         """
+        convert = self._converter()
+        with open_output(output_path) as handle:
+            convert(
+                bytestring=resolve_variables(content).encode("utf-8"),
+                write_to=handle
+            )
+
+    def to_bytes(self, content: str, theme: Optional[str] = None) -> bytes:
+        """
+        Render SVG content as PDF without writing a file.
+
+        Args:
+            content: SVG markup as a string.
+            theme: Theme setting for rendering.
+
+        Returns:
+            The PDF document.
+        """
+        svg = resolve_variables(content).encode("utf-8")
+        document: bytes = self._converter()(bytestring=svg)
+        return document
+
+    @staticmethod
+    def _converter() -> Callable[..., Any]:
+        """Return cairosvg's SVG to PDF converter."""
         try:
             import cairosvg
-            
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            cairosvg.svg2pdf(
-                bytestring=content.encode("utf-8"),
-                write_to=str(output_path)
-            )
-        except ImportError:
+        except ImportError as error:
             raise ImportError(
                 "PDF export requires 'cairosvg'. "
                 "Install it with: pip install cairosvg"
-            )
+            ) from error
+        converter: Callable[..., Any] = cairosvg.svg2pdf
+        return converter
+
+    def export_pages(
+        self,
+        sources: Iterable[Any],
+        output_path: OutputTarget,
+        titles: Optional[Iterable[str]] = None,
+        dpi: float = 96,
+    ) -> int:
+        """
+        Export many diagrams as the pages of a single PDF document.
+
+        All pages are drawn onto one shared PDF surface, sized per page, and
+        each page gets a bookmark. Sources are consumed lazily and every page
+        is released once drawn, so memory use does not grow with the number
+        of pages.
+
+        Args:
+            sources: Diagram generators, SVG markup (``str`` or ``bytes``),
+                paths to SVG files, or binary file objects containing SVG.
+            output_path: Path or binary file object the PDF is written to.
+            titles: Bookmark titles, one per source. Defaults to each
+                diagram's name or file stem.
+            dpi: Resolution used to convert SVG pixel units to PDF points.
+
+        Returns:
+            Number of pages written.
+
+        Example:
+            >>> PDFExporter().export_pages(
+            ...     (diagram(cls) for cls in classes), Path("handbook.pdf")
+            ... )
+
+        Note:
+            Requires cairosvg. Bookmarks additionally require cairo 1.16+.
+        """
+        try:
+            import cairocffi
+            from cairosvg.parser import Tree
+            from cairosvg.surface import PDFSurface
+        except ImportError as error:
+            raise ImportError(
+                "PDF export requires 'cairosvg'. "
+                "Install it with: pip install cairosvg"
+            ) from error
+
+        class SharedPagePDFSurface(PDFSurface):
+            """cairosvg surface that draws onto the current page of a shared PDF."""
+
+            def __init__(self, tree: Any, shared: Any, dpi: float) -> None:
+                self._shared = shared
+                super().__init__(tree, None, dpi)
+
+            def _create_surface(
+                self, width: float, height: float
+            ) -> Tuple[Any, float, float]:
+                self._shared.set_size(width, height)
+                return self._shared, width, height
+
+        if is_file_object(output_path):
+            shared = cairocffi.PDFSurface(output_path, 1, 1)
+        else:
+            output_path = Path(output_path)  # type: ignore[arg-type]
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shared = cairocffi.PDFSurface(str(output_path), 1, 1)
+        title_iter = iter(titles) if titles is not None else None
+        page_count = 0
+        try:
+            for page_count, (svg, default_title) in enumerate(
+                self._iter_svg_sources(sources), start=1
+            ):
+                title = next(title_iter, default_title) if title_iter else default_title
+                page = SharedPagePDFSurface(Tree(bytestring=svg), shared, dpi)
+                if hasattr(shared, "add_outline"):
+                    shared.add_outline(
+                        getattr(cairocffi, "PDF_OUTLINE_ROOT", 0),
+                        title or f"Diagram {page_count}",
+                        f"page={page_count}",
+                    )
+                page.context.show_page()
+                del page
+        finally:
+            shared.finish()
+        return page_count
+
+    @staticmethod
+    def _iter_svg_sources(
+        sources: Iterable[Any]
+    ) -> Iterator[Tuple[bytes, Optional[str]]]:
+        """Yield ``(svg_bytes, default_title)`` for each source, one at a time."""
+        for source in sources:
+            if hasattr(source, "to_svg"):
+                svg: Any = source.to_svg()
+                analyzed = getattr(source, "analyzed", None)
+                title = analyzed().get("name") if analyzed is not None else None
+            elif isinstance(source, Path):
+                svg, title = source.read_bytes(), source.stem
+            elif isinstance(source, str) and not source.lstrip().startswith("<"):
+                svg, title = Path(source).read_bytes(), Path(source).stem
+            elif hasattr(source, "read"):
+                svg = source.read()
+                title = Path(getattr(source, "name", "") or "").stem or None
+            else:
+                svg, title = source, None
+            data = svg.encode("utf-8") if isinstance(svg, str) else bytes(svg)
+            if b"var(--rs-" in data:
+                data = resolve_variables(data.decode("utf-8")).encode("utf-8")
+            yield data, title
@@ -1,7 +1,9 @@
 """PNG exporter for diagram output."""
 
-from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from ..themes import resolve_variables
+from .output import OutputTarget, open_output
 
 
 class PNGExporter:
@@ -10,7 +12,7 @@ class PNGExporter:
     def export(
         self,
         content: str,
-        output_path: Path,
+        output_path: OutputTarget,
         theme: Optional[str] = None
     ) -> None:
         """
@@ -18,22 +20,44 @@ class PNGExporter:
 
         Args:
             content: SVG markup as a string.
-            output_path: Path where the PNG file should be saved.
-            theme: Theme setting for rendering.
+            output_path: Path or binary file object the PNG is written to.
+            theme: Theme setting for rendering. SVG generated with the
+                ``"auto"`` theme is rendered in its light colors.
 
         Note:
             Requires cairosvg or similar library for SVG to PNG conversion.
         """
+        convert = self._converter()
+        with open_output(output_path) as handle:
+            convert(
+                bytestring=resolve_variables(content).encode("utf-8"),
+                write_to=handle
+            )
+
+    def to_bytes(self, content: str, theme: Optional[str] = None) -> bytes:
+        """
+        Render SVG content as PNG without writing a file.
+
+        Args:
+            content: SVG markup as a string.
+            theme: Theme setting for rendering.
+
+        Returns:
+            The PNG document.
+        """
+        svg = resolve_variables(content).encode("utf-8")
+        document: bytes = self._converter()(bytestring=svg)
+        return document
+
+    @staticmethod
+    def _converter() -> Callable[..., Any]:
+        """Return cairosvg's SVG to PNG converter."""
         try:
             import cairosvg
-            
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            cairosvg.svg2png(
-                bytestring=content.encode("utf-8"),
-                write_to=str(output_path)
-            )
-        except ImportError:
+        except ImportError as error:
             raise ImportError(
                 "PNG export requires 'cairosvg'. "
                 "Install it with: pip install cairosvg"
-            )
+            ) from error
+        converter: Callable[..., Any] = cairosvg.svg2png
+        return converter
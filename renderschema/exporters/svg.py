@@ -1,7 +1,8 @@
 """SVG exporter for diagram output."""
 
-from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+from .output import OutputTarget, open_output, write_text
 
 
 class SVGExporter:
@@ -10,7 +11,7 @@ class SVGExporter:
     def export(
         self,
         content: str,
-        output_path: Path,
+        output_path: OutputTarget,
         theme: Optional[str] = None
     ) -> None:
         """
@@ -18,8 +19,33 @@ class SVGExporter:
 
         Args:
             content: SVG markup as a string.
-            output_path: Path where the SVG file should be saved.
+            output_path: Path or binary file object the SVG is written to.
             theme: Theme setting (not used for SVG, preserved in content).
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
+        with open_output(output_path) as handle:
+            write_text(handle, content)
+
+    def export_stream(self, chunks: Iterable[str], output_path: OutputTarget) -> None:
+        """
+        Write SVG content to a file chunk by chunk.
+
+        Args:
+            chunks: Consecutive pieces of SVG markup.
+            output_path: Path or binary file object the SVG is written to.
+        """
+        with open_output(output_path) as handle:
+            for chunk in chunks:
+                write_text(handle, chunk)
+
+    def to_bytes(self, content: str, theme: Optional[str] = None) -> bytes:
+        """
+        Encode SVG content without writing a file.
+
+        Args:
+            content: SVG markup as a string.
+            theme: Theme setting (not used for SVG).
+
+        Returns:
+            UTF-8 encoded SVG.
+        """
+        return content.encode("utf-8")
@@ -0,0 +1,412 @@
+"""Text exporters writing diagrams as Mermaid, Graphviz DOT or PlantUML source."""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .output import OutputTarget, open_output, write_text
+
+_VISIBILITY = {"public": "+", "protected": "#", "private": "-"}
+
+
+class TextExporter:
+    """
+    Base class for exporters that write diagram source text instead of SVG.
+
+    Text exporters work on the analysis data, so generators skip layout and
+    SVG rendering entirely when exporting to them: ``export()`` and
+    ``to_bytes()`` receive the text produced by ``render()``.
+
+    Class and UML diagrams become classes with their drawn members and
+    relationships, flowcharts become their nodes in order, and diagrams with
+    ``nodes`` and ``edges`` (call graphs, profiles, object graphs) become
+    plain graphs.
+    """
+
+    #: Generators pass ``render(self.analyzed())`` instead of SVG markup.
+    requires_svg = False
+    format_name = ""
+
+    def render(self, data: Mapping[str, Any]) -> str:
+        """
+        Convert analysis data to diagram source text.
+
+        Args:
+            data: Data in the format returned by a generator's ``analyze()``.
+
+        Returns:
+            The diagram source.
+
+        Raises:
+            ValueError: If the diagram kind cannot be expressed in this format.
+        """
+        classes = _class_model(data)
+        if classes is not None:
+            return self.render_classes(*classes)
+        if data.get("nodes") and "edges" not in data:
+            return self.render_flowchart(data["nodes"])
+        if "nodes" in data and "edges" in data:
+            nodes = [
+                (node["id"], node.get("name", node["id"])) for node in data["nodes"]
+            ]
+            # Edges to nodes outside the diagram (stubs, filtered nodes) are
+            # not drawn in SVG either.
+            drawn = {node for node, _ in nodes}
+            edges = [
+                (edge["from"], edge["to"], edge.get("label"))
+                for edge in data["edges"]
+                if edge["from"] in drawn and edge["to"] in drawn
+            ]
+            return self.render_graph(nodes, edges)
+        raise ValueError(
+            f"{data.get('type', 'This')} diagrams cannot be exported as "
+            f"{self.format_name}"
+        )
+
+    def render_classes(
+        self, classes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]
+    ) -> str:
+        """Render classes (``id``, ``name``, ``members``) and their relationships."""
+        raise NotImplementedError
+
+    def render_flowchart(self, nodes: List[Dict[str, Any]]) -> str:
+        """Render flowchart nodes, connected in order."""
+        raise NotImplementedError
+
+    def render_graph(
+        self, nodes: List[Tuple[str, str]], edges: List[Tuple[str, str, Optional[str]]]
+    ) -> str:
+        """Render ``(id, label)`` nodes and ``(from, to, label)`` edges."""
+        raise NotImplementedError
+
+    def export(
+        self,
+        content: str,
+        output_path: OutputTarget,
+        theme: Optional[str] = None
+    ) -> None:
+        """
+        Write diagram source to a file.
+
+        Args:
+            content: Diagram source as returned by ``render()``.
+            output_path: Path or binary file object the source is written to.
+            theme: Theme setting (not used; the renderer applies its own).
+        """
+        with open_output(output_path) as handle:
+            write_text(handle, content)
+
+    def to_bytes(self, content: str, theme: Optional[str] = None) -> bytes:
+        """
+        Encode diagram source without writing a file.
+
+        Args:
+            content: Diagram source as returned by ``render()``.
+            theme: Theme setting (not used).
+
+        Returns:
+            UTF-8 encoded source.
+        """
+        return content.encode("utf-8")
+
+
+class MermaidExporter(TextExporter):
+    """Export diagrams as Mermaid (``.mmd``) source."""
+
+    format_name = "Mermaid"
+    _ARROWS = {
+        "inheritance": "<|--",
+        "composition": "*--",
+        "aggregation": "o--",
+        "association": "-->",
+    }
+
+    def render_classes(
+        self, classes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]
+    ) -> str:
+        names = _identifiers(cls["id"] for cls in classes)
+        lines = ["classDiagram"]
+        for cls in classes:
+            header = f'    class {names[cls["id"]]}["{_mermaid_text(cls["name"])}"]'
+            if not cls["members"]:
+                lines.append(header)
+                continue
+            lines.append(header + " {")
+            for visibility, name, kind, detail in cls["members"]:
+                if kind == "method":
+                    line = f"        {visibility}{name}({detail[0]}) {detail[1]}"
+                    lines.append(line.rstrip())
+                else:
+                    lines.append(f"        {visibility}{detail} {name}" if detail
+                                 else f"        {visibility}{name}")
+            lines.append("    }")
+        for rel in relationships:
+            source, target = names[rel["from"]], names[rel["to"]]
+            if rel["type"] == "inheritance":
+                line = f"    {target} <|-- {source}"
+            else:
+                line = f'    {source} {self._ARROWS.get(rel["type"], "-->")} {target}'
+            if rel.get("label"):
+                line += f' : {_mermaid_text(rel["label"])}'
+            lines.append(line)
+        return "\n".join(lines) + "\n"
+
+    def render_flowchart(self, nodes: List[Dict[str, Any]]) -> str:
+        lines = ["flowchart TD"]
+        for index, node in enumerate(nodes):
+            label = _mermaid_text(node["label"])
+            if node["type"] in ("start", "end"):
+                lines.append(f'    n{index}(["{label}"])')
+            else:
+                lines.append(f'    n{index}["{label}"]')
+        lines.extend(f"    n{index - 1} --> n{index}" for index in range(1, len(nodes)))
+        return "\n".join(lines) + "\n"
+
+    def render_graph(
+        self, nodes: List[Tuple[str, str]], edges: List[Tuple[str, str, Optional[str]]]
+    ) -> str:
+        names = _identifiers(node for node, _ in nodes)
+        lines = ["flowchart TD"]
+        lines.extend(
+            f'    {names[node]}["{_mermaid_text(label)}"]' for node, label in nodes
+        )
+        for source, target, label in edges:
+            arrow = f'-->|"{_mermaid_text(label)}"|' if label else "-->"
+            lines.append(f"    {names[source]} {arrow} {names[target]}")
+        return "\n".join(lines) + "\n"
+
+
+class DOTExporter(TextExporter):
+    """Export diagrams as Graphviz DOT (``.dot``) source."""
+
+    format_name = "DOT"
+    _EDGES = {
+        "inheritance": "arrowhead=empty",
+        "composition": "dir=back, arrowtail=diamond",
+        "aggregation": "dir=back, arrowtail=odiamond",
+        "association": "arrowhead=vee",
+    }
+
+    def render_classes(
+        self, classes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]
+    ) -> str:
+        lines = [
+            "digraph classes {",
+            "    rankdir=BT;",
+            '    node [shape=record, fontname="Helvetica", fontsize=10];',
+        ]
+        for cls in classes:
+            fields = [_record_text(cls["name"])]
+            attributes = "".join(
+                _record_text(f"{visibility} {name}: {detail}") + "\\l"
+                for visibility, name, kind, detail in cls["members"]
+                if kind == "attribute"
+            )
+            methods = "".join(
+                _record_text(f"{visibility} {name}({detail[0]})"
+                             + (f": {detail[1]}" if detail[1] else "")) + "\\l"
+                for visibility, name, kind, detail in cls["members"] if kind == "method"
+            )
+            if attributes or methods:
+                fields.extend([attributes, methods])
+            label = "|".join(fields)
+            lines.append(f'    {_dot_string(cls["id"])} [label="{{{label}}}"];')
+        for rel in relationships:
+            attributes = self._EDGES.get(rel["type"], "arrowhead=vee")
+            if rel.get("label"):
+                attributes += f', label={_dot_string(rel["label"])}'
+            source, target = _dot_string(rel["from"]), _dot_string(rel["to"])
+            lines.append(f"    {source} -> {target} [{attributes}];")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def render_flowchart(self, nodes: List[Dict[str, Any]]) -> str:
+        lines = ["digraph flowchart {", '    node [fontname="Helvetica", fontsize=10];']
+        for index, node in enumerate(nodes):
+            shape = "oval" if node["type"] in ("start", "end") else "box"
+            label = _dot_string(node["label"])
+            lines.append(f"    n{index} [label={label}, shape={shape}];")
+        lines.extend(f"    n{index - 1} -> n{index};" for index in range(1, len(nodes)))
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def render_graph(
+        self, nodes: List[Tuple[str, str]], edges: List[Tuple[str, str, Optional[str]]]
+    ) -> str:
+        lines = [
+            "digraph diagram {",
+            '    node [shape=box, fontname="Helvetica", fontsize=10];',
+        ]
+        lines.extend(
+            f"    {_dot_string(node)} [label={_dot_string(label)}];"
+            for node, label in nodes
+        )
+        for source, target, label in edges:
+            suffix = f" [label={_dot_string(label)}]" if label else ""
+            lines.append(f"    {_dot_string(source)} -> {_dot_string(target)}{suffix};")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+class PlantUMLExporter(TextExporter):
+    """Export diagrams as PlantUML (``.puml``) source."""
+
+    format_name = "PlantUML"
+    _ARROWS = MermaidExporter._ARROWS
+
+    def render_classes(
+        self, classes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]
+    ) -> str:
+        names = _identifiers(cls["id"] for cls in classes)
+        lines = ["@startuml"]
+        for cls in classes:
+            header = f'class "{_plantuml_text(cls["name"])}" as {names[cls["id"]]}'
+            if not cls["members"]:
+                lines.append(header)
+                continue
+            lines.append(header + " {")
+            for visibility, name, kind, detail in cls["members"]:
+                if kind == "method":
+                    returns = f" : {detail[1]}" if detail[1] else ""
+                    lines.append(f"    {visibility}{name}({detail[0]}){returns}")
+                else:
+                    lines.append(f"    {visibility}{name} : {detail}")
+            lines.append("}")
+        for rel in relationships:
+            source, target = names[rel["from"]], names[rel["to"]]
+            if rel["type"] == "inheritance":
+                line = f"{target} <|-- {source}"
+            else:
+                line = f'{source} {self._ARROWS.get(rel["type"], "-->")} {target}'
+            if rel.get("label"):
+                line += f' : {_plantuml_text(rel["label"])}'
+            lines.append(line)
+        lines.append("@enduml")
+        return "\n".join(lines) + "\n"
+
+    def render_flowchart(self, nodes: List[Dict[str, Any]]) -> str:
+        lines = ["@startuml"]
+        for node in nodes:
+            if node["type"] == "start":
+                lines.append("start")
+            elif node["type"] == "end":
+                lines.append("stop")
+            else:
+                lines.append(f':{node["label"]};')
+        lines.append("@enduml")
+        return "\n".join(lines) + "\n"
+
+    def render_graph(
+        self, nodes: List[Tuple[str, str]], edges: List[Tuple[str, str, Optional[str]]]
+    ) -> str:
+        names = _identifiers(node for node, _ in nodes)
+        lines = ["@startuml"]
+        lines.extend(
+            f'rectangle "{_plantuml_text(label)}" as {names[node]}'
+            for node, label in nodes
+        )
+        for source, target, label in edges:
+            suffix = f" : {_plantuml_text(label)}" if label else ""
+            lines.append(f"{names[source]} --> {names[target]}{suffix}")
+        lines.append("@enduml")
+        return "\n".join(lines) + "\n"
+
+
+def _class_model(
+    data: Mapping[str, Any]
+) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    Normalize class and UML diagram data.
+
+    Returns:
+        ``(classes, relationships)`` where each class has an ``id``, a
+        ``name`` and its drawn ``members`` as ``(visibility, name, kind,
+        detail)`` tuples, or None if the data describes no classes. UML data
+        has no relationships; inheritance between its classes is derived
+        from their base names. Relationships to classes outside the diagram
+        are dropped.
+    """
+    if "classes" in data:
+        described = list(data["classes"])
+    elif "attributes" in data or "methods" in data:
+        # A single UML class.
+        described = [data]
+    else:
+        return None
+
+    classes = []
+    for cls in described:
+        members: List[Tuple[str, str, str, Any]] = []
+        for attribute in cls.get("attributes", ()):
+            if isinstance(attribute, Mapping):
+                members.append((
+                    _VISIBILITY.get(attribute["visibility"], "+"), attribute["name"],
+                    "attribute", attribute.get("type") or "",
+                ))
+        for method in cls.get("methods", ()):
+            # Class diagrams list method names only and do not draw them.
+            if isinstance(method, Mapping):
+                members.append((
+                    _VISIBILITY.get(method["visibility"], "+"),
+                    method["name"],
+                    "method",
+                    (
+                        ", ".join(method["parameters"][1:]),
+                        method.get("return_type") or "",
+                    ),
+                ))
+        classes.append(
+            {"id": cls.get("id", cls["name"]), "name": cls["name"], "members": members}
+        )
+
+    relationships = data.get("relationships")
+    if relationships is None:
+        by_name = {cls["name"]: cls["id"] for cls in classes}
+        relationships = [
+            {
+                "type": "inheritance",
+                "from": cls.get("id", cls["name"]),
+                "to": by_name[base],
+            }
+            for cls in described for base in cls.get("bases", ()) if base in by_name
+        ]
+    drawn = {cls["id"] for cls in classes}
+    return classes, [
+        rel for rel in relationships if rel["from"] in drawn and rel["to"] in drawn
+    ]
+
+
+def _identifiers(ids: Iterable[str]) -> Dict[str, str]:
+    """Map ids to unique identifiers made of word characters."""
+    names: Dict[str, str] = {}
+    used = set()
+    for value in ids:
+        base = re.sub(r"\W", "_", value)
+        if not base or base[0].isdigit():
+            base = "_" + base
+        name, suffix = base, 2
+        while name in used:
+            name, suffix = f"{base}_{suffix}", suffix + 1
+        used.add(name)
+        names[value] = name
+    return names
+
+
+def _mermaid_text(text: str) -> str:
+    """Escape text for a quoted Mermaid label."""
+    return text.replace('"', "#quot;").replace("<", "#lt;").replace(">", "#gt;")
+
+
+def _plantuml_text(text: str) -> str:
+    """Escape text for a quoted PlantUML name or label."""
+    return text.replace('"', "'").replace("\n", " ")
+
+
+def _dot_string(text: str) -> str:
+    """Quote text as a DOT string."""
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _record_text(text: str) -> str:
+    """Escape text for a field of a DOT record label."""
+    return re.sub(r'([\\{}|<>"])', r"\\\1", text)
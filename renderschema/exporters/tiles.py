@@ -0,0 +1,463 @@
+"""Deep-zoom tile pyramid exporter for very large diagrams."""
+
+import io
+import json
+import math
+import re
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from xml.sax.saxutils import quoteattr
+
+from ..themes import resolve_variables
+from .output import OutputTarget, is_file_object, open_output
+
+# Viewer that only requests the tiles covering the visible area at the level
+# closest to the current zoom. Like the SVG viewer, input events update a
+# pending view that is applied once per animation frame.
+_TILE_VIEWER_SCRIPT = """
+(function () {
+    'use strict';
+    const config = JSON.parse(document.getElementById('rs-tiles').textContent);
+    const viewport = document.getElementById('rs-viewport');
+    const tiles = new Map();
+    const fit = Math.min(
+        viewport.clientWidth / config.width, viewport.clientHeight / config.height
+    );
+    const view = { zoom: fit, x: 0, y: 0 };
+    let framePending = false;
+
+    function levelFor(zoom) {
+        for (const level of config.levels) {
+            if (level.scale >= zoom) {
+                return level;
+            }
+        }
+        return config.levels[config.levels.length - 1];
+    }
+
+    function render() {
+        framePending = false;
+        const level = levelFor(view.zoom);
+        const ratio = view.zoom / level.scale;
+        const size = config.tileSize;
+        const left = Math.max(0, Math.floor(-view.x / ratio / size));
+        const top = Math.max(0, Math.floor(-view.y / ratio / size));
+        const visibleRight = (viewport.clientWidth - view.x) / ratio / size;
+        const visibleBottom = (viewport.clientHeight - view.y) / ratio / size;
+        const right = Math.min(level.columns - 1, Math.floor(visibleRight));
+        const bottom = Math.min(level.rows - 1, Math.floor(visibleBottom));
+        const wanted = new Set();
+        for (let col = left; col <= right; col++) {
+            for (let row = top; row <= bottom; row++) {
+                const key = level.key + '/' + col + '/' + row;
+                wanted.add(key);
+                let img = tiles.get(key);
+                if (!img) {
+                    img = document.createElement('img');
+                    img.src = config.url
+                        .replace('{level}', level.key)
+                        .replace('{col}', col)
+                        .replace('{row}', row);
+                    img.draggable = false;
+                    tiles.set(key, img);
+                    viewport.appendChild(img);
+                }
+                const offset = config.overlap;
+                const tileX = col * size - (col ? offset : 0);
+                const tileY = row * size - (row ? offset : 0);
+                img.style.left = (view.x + tileX * ratio) + 'px';
+                img.style.top = (view.y + tileY * ratio) + 'px';
+                img.style.transform = 'scale(' + ratio + ')';
+            }
+        }
+        for (const [key, img] of tiles) {
+            if (!wanted.has(key)) {
+                img.remove();
+                tiles.delete(key);
+            }
+        }
+    }
+
+    function schedule() {
+        if (!framePending) {
+            framePending = true;
+            window.requestAnimationFrame(render);
+        }
+    }
+
+    viewport.addEventListener('wheel', function (e) {
+        e.preventDefault();
+        const rect = viewport.getBoundingClientRect();
+        const factor = Math.exp(-e.deltaY * 0.0015);
+        const zoom = Math.min(
+            config.maxScale * 4, Math.max(fit / 4, view.zoom * factor)
+        );
+        const px = e.clientX - rect.left;
+        const py = e.clientY - rect.top;
+        view.x = px - (px - view.x) * zoom / view.zoom;
+        view.y = py - (py - view.y) * zoom / view.zoom;
+        view.zoom = zoom;
+        schedule();
+    }, { passive: false });
+
+    let drag = null;
+    viewport.addEventListener('pointerdown', function (e) {
+        drag = { x: e.clientX, y: e.clientY };
+        viewport.setPointerCapture(e.pointerId);
+    });
+    viewport.addEventListener('pointermove', function (e) {
+        if (drag) {
+            view.x += e.clientX - drag.x;
+            view.y += e.clientY - drag.y;
+            drag = { x: e.clientX, y: e.clientY };
+            schedule();
+        }
+    });
+    viewport.addEventListener('pointerup', function () { drag = null; });
+    window.addEventListener('resize', schedule);
+    render();
+})();
+"""
+
+_ROOT_TAG = re.compile(r"<svg\b[^>]*>")
+_SIZING_ATTRIBUTES = re.compile(
+    r'\s(?:width|height|viewBox|preserveAspectRatio)="[^"]*"'
+)
+
+# SVG markup shared with tile-rendering worker processes, split around the
+# point in the root tag where each tile inserts its sizing attributes.
+_worker_template: Tuple[str, str] = ("", "")
+
+
+def _split_root(content: str) -> Tuple[str, str]:
+    """Strip the root tag's sizing attributes and split the markup at their place."""
+    root = _ROOT_TAG.search(content)
+    if root is None:
+        raise ValueError("Tile export requires SVG content")
+    tag = _SIZING_ATTRIBUTES.sub("", root.group(0))
+    closing = 2 if tag.endswith("/>") else 1
+    head = content[:root.start()] + tag[:-closing]
+    return head, tag[-closing:] + content[root.end():]
+
+
+def _init_worker(template: Tuple[str, str]) -> None:
+    """Receive the SVG once per worker process instead of once per tile."""
+    global _worker_template
+    _worker_template = template
+
+
+def _render_tile(job: Tuple[str, str]) -> None:
+    """Rasterize one tile in a worker process."""
+    _rasterize(_worker_template, job)
+
+
+def _rasterize(template: Tuple[str, str], job: Tuple[str, str]) -> None:
+    """Rasterize the diagram narrowed to a tile's sizing attributes."""
+    import cairosvg
+
+    sizing, path = job
+    head, tail = template
+    cairosvg.svg2png(bytestring=(head + sizing + tail).encode("utf-8"), write_to=path)
+
+
+class TileExporter:
+    """
+    Export diagrams as a multi-resolution pyramid of PNG tiles.
+
+    Each tile is rasterized from the diagram with its root ``viewBox``
+    narrowed to the tile's area, so memory per tile is bounded by the tile
+    size rather than by the size of the whole image. Tiles are rendered in
+    parallel worker processes. A small HTML viewer that loads tiles on
+    demand is written next to the pyramid. Written to a file object, or
+    through ``to_bytes()``, the pyramid is packed into a zip archive.
+
+    Layouts:
+        ``"dzi"``: DeepZoom; ``name.dzi`` descriptor plus
+        ``name_files/{level}/{column}_{row}.png``.
+        ``"xyz"``: Slippy-map style ``name/{z}/{x}/{y}.png``.
+
+    Example:
+        >>> TileExporter(scale=4).export(svg, Path("wall.dzi"))
+    """
+
+    def __init__(
+        self,
+        tile_size: int = 256,
+        overlap: int = 1,
+        layout: str = "dzi",
+        scale: float = 1.0,
+        workers: Optional[int] = None,
+        viewer: bool = True,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            tile_size: Edge length of a tile in pixels.
+            overlap: Pixels each tile repeats from its neighbours (DeepZoom).
+            layout: ``"dzi"`` or ``"xyz"``.
+            scale: Pixels per SVG unit at the most detailed level.
+            workers: Number of rendering processes. ``0`` renders in-process.
+            viewer: Whether to write the HTML viewer.
+        """
+        if layout not in ("dzi", "xyz"):
+            raise ValueError(
+                f"Unknown tile layout: {layout}. Available layouts: dzi, xyz"
+            )
+        self.tile_size = tile_size
+        self.overlap = overlap if layout == "dzi" else 0
+        self.layout = layout
+        self.scale = scale
+        self.workers = workers
+        self.viewer = viewer
+
+    def export(
+        self,
+        content: str,
+        output_path: OutputTarget,
+        theme: Optional[str] = None
+    ) -> None:
+        """
+        Export SVG content as a tile pyramid.
+
+        Args:
+            content: SVG markup as a string.
+            output_path: Path of the ``.dzi`` descriptor (DeepZoom) or of the
+                tile directory (XYZ, any suffix is dropped). The viewer is
+                written alongside with an ``.html`` suffix. A binary file
+                object receives the zip archive built by ``to_bytes()``.
+            theme: Theme setting for the viewer background.
+
+        Note:
+            Requires cairosvg.
+        """
+        if is_file_object(output_path):
+            with open_output(output_path) as handle:
+                handle.write(self.to_bytes(content, theme))
+            return
+
+        try:
+            import cairosvg  # noqa: F401
+        except ImportError as error:
+            raise ImportError(
+                "Tile export requires 'cairosvg'. "
+                "Install it with: pip install cairosvg"
+            ) from error
+
+        output_path = Path(output_path)  # type: ignore[arg-type]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        viewbox, width, height = self._dimensions(content)
+        levels = self.levels(width, height)
+        if self.layout == "dzi":
+            tile_root = output_path.with_name(output_path.stem + "_files")
+            url = f"{tile_root.name}/{{level}}/{{col}}_{{row}}.png"
+        else:
+            tile_root = output_path.with_suffix("")
+            url = f"{tile_root.name}/{{level}}/{{col}}/{{row}}.png"
+
+        template = _split_root(resolve_variables(content))
+        jobs = list(self._jobs(viewbox, width, height, levels, tile_root))
+        if self.workers == 0 or len(jobs) == 1:
+            for job in jobs:
+                _rasterize(template, job)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(template,)
+            ) as pool:
+                for _ in pool.map(_render_tile, jobs, chunksize=16):
+                    pass
+
+        if self.layout == "dzi":
+            output_path.write_text(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+                f'Format="png" Overlap="{self.overlap}" TileSize="{self.tile_size}">\n'
+                f'    <Size Width="{width}" Height="{height}"/>\n'
+                "</Image>\n",
+                encoding="utf-8",
+            )
+        if self.viewer:
+            output_path.with_suffix(".html").write_text(
+                self._viewer_html(width, height, levels, url, theme), encoding="utf-8"
+            )
+
+    def to_bytes(self, content: str, theme: Optional[str] = None) -> bytes:
+        """
+        Render the tile pyramid into a zip archive without writing files.
+
+        The archive contains what ``export()`` writes for ``diagram.dzi``
+        (or the ``diagram`` directory for XYZ), including the viewer.
+
+        Args:
+            content: SVG markup as a string.
+            theme: Theme setting for the viewer background.
+
+        Returns:
+            The zip archive.
+        """
+        buffer = io.BytesIO()
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            self.export(content, root / f"diagram.{self.layout}", theme)
+            # PNG tiles are already compressed.
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+                for path in sorted(root.rglob("*")):
+                    if path.is_file():
+                        archive.write(path, path.relative_to(root).as_posix())
+        return buffer.getvalue()
+
+    def levels(self, width: int, height: int) -> List[Tuple[int, float, int, int]]:
+        """
+        Describe the pyramid of a ``width`` x ``height`` pixel image.
+
+        Returns:
+            ``(level, scale, columns, rows)`` per level, least detailed first,
+            where ``scale`` is relative to the full-resolution image.
+        """
+        size = self.tile_size
+        if self.layout == "dzi":
+            # DeepZoom level 0 is a single pixel.
+            top = math.ceil(math.log2(max(width, height, 1)))
+        else:
+            # XYZ zoom 0 fits the whole image into one tile.
+            top = max(0, math.ceil(math.log2(max(width, height, 1) / size)))
+        result = []
+        for level in range(top + 1):
+            scale = 2.0 ** (level - top)
+            level_width = max(1, math.ceil(width * scale))
+            level_height = max(1, math.ceil(height * scale))
+            columns = math.ceil(level_width / size)
+            rows = math.ceil(level_height / size)
+            result.append((level, scale, columns, rows))
+        return result
+
+    def _dimensions(
+        self, content: str
+    ) -> Tuple[Tuple[float, float, float, float], int, int]:
+        """Return the root viewBox and the full-resolution pixel size."""
+        root = _ROOT_TAG.search(content)
+        if root is None:
+            raise ValueError("Tile export requires SVG content")
+        tag = root.group(0)
+        viewbox_match = re.search(r'viewBox="([^"]+)"', tag)
+        if viewbox_match:
+            values = re.split(r"[\s,]+", viewbox_match.group(1).strip())
+            numbers = [float(n) for n in values]
+            viewbox = (numbers[0], numbers[1], numbers[2], numbers[3])
+        else:
+            width_match = re.search(r'\swidth="([\d.]+)', tag)
+            height_match = re.search(r'\sheight="([\d.]+)', tag)
+            if width_match is None or height_match is None:
+                raise ValueError(
+                    "Tile export requires an SVG viewBox or width and height"
+                )
+            viewbox = (
+                0.0, 0.0, float(width_match.group(1)), float(height_match.group(1))
+            )
+        width = max(1, math.ceil(viewbox[2] * self.scale))
+        height = max(1, math.ceil(viewbox[3] * self.scale))
+        return viewbox, width, height
+
+    def _jobs(
+        self,
+        viewbox: Tuple[float, float, float, float],
+        width: int,
+        height: int,
+        levels: List[Tuple[int, float, int, int]],
+        tile_root: Path,
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield ``(sizing_attributes, png_path)`` per tile, creating directories."""
+        min_x, min_y, view_width, _ = viewbox
+        size, overlap = self.tile_size, self.overlap
+        for level, scale, columns, rows in levels:
+            level_width = max(1, math.ceil(width * scale))
+            level_height = max(1, math.ceil(height * scale))
+            units_per_pixel = view_width / (width * scale)
+            for col in range(columns):
+                left = col * size - (overlap if col else 0)
+                right = min(level_width, (col + 1) * size + overlap)
+                if self.layout == "dzi":
+                    directory = tile_root / str(level)
+                else:
+                    directory = tile_root / str(level) / str(col)
+                directory.mkdir(parents=True, exist_ok=True)
+                for row in range(rows):
+                    top = row * size - (overlap if row else 0)
+                    bottom = min(level_height, (row + 1) * size + overlap)
+                    sizing = (
+                        f' width="{right - left}" height="{bottom - top}" '
+                        f'viewBox="{min_x + left * units_per_pixel} '
+                        f'{min_y + top * units_per_pixel} '
+                        f'{(right - left) * units_per_pixel} '
+                        f'{(bottom - top) * units_per_pixel}" '
+                        f'preserveAspectRatio="none"'
+                    )
+                    name = f"{col}_{row}.png" if self.layout == "dzi" else f"{row}.png"
+                    yield sizing, str(directory / name)
+
+    def _viewer_html(
+        self,
+        width: int,
+        height: int,
+        levels: List[Tuple[int, float, int, int]],
+        url: str,
+        theme: Optional[str],
+    ) -> str:
+        """Build the on-demand tile viewer page."""
+        config = {
+            "width": width,
+            "height": height,
+            "tileSize": self.tile_size,
+            "overlap": self.overlap,
+            "maxScale": 1,
+            "url": url,
+            "levels": [
+                {"key": level, "scale": scale, "columns": columns, "rows": rows}
+                for level, scale, columns, rows in levels
+            ],
+        }
+        bg_color = "#0f172a" if theme == "dark" else "#f8fafc"
+        label = quoteattr("Tiled diagram: drag to pan, scroll to zoom")
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RenderSchema Diagram</title>
+    <style>
+        body {{
+            margin: 0;
+            background-color: {bg_color};
+        }}
+        #rs-viewport {{
+            position: relative;
+            width: 100vw;
+            height: 100vh;
+            overflow: hidden;
+            touch-action: none;
+            cursor: grab;
+        }}
+        #rs-viewport img {{
+            position: absolute;
+            transform-origin: 0 0;
+            user-select: none;
+        }}
+    </style>
+</head>
+<body>
+    <div id="rs-viewport" role="img" aria-label={label}></div>
+    <script type="application/json" id="rs-tiles">{json.dumps(config)}</script>
+    <script>{_TILE_VIEWER_SCRIPT}</script>
+</body>
+</html>"""
+
+
+class XYZTileExporter(TileExporter):
+    """Export diagrams as slippy-map style ``{z}/{x}/{y}.png`` tiles."""
+
+    def __init__(self, **options: object) -> None:
+        options.setdefault("layout", "xyz")
+        super().__init__(**options)  # type: ignore[arg-type]
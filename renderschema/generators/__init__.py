@@ -1,13 +1,42 @@
 """Diagram generator modules for different diagram types."""
 
+from typing import TYPE_CHECKING
+
+from ..registry import lazy_attributes
 from .base import BaseDiagramGenerator
-from .uml import UMLDiagramGenerator
-from .flowchart import FlowchartGenerator
 from .class_diagram import ClassDiagramGenerator
+from .flowchart import FlowchartGenerator
+from .uml import UMLDiagramGenerator
+
+if TYPE_CHECKING:
+    from .budget import RenderBudget
+    from .call_graph import CallGraphGenerator
+    from .import_time import ImportTimeGenerator
+    from .object_graph import ObjectGraphGenerator
+    from .profile_graph import ProfileGraphGenerator
+    from .sequence import SequenceDiagramGenerator
+    from .snapshot import DiagramSnapshot
+
+__getattr__ = lazy_attributes(__name__, {
+    "RenderBudget": ".budget:RenderBudget",
+    "CallGraphGenerator": ".call_graph:CallGraphGenerator",
+    "SequenceDiagramGenerator": ".sequence:SequenceDiagramGenerator",
+    "ImportTimeGenerator": ".import_time:ImportTimeGenerator",
+    "ProfileGraphGenerator": ".profile_graph:ProfileGraphGenerator",
+    "ObjectGraphGenerator": ".object_graph:ObjectGraphGenerator",
+    "DiagramSnapshot": ".snapshot:DiagramSnapshot",
+})
 
 __all__ = [
     "BaseDiagramGenerator",
+    "RenderBudget",
     "UMLDiagramGenerator",
     "FlowchartGenerator",
     "ClassDiagramGenerator",
+    "CallGraphGenerator",
+    "SequenceDiagramGenerator",
+    "ImportTimeGenerator",
+    "ProfileGraphGenerator",
+    "ObjectGraphGenerator",
+    "DiagramSnapshot",
 ]
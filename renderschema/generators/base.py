@@ -1,8 +1,85 @@
 """Base diagram generator class providing common functionality."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Union, Dict, Optional
+from functools import partial
 from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from ..exporters.output import OutputTarget, is_file_object
+
+if TYPE_CHECKING:
+    from ..exporters.manifest import OutputManifest
+    from .snapshot import DiagramSnapshot
+
+_GeneratorT = TypeVar("_GeneratorT", bound="BaseDiagramGenerator")
+
+# Options that control package recursion; they are stripped before options are
+# handed to the per-module generators running inside import workers.
+_PACKAGE_OPTIONS = (
+    "recursive",
+    "max_depth",
+    "include",
+    "exclude",
+    "workers",
+    "import_timeout",
+    "start_method",
+)
+
+
+def export_content(
+    content: str,
+    output_path: OutputTarget,
+    format: str,
+    theme: Optional[str] = None,
+    manifest: Optional["OutputManifest"] = None,
+) -> bool:
+    """
+    Export generated content, skipping outputs recorded as current.
+
+    Args:
+        content: Generated SVG markup, or diagram source for text formats.
+        output_path: Path or binary file object the output is written to.
+        format: Output format.
+        theme: Theme passed to the exporter.
+        manifest: Optional manifest of previously exported fingerprints;
+            ignored for file objects.
+
+    Returns:
+        True if the file was written, False if it was already current.
+    """
+    from ..exporters import get_exporter
+
+    exporter = get_exporter(format)
+    if manifest is None or not isinstance(output_path, (str, Path)):
+        # File objects have no path to record in the manifest.
+        exporter.export(content, output_path, theme=theme)
+        return True
+
+    path = Path(output_path)
+    fingerprint = manifest.fingerprint(content, format, theme)
+    if manifest.is_current(path, fingerprint):
+        return False
+    exporter.export(content, path, theme=theme)
+    manifest.record(path, fingerprint)
+    return True
+
+
+def _analyze_module_in_worker(
+    generator_class: type, options: Dict[str, Any], module: Any
+) -> Dict[str, Any]:
+    """Analyze a single imported module inside an import worker."""
+    generator: BaseDiagramGenerator = generator_class(module, **options)
+    return generator.analyze()
 
 
 class BaseDiagramGenerator(ABC):
@@ -11,8 +88,24 @@ class BaseDiagramGenerator(ABC):
 
     Provides common functionality for analyzing Python code and exporting diagrams
     in various formats.
+
+    ``to_svg()`` and the export methods honour the ``budget`` option, see
+    :class:`renderschema.generators.budget.RenderBudget`; ``generate()``
+    always renders the full diagram.
     """
 
+    #: Cheapest value of the ``layout`` option, used as the last step of a
+    #: render budget; None if the generator has no layout choice.
+    SIMPLE_LAYOUT: Optional[str] = None
+
+    #: Rough render time per drawn element in seconds. Render budgets use it
+    #: to skip versions that would overrun ``max_seconds`` before any render
+    #: has been timed.
+    RENDER_SECONDS_PER_NODE = 1e-4
+
+    #: Per-layout overrides of ``RENDER_SECONDS_PER_NODE``.
+    LAYOUT_SECONDS_PER_NODE: Dict[str, float] = {}
+
     def __init__(self, target: Any, **options: Any) -> None:
         """
         Initialize the diagram generator.
@@ -26,6 +119,30 @@ class BaseDiagramGenerator(ABC):
         self.theme = options.get("theme", "light")
         self.color_scheme = options.get("color_scheme", "tailwind")
         self._diagram_data: Optional[Dict[str, Any]] = None
+        #: What the ``budget`` option degraded in the last ``to_svg()``.
+        self.last_render_report: Optional[Dict[str, Any]] = None
+        self._module_results: Optional[List[Dict[str, Any]]] = None
+        # Guards the lazy analysis steps so that threads sharing a generator
+        # analyze the target once.
+        self._analysis_lock = threading.RLock()
+
+    @classmethod
+    def from_analysis(
+        cls: Type[_GeneratorT], data: Dict[str, Any], **options: Any
+    ) -> _GeneratorT:
+        """
+        Create a generator that renders previously analyzed data.
+
+        Args:
+            data: Data in the format returned by ``analyze()``.
+            **options: Configuration options for diagram generation.
+
+        Returns:
+            A generator whose ``analyze()`` step is already done.
+        """
+        generator = cls(data.get("name"), **options)
+        generator._diagram_data = data
+        return generator
 
     @abstractmethod
     def analyze(self) -> Dict[str, Any]:
@@ -37,6 +154,40 @@ class BaseDiagramGenerator(ABC):
         """
         pass
 
+    def analyzed(self) -> Dict[str, Any]:
+        """
+        Return the analysis data, analyzing the target on first use.
+
+        Safe to call from several threads: the target is analyzed once and
+        every caller receives the same data.
+
+        Returns:
+            Data in the format returned by ``analyze()``.
+        """
+        data = self._diagram_data
+        if data is None:
+            with self._analysis_lock:
+                if self._diagram_data is None:
+                    self._diagram_data = self.analyze()
+                data = self._diagram_data
+        return data
+
+    def snapshot(self) -> "DiagramSnapshot":
+        """
+        Analyze the target and capture the result as an immutable snapshot.
+
+        Returns:
+            A ``DiagramSnapshot`` that renders this diagram with any theme or
+            options, from any number of threads.
+
+        Example:
+            >>> snap = diagram(mymodule, diagram_type="class").snapshot()
+            >>> light, dark = snap.render_many([{"theme": "light"}, {"theme": "dark"}])
+        """
+        from .snapshot import DiagramSnapshot
+
+        return DiagramSnapshot(type(self), self.analyzed(), self.options)
+
     @abstractmethod
     def generate(self) -> str:
         """
@@ -49,26 +200,36 @@ class BaseDiagramGenerator(ABC):
 
     def export(
         self,
-        output_path: Union[str, Path],
-        format: Optional[str] = None
-    ) -> None:
+        output_path: OutputTarget,
+        format: Optional[str] = None,
+        manifest: Optional["OutputManifest"] = None
+    ) -> bool:
         """
         Export the diagram to a file.
 
         Args:
-            output_path: Path where the diagram should be saved.
-            format: Output format ('svg', 'png', 'pdf', 'html'). 
-                   If None, inferred from file extension.
+            output_path: Path where the diagram should be saved, or a binary
+                file object to write it to.
+            format: Output format ('svg', 'svgz', 'png', 'pdf', 'html', 'mmd',
+                   'dot', 'puml'). If None, inferred from file extension;
+                   required for file objects.
+            manifest: Output manifest to consult and update. When the
+                generated SVG matches the fingerprint recorded for
+                ``output_path``, the file is neither rewritten nor
+                re-rasterized.
+
+        Returns:
+            True if the file was written, False if it was already current.
 
         Example:
             >>> generator.export("diagram.svg")
             >>> generator.export("diagram.png", format="png")
+            >>> generator.export(response_stream, format="svgz")
         """
-        from ..exporters import get_exporter
-
-        output_path = Path(output_path)
-        if format is None:
-            format = output_path.suffix.lstrip(".")
+        if not is_file_object(output_path):
+            output_path = Path(output_path)  # type: ignore[arg-type]
+            if format is None:
+                format = output_path.suffix.lstrip(".")
 
         if not format:
             raise ValueError(
@@ -76,25 +237,115 @@ class BaseDiagramGenerator(ABC):
                 "Please specify format or use a file extension."
             )
 
-        # Generate diagram if not already done
-        if self._diagram_data is None:
-            self._diagram_data = self.analyze()
+        return export_content(
+            self._content_for(format), output_path, format, self.theme, manifest
+        )
+
+    def to_bytes(self, format: str = "svg") -> bytes:
+        """
+        Render the diagram in an export format without writing a file.
+
+        Args:
+            format: Output format ('svg', 'svgz', 'png', 'pdf', 'html', 'mmd',
+                'dot', 'puml'); 'dzi' and 'xyz' return a zip of the tiles.
+
+        Returns:
+            The encoded diagram.
+
+        Example:
+            >>> body = diagram(MyClass).to_bytes("png")
+        """
+        from ..exporters import get_exporter
 
-        diagram_content = self.generate()
-        
         exporter = get_exporter(format)
-        exporter.export(diagram_content, output_path, theme=self.theme)
+        body: bytes = exporter.to_bytes(self._content_for(format), theme=self.theme)
+        return body
+
+    def _content_for(self, format: str) -> str:
+        """
+        Produce the content an exporter consumes.
+
+        Text exporters (Mermaid, DOT, PlantUML) convert the analysis data
+        themselves, so no layout or SVG is generated for them.
+        """
+        from ..exporters import get_exporter
+
+        exporter = get_exporter(format)
+        if getattr(exporter, "requires_svg", True):
+            return self.to_svg()
+        content: str = exporter.render(self.analyzed())
+        return content
+
+    def iter_svg(self, window: Optional[int] = None) -> Iterator[str]:
+        """
+        Generate the diagram as a sequence of SVG chunks.
+
+        Generators whose layout allows it analyze and render incrementally,
+        so memory is bounded by ``window`` rather than by the size of the
+        diagram; joining the chunks yields exactly ``to_svg()``. Other
+        generators, and every generator given a ``budget`` option, yield the
+        complete ``to_svg()`` as a single chunk.
+
+        Args:
+            window: Maximum number of modules analyzed ahead of rendering
+                when streaming a package.
+
+        Yields:
+            Consecutive pieces of SVG markup.
+        """
+        yield self.to_svg()
+
+    def stream_export(
+        self,
+        output_path: OutputTarget,
+        window: Optional[int] = None,
+        format: Optional[str] = None
+    ) -> None:
+        """
+        Export the diagram as SVG while it is being generated.
+
+        Args:
+            output_path: Path where the SVG file should be saved, or a binary
+                file object to write it to.
+            window: See ``iter_svg()``.
+            format: ``'svg'`` or ``'svgz'``; inferred from the file extension
+                when omitted, and ``'svg'`` for file objects.
+
+        Raises:
+            ValueError: If the format cannot be written incrementally.
+
+        Example:
+            >>> diagram(huge_package, recursive=True).stream_export("huge.svgz")
+        """
+        from ..exporters import get_exporter
+
+        if not is_file_object(output_path):
+            output_path = Path(output_path)  # type: ignore[arg-type]
+            if format is None:
+                format = output_path.suffix.lstrip(".") or "svg"
+        exporter = get_exporter(format or "svg")
+        if not hasattr(exporter, "export_stream"):
+            raise ValueError(f"Format {format} does not support streaming export")
+        exporter.export_stream(self.iter_svg(window), output_path)
 
     def to_svg(self) -> str:
         """
         Generate and return the diagram as SVG string.
 
+        With a ``budget`` option the diagram is rendered within the budget
+        and ``last_render_report`` describes what was degraded.
+
         Returns:
             SVG markup as a string.
         """
-        if self._diagram_data is None:
-            self._diagram_data = self.analyze()
-        return self.generate()
+        budget = self.options.get("budget")
+        if budget is None:
+            return self.generate()
+        from .budget import RenderBudget, render_within_budget
+
+        svg, report = render_within_budget(self, RenderBudget.coerce(budget))
+        self.last_render_report = report
+        return svg
 
     def to_html(self, interactive: bool = True) -> str:
         """
@@ -111,3 +362,108 @@ class BaseDiagramGenerator(ABC):
         svg_content = self.to_svg()
         exporter = HTMLExporter()
         return exporter.to_string(svg_content, interactive=interactive, theme=self.theme)
+
+    def _is_recursive_package(self, target: Any) -> bool:
+        """Return whether ``target`` is a package to be analyzed recursively."""
+        return bool(self.options.get("recursive")) and hasattr(target, "__path__")
+
+    def _analyze_package_modules(self, package: Any) -> List[Dict[str, Any]]:
+        """
+        Analyze every module of a package in isolated import workers.
+
+        Honours the ``max_depth``, ``include``, ``exclude``, ``workers``,
+        ``import_timeout`` and ``start_method`` options.
+
+        Returns:
+            Per-module results as produced by
+            :func:`renderschema.analysis.packages.analyze_modules`.
+        """
+        return list(self._iter_package_modules(package))
+
+    def _iter_package_modules(
+        self, package: Any, window: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily analyze the modules of a package, yielding results in order.
+
+        Args:
+            package: The package to walk.
+            window: Maximum number of modules in flight or buffered.
+        """
+        from ..analysis.packages import iter_module_results, iter_submodules
+
+        names = iter_submodules(
+            package,
+            max_depth=self.options.get("max_depth"),
+            include=self.options.get("include"),
+            exclude=self.options.get("exclude"),
+        )
+        module_options = {
+            key: value for key, value in self.options.items()
+            if key not in _PACKAGE_OPTIONS
+        }
+        return iter_module_results(
+            names,
+            partial(_analyze_module_in_worker, type(self), module_options),
+            workers=self.options.get("workers"),
+            timeout=self.options.get("import_timeout", 30.0),
+            start_method=self.options.get("start_method", "spawn"),
+            window=window,
+        )
+
+    def _merge_module_results(
+        self, name: str, results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge per-module analysis results into one diagram's data.
+
+        Generators that support recursive package analysis override this.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support package analysis"
+        )
+
+    def subpackage_diagrams(self) -> Dict[str, "BaseDiagramGenerator"]:
+        """
+        Split a recursively analyzed package into one diagram per subpackage.
+
+        Modules directly inside the package are grouped under the package
+        itself; everything else is grouped by its direct subpackage.
+
+        Returns:
+            Mapping of subpackage name to a generator ready for export.
+
+        Example:
+            >>> gen = diagram(mypackage, recursive=True)
+            >>> for name, sub in gen.subpackage_diagrams().items():
+            ...     sub.export(f"{name}.svg")
+        """
+        from ..analysis.packages import subpackage_of
+
+        if not self._is_recursive_package(self.target):
+            raise TypeError(
+                "subpackage_diagrams() requires a package with recursive=True"
+            )
+
+        package = self.target.__name__
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for result in self._package_results():
+            subpackage = subpackage_of(result["module"], package)
+            groups.setdefault(subpackage, []).append(result)
+
+        return {
+            group: type(self).from_analysis(
+                self._merge_module_results(group, results), **self.options
+            )
+            for group, results in sorted(groups.items())
+        }
+
+    def _package_results(self) -> List[Dict[str, Any]]:
+        """Return the per-module results of the package, analyzing it once."""
+        results = self._module_results
+        if results is None:
+            with self._analysis_lock:
+                if self._module_results is None:
+                    self._module_results = self._analyze_package_modules(self.target)
+                results = self._module_results
+        return results
@@ -0,0 +1,360 @@
+"""Render budgets that bound the size and latency of ``generate()``."""
+
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from xml.sax.saxutils import escape
+
+from ..analysis.partition import partition_by_package
+from ..themes import stylesheet
+
+if TYPE_CHECKING:
+    from .base import BaseDiagramGenerator
+
+
+class RenderBudget:
+    """
+    Limits on the diagram a single ``to_svg()`` call may produce.
+
+    Pass a budget as the ``budget`` option of any generator; ``to_svg()``
+    and the export methods honour it, while ``generate()`` always renders
+    the full diagram. When the full
+    diagram would exceed it, the generator renders progressively cheaper
+    versions instead: without class members, with classes summarized per
+    subpackage, and with the generator's simplest layout. If none fits, or
+    time runs out, a placeholder naming the diagram's size is returned.
+
+    Analysis of the target counts toward ``max_seconds`` but is never cut
+    short. Renders are not interrupted either; instead a version is skipped
+    when its estimated render time exceeds the time left.
+
+    The generator's ``last_render_report`` describes what was degraded, and
+    the SVG starts with a comment saying the same.
+
+    Example:
+        >>> budget = RenderBudget(max_nodes=300, max_bytes=2_000_000, max_seconds=0.5)
+        >>> svg = diagram(big_package, diagram_type="class", recursive=True,
+        ...               budget=budget).to_svg()
+    """
+
+    def __init__(
+        self,
+        max_nodes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the budget; ``None`` leaves a dimension unlimited.
+
+        Args:
+            max_nodes: Maximum number of drawn elements: classes plus the
+                members listed in their boxes, or the generator's nodes.
+            max_bytes: Maximum size of the SVG in bytes (UTF-8), including
+                the comment describing the degradations.
+            max_seconds: Wall time after which no further render is started.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        for name, value in (
+            ("max_nodes", max_nodes),
+            ("max_bytes", max_bytes),
+            ("max_seconds", max_seconds),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        self.max_nodes = max_nodes
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+
+    @classmethod
+    def coerce(cls, budget: Union["RenderBudget", Mapping[str, Any]]) -> "RenderBudget":
+        """Return ``budget`` as a ``RenderBudget``, accepting a mapping of limits."""
+        if isinstance(budget, RenderBudget):
+            return budget
+        if isinstance(budget, Mapping):
+            return cls(**budget)
+        raise TypeError(
+            f"budget must be a RenderBudget or a mapping, got {type(budget)}"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the limits as a dictionary."""
+        return {
+            "max_nodes": self.max_nodes,
+            "max_bytes": self.max_bytes,
+            "max_seconds": self.max_seconds,
+        }
+
+    def __repr__(self) -> str:
+        limits = ", ".join(f"{key}={value}" for key, value in self.as_dict().items())
+        return f"RenderBudget({limits})"
+
+
+def count_nodes(data: Mapping[str, Any]) -> int:
+    """
+    Count the elements a diagram draws.
+
+    Classes count once each, plus one per attribute or method listed in
+    their boxes. Other diagrams count their nodes, groups or participants.
+    """
+    if "classes" in data:
+        return sum(1 + len(_members(cls)) for cls in data["classes"])
+    if "attributes" in data or "methods" in data:
+        return 1 + len(_members(data))
+    for key in ("nodes", "groups", "participants", "roots"):
+        if key in data:
+            return len(data[key])
+    return 1
+
+
+def _members(cls: Mapping[str, Any]) -> List[Any]:
+    """Members drawn in a class box; plain name lists are not drawn."""
+    return [
+        member for key in ("attributes", "methods") for member in cls.get(key, ())
+        if isinstance(member, Mapping)
+    ]
+
+
+def collapse_members(data: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Drop the attributes and methods drawn in class boxes.
+
+    Returns:
+        The reduced data, or None if no class box lists members.
+    """
+    def collapse(cls: Mapping[str, Any]) -> Dict[str, Any]:
+        return {**cls, "attributes": [], "methods": []} if _members(cls) else dict(cls)
+
+    if "classes" in data:
+        if not any(_members(cls) for cls in data["classes"]):
+            return None
+        return {**data, "classes": [collapse(cls) for cls in data["classes"]]}
+    if _members(data):
+        return collapse(data)
+    return None
+
+
+def summarize_packages(data: Mapping[str, Any], depth: int) -> Optional[Dict[str, Any]]:
+    """
+    Replace classes by one box per package, relating packages instead.
+
+    Args:
+        data: Class or UML diagram data.
+        depth: Number of leading module name components to group by.
+
+    Returns:
+        The reduced data, or None if grouping does not reduce the classes.
+    """
+    # UML class descriptions have no ids; their names serve instead.
+    classes = [
+        {"id": cls.get("id", cls["name"]), "module": cls["module"]}
+        for cls in data.get("classes", ()) if cls.get("module")
+    ]
+    clusters = partition_by_package(classes, depth)
+    if len(clusters) >= len(data.get("classes", ())):
+        return None
+
+    package_of = {
+        member: package for package, members in clusters.items() for member in members
+    }
+    links: Dict[Tuple[str, str], int] = {}
+    for rel in data.get("relationships", ()):
+        source, target = package_of.get(rel["from"]), package_of.get(rel["to"])
+        if source is not None and target is not None and source != target:
+            links[(source, target)] = links.get((source, target), 0) + 1
+    summary: Dict[str, Any] = {
+        **data,
+        "classes": [
+            {
+                "id": package,
+                "name": f"{package} ({len(members)} classes)",
+                "module": package,
+                "bases": [],
+                "base_ids": [],
+                "associations": [],
+                "attributes": [],
+                "methods": [],
+            }
+            for package, members in clusters.items()
+        ],
+    }
+    if "relationships" in data:
+        summary["relationships"] = [
+            {"type": "association", "from": source, "to": target, "label": str(count)}
+            for (source, target), count in sorted(links.items())
+        ]
+    return summary
+
+
+def _steps(
+    generator: "BaseDiagramGenerator",
+    data: Dict[str, Any],
+    options: Dict[str, Any],
+) -> Iterator[Tuple[List[str], Dict[str, Any], Dict[str, Any]]]:
+    """Yield ``(degradations, data, options)``, each cheaper than the last."""
+    applied: List[str] = []
+    yield list(applied), data, options
+
+    collapsed = collapse_members(data)
+    if collapsed is not None:
+        data = collapsed
+        applied.append("collapsed members")
+        yield list(applied), data, options
+
+    # Coarser and coarser package summaries, down to one box per top-level package.
+    modules = [cls["module"] for cls in data.get("classes", ()) if cls.get("module")]
+    deepest = max((module.count(".") + 1 for module in modules), default=0)
+    shown = len(data.get("classes", ()))
+    summary, label = None, ""
+    for depth in range(deepest, 0, -1):
+        summarized = summarize_packages(data, depth)
+        if summarized is not None and len(summarized["classes"]) < shown:
+            summary, shown = summarized, len(summarized["classes"])
+            label = f"summarized packages (depth {depth})"
+            yield applied + [label], summary, options
+    if summary is not None:
+        data = summary
+        applied.append(label)
+
+    simple = generator.SIMPLE_LAYOUT
+    if simple is not None and options.get("layout", simple) != simple:
+        options = {**options, "layout": simple}
+        applied.append(f"{simple} layout")
+        yield list(applied), data, options
+
+
+def render_within_budget(
+    generator: "BaseDiagramGenerator", budget: RenderBudget
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Render a generator's diagram within a budget.
+
+    Steps over the node limit are skipped without rendering, and so are
+    steps whose render would overrun ``max_seconds``. Render time is
+    estimated per element, from the last timed render with the same layout
+    or, before one, from the generator's ``RENDER_SECONDS_PER_NODE`` and
+    ``LAYOUT_SECONDS_PER_NODE``. The target's analysis happens first and
+    counts toward ``max_seconds``.
+
+    Args:
+        generator: The generator whose ``budget`` option is being applied.
+        budget: The limits.
+
+    Returns:
+        ``(svg, report)``; the report lists the ``degraded`` steps, the
+        drawn ``nodes``, ``bytes`` and ``seconds`` taken, and whether the
+        result is ``within_budget``.
+    """
+    started = time.perf_counter()
+    options = {
+        key: value for key, value in generator.options.items() if key != "budget"
+    }
+    data = generator.analyzed()
+    full_nodes = count_nodes(data)
+
+    def remaining() -> float:
+        if budget.max_seconds is None:
+            return float("inf")
+        return budget.max_seconds - (time.perf_counter() - started)
+
+    timed: Dict[Optional[str], float] = {}
+    for applied, step_data, step_options in _steps(generator, data, options):
+        nodes = count_nodes(step_data)
+        if budget.max_nodes is not None and nodes > budget.max_nodes:
+            continue
+        if remaining() <= 0:
+            break
+        layout: Optional[str] = step_options.get("layout")
+        seconds_per_node = timed.get(layout)
+        if seconds_per_node is None:
+            seconds_per_node = generator.RENDER_SECONDS_PER_NODE
+            if layout is not None:
+                seconds_per_node = generator.LAYOUT_SECONDS_PER_NODE.get(
+                    layout, seconds_per_node
+                )
+        if seconds_per_node * nodes > remaining():
+            continue
+        render_started = time.perf_counter()
+        svg = type(generator).from_analysis(step_data, **step_options).generate()
+        timed[layout] = (time.perf_counter() - render_started) / max(nodes, 1)
+        svg, report = _finish(svg, applied, nodes, full_nodes, started, budget)
+        if budget.max_bytes is None or report["bytes"] <= budget.max_bytes:
+            return svg, report
+
+    svg = _placeholder(generator, data.get("name"), full_nodes)
+    return _finish(svg, ["placeholder"], 0, full_nodes, started, budget)
+
+
+def _finish(
+    svg: str,
+    applied: List[str],
+    nodes: int,
+    full_nodes: int,
+    started: float,
+    budget: RenderBudget,
+) -> Tuple[str, Dict[str, Any]]:
+    """Annotate a render and report on it; ``bytes`` counts the comment."""
+    elapsed = time.perf_counter() - started
+    report: Dict[str, Any] = {
+        "degraded": applied,
+        "nodes": nodes,
+        "full_nodes": full_nodes,
+        "bytes": 0,
+        "seconds": elapsed,
+    }
+    svg = _annotate(svg, report)
+    size = len(svg.encode("utf-8"))
+    report["bytes"] = size
+    report["within_budget"] = (
+        (budget.max_bytes is None or size <= budget.max_bytes)
+        and (budget.max_seconds is None or elapsed <= budget.max_seconds)
+    )
+    report["budget"] = budget.as_dict()
+    return svg, report
+
+
+def _placeholder(
+    generator: "BaseDiagramGenerator", name: Optional[str], nodes: int
+) -> str:
+    """A minimal diagram standing in for one that does not fit the budget."""
+    title = escape(f"{name}: " if name else "") + f"{nodes} elements"
+    return "\n".join([
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 120">',
+        stylesheet("""\
+        .budget-box { fill: $surface; stroke: $divider; stroke-width: 2; }
+        .budget-title { fill: $text; font-family: Arial, sans-serif; font-size: 16px;
+            font-weight: bold; }
+        .budget-text { fill: $text_muted; font-family: Arial, sans-serif;
+            font-size: 13px; }
+""", "", generator.theme, generator.color_scheme),
+        '<rect x="10" y="10" width="780" height="100" rx="6" class="budget-box"/>',
+        f'<text x="30" y="50" class="budget-title">{title}</text>',
+        '<text x="30" y="80" class="budget-text">'
+        "This diagram exceeds the render budget. "
+        "Narrow the target or raise the budget.</text>",
+        "</svg>",
+    ])
+
+
+def _annotate(svg: str, report: Mapping[str, Any]) -> str:
+    """Insert a comment describing the applied degradations after the declaration."""
+    degraded = ", ".join(report["degraded"]) or "none"
+    comment = (
+        f"<!-- render budget: degraded: {degraded}; {report['nodes']} of "
+        f"{report['full_nodes']} elements, {report['seconds']:.3f} s -->"
+    )
+    if svg.startswith("<?xml"):
+        declaration, _, rest = svg.partition("\n")
+        return f"{declaration}\n{comment}\n{rest}"
+    return f"{comment}\n{svg}"
@@ -1,9 +1,37 @@
 """Class diagram generator focused on relationships between multiple classes."""
 
-from typing import Any, Dict, List, Type
 import inspect
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from .base import BaseDiagramGenerator
+from ..analysis.partition import (
+    OVERVIEW_PAGE,
+    build_pages,
+    detect_communities,
+    page_stem,
+    partition_by_package,
+    split_oversized,
+)
+from ..analysis.types import TypeIndex, extract_relationships, qualified_name
+from ..layout import OrthogonalRouter, force_layout, layered_layout, path_data
+from ..layout.routing import Box
+from ..themes import stylesheet
+from .base import BaseDiagramGenerator, export_content
+
+if TYPE_CHECKING:
+    from ..analysis.history import HistoryAnalyzer
+    from ..analysis.index import RelationshipIndex
+    from ..exporters.manifest import OutputManifest
 
 
 class ClassDiagramGenerator(BaseDiagramGenerator):
@@ -14,6 +42,21 @@ class ClassDiagramGenerator(BaseDiagramGenerator):
     individual class details.
     """
 
+    SIMPLE_LAYOUT = "vertical"
+    RENDER_SECONDS_PER_NODE = 5e-5
+    LAYOUT_SECONDS_PER_NODE = {"force": 2e-3}
+
+    def __init__(self, target: Any, **options: Any) -> None:
+        """
+        Initialize the class diagram generator.
+
+        Args:
+            target: A module or a list of classes.
+            **options: Configuration options for diagram generation.
+        """
+        super().__init__(target, **options)
+        self._type_index = TypeIndex()
+
     def analyze(self) -> Dict[str, Any]:
         """
         Analyze classes to extract relationships.
@@ -21,24 +64,26 @@ class ClassDiagramGenerator(BaseDiagramGenerator):
         Returns:
             Dictionary containing classes and their relationships.
         """
-        if inspect.ismodule(self.target):
+        if self._is_recursive_package(self.target):
+            return self._merge_module_results(
+                self.target.__name__, self._package_results()
+            )
+        elif inspect.ismodule(self.target):
             return self._analyze_module_relationships(self.target)
         elif isinstance(self.target, (list, tuple)):
             return self._analyze_class_list(self.target)
         else:
             raise TypeError(
-                "ClassDiagramGenerator requires a module or list of classes"
+                "ClassDiagramGenerator requires a module, package or list of classes"
             )
 
     def _analyze_module_relationships(self, module: Any) -> Dict[str, Any]:
         """Analyze relationships between classes in a module."""
-        classes = []
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and obj.__module__ == module.__name__:
-                classes.append({
-                    "name": obj.__name__,
-                    "bases": [b.__name__ for b in obj.__bases__ if b != object],
-                })
+        module_classes = [
+            obj for name, obj in inspect.getmembers(module)
+            if inspect.isclass(obj) and obj.__module__ == module.__name__
+        ]
+        classes = self._describe_classes(module_classes)
 
         return {
             "type": "module",
@@ -47,15 +92,26 @@ class ClassDiagramGenerator(BaseDiagramGenerator):
             "relationships": self._extract_relationships(classes),
         }
 
+    def _merge_module_results(
+        self, name: str, results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge recursively analyzed modules, relating classes across modules."""
+        from ..analysis.packages import merge_classes, module_statuses
+
+        classes = merge_classes(results)
+        return {
+            "type": "package",
+            "name": name,
+            "classes": classes,
+            "relationships": self._extract_relationships(classes),
+            "modules": module_statuses(results),
+        }
+
     def _analyze_class_list(self, classes: List[Type]) -> Dict[str, Any]:
         """Analyze relationships in a list of classes."""
-        class_data = []
-        for cls in classes:
-            if inspect.isclass(cls):
-                class_data.append({
-                    "name": cls.__name__,
-                    "bases": [b.__name__ for b in cls.__bases__ if b != object],
-                })
+        class_data = self._describe_classes(
+            [cls for cls in classes if inspect.isclass(cls)]
+        )
 
         return {
             "type": "class_list",
@@ -63,21 +119,47 @@ class ClassDiagramGenerator(BaseDiagramGenerator):
             "relationships": self._extract_relationships(class_data),
         }
 
-    def _extract_relationships(self, classes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extract inheritance relationships between classes."""
-        relationships = []
-        class_names = {cls["name"] for cls in classes}
-
+    def _describe_classes(self, classes: List[Type]) -> List[Dict[str, Any]]:
+        """Index the given classes and describe each with its candidate edges."""
         for cls in classes:
-            for base in cls["bases"]:
-                if base in class_names:
-                    relationships.append({
-                        "type": "inheritance",
-                        "from": cls["name"],
-                        "to": base,
-                    })
+            self._type_index.add(cls)
+        return [self._describe_class(cls) for cls in classes]
+
+    def _describe_class(self, cls: Type) -> Dict[str, Any]:
+        """
+        Describe a class with its bases and type-hint derived associations.
+
+        Association targets are qualified names; edges to classes that are not
+        part of the diagram are dropped later by ``_extract_relationships``.
+        """
+        associations = []
+        index = self._type_index
+        for attribute, (hint, declared_by) in index.resolve_hints(cls).items():
+            for kind, target in index.relationship_targets(hint, declared_by):
+                associations.append({
+                    "type": kind,
+                    "to": target,
+                    "attribute": attribute,
+                    "declared_by": qualified_name(declared_by),
+                })
 
-        return relationships
+        return {
+            "id": qualified_name(cls),
+            "name": cls.__name__,
+            "module": cls.__module__,
+            "bases": [b.__name__ for b in cls.__bases__ if b is not object],
+            "base_ids": [qualified_name(b) for b in cls.__bases__ if b is not object],
+            "associations": associations,
+            "methods": sorted(
+                name for name, value in vars(cls).items()
+                if inspect.isfunction(value)
+                or isinstance(value, (staticmethod, classmethod))
+            ),
+        }
+
+    def _extract_relationships(self, classes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract inheritance and association relationships between classes."""
+        return extract_relationships(classes)
 
     def generate(self) -> str:
         """
@@ -86,77 +168,378 @@ class ClassDiagramGenerator(BaseDiagramGenerator):
         Returns:
             SVG string representing the class diagram.
         """
-        if self._diagram_data is None:
-            self._diagram_data = self.analyze()
+        return self._render(self.analyzed())
+
+    def _render(self, data: Dict[str, Any], page_link: str = "{page}.svg") -> str:
+        """
+        Render analyzed (or partitioned) class data as SVG.
 
+        Args:
+            data: Data with ``classes`` and ``relationships``.
+            page_link: Link target for classes that refer to another page,
+                formatted with the page's file stem.
+        """
+        classes = data["classes"]
+        box_width, box_height = 200, 60
+        positions = self._layout(data, box_width, box_height)
+        boxes: Dict[str, Box] = {
+            node: (x, y, box_width, box_height) for node, (x, y) in positions.items()
+        }
+        router = OrthogonalRouter(boxes)
+
+        edge_parts = []
+        max_x = max((x + w for x, _, w, _ in boxes.values()), default=0)
+        max_y = max((y + h for _, y, _, h in boxes.values()), default=0)
+        min_x = min_y = 0.0
+        for rel in data["relationships"]:
+            if rel["from"] not in boxes or rel["to"] not in boxes:
+                continue
+            points = router.route(rel["from"], rel["to"])
+            edge_parts.append(
+                self._generate_relationship(rel["type"], points, rel.get("change"))
+            )
+            for x, y in points:
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+
+        min_x, min_y = min(0, min_x - 20), min(0, min_y - 20)
+        width = max(800, max_x + 50) - min_x
+        height = max(600, max_y + 50) - min_y
         svg_parts = [
             '<?xml version="1.0" encoding="UTF-8"?>',
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 600">',
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{round(min_x)} {round(min_y)} {round(width)} {round(height)}">',
             self._generate_styles(),
         ]
-
-        # Simple layout: vertical arrangement
-        classes = self._diagram_data["classes"]
-        y_offset = 50
-        class_positions = {}
-
         for cls_data in classes:
-            x = 200
-            svg_parts.append(self._generate_class_box(cls_data, x, y_offset))
-            class_positions[cls_data["name"]] = (x + 100, y_offset + 30)
-            y_offset += 120
-
-        # Draw relationships
-        for rel in self._diagram_data["relationships"]:
-            if rel["type"] == "inheritance":
-                from_pos = class_positions.get(rel["from"])
-                to_pos = class_positions.get(rel["to"])
-                if from_pos and to_pos:
-                    svg_parts.append(self._generate_inheritance_arrow(from_pos, to_pos))
+            x, y = positions[self._node_id(cls_data)]
+            svg_parts.append(self._generate_class_box(cls_data, x, y, page_link))
+        svg_parts.extend(edge_parts)
 
         svg_parts.append("</svg>")
         return "\n".join(svg_parts)
 
+    @staticmethod
+    def _node_id(cls_data: Dict[str, Any]) -> str:
+        """Return the identifier relationships use to refer to a class."""
+        node_id: str = cls_data.get("id", cls_data["name"])
+        return node_id
+
+    def _layout(
+        self, data: Dict[str, Any], box_width: int, box_height: int
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Place class boxes according to the ``layout`` option.
+
+        ``"vertical"`` (default) stacks classes in one column; ``"layered"``
+        puts base classes above their subclasses; ``"force"`` places related
+        classes near each other with a force-directed simulation seeded by
+        the ``seed`` option.
+        """
+        nodes = [self._node_id(cls_data) for cls_data in data["classes"]]
+        layout = self.options.get("layout", "vertical")
+        if layout == "vertical":
+            return {node: (200, 50 + index * 120) for index, node in enumerate(nodes)}
+        if layout == "layered":
+            inheritance = [
+                (rel["from"], rel["to"]) for rel in data["relationships"]
+                if rel["type"] == "inheritance"
+            ]
+            return layered_layout(nodes, inheritance, box_width, box_height)
+        if layout == "force":
+            return force_layout(
+                nodes,
+                [(rel["from"], rel["to"]) for rel in data["relationships"]],
+                box_width,
+                box_height,
+                seed=self.options.get("seed", 0),
+            )
+        raise ValueError(
+            f"Unknown layout: {layout}. Available layouts: vertical, layered, force"
+        )
+
+    def partition(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Partition the class graph into clusters, one diagram page each.
+
+        Uses the ``partition`` option: ``"package"`` (default) groups classes
+        by module, truncated to ``package_depth`` name components if given;
+        ``"community"`` runs label propagation over the relationship graph.
+        Clusters larger than ``max_cluster_size`` (default 50) are split.
+
+        Returns:
+            Mapping of page name to page data. The ``"overview"`` page holds
+            one node per cluster; every other page holds a cluster's classes
+            plus stubs for classes on other pages that they relate to. A
+            cluster that would share a page's file name gets a ``-2`` suffix.
+        """
+        data = self.analyzed()
+        classes = data["classes"]
+        relationships = data["relationships"]
+
+        strategy = self.options.get("partition", "package")
+        if strategy == "package":
+            clusters = partition_by_package(classes, self.options.get("package_depth"))
+        elif strategy == "community":
+            clusters = detect_communities(
+                [cls["id"] for cls in classes],
+                [(rel["from"], rel["to"]) for rel in relationships],
+                seed=self.options.get("seed", 0),
+            )
+        else:
+            raise ValueError(
+                f"Unknown partition strategy: {strategy}. "
+                "Available strategies: package, community"
+            )
+
+        clusters = split_oversized(clusters, self.options.get("max_cluster_size", 50))
+        pages, overview = build_pages(classes, relationships, clusters)
+        return {OVERVIEW_PAGE: overview, **pages}
+
+    def render_pages(
+        self, page_link: str = "{page}.svg", workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Render every partition page (see ``partition()``) as SVG in parallel.
+
+        Args:
+            page_link: Link target used by overview nodes and stubs, formatted
+                with the referenced page's file stem.
+            workers: Maximum number of rendering threads.
+
+        Returns:
+            Mapping of page file stem to SVG markup.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        pages = {page_stem(name): data for name, data in self.partition().items()}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rendered = pool.map(
+                lambda data: self._render(data, page_link), pages.values()
+            )
+            return dict(zip(pages, rendered))
+
+    def export_pages(
+        self,
+        output_dir: Union[str, Path],
+        format: str = "svg",
+        workers: Optional[int] = None,
+        manifest: Optional["OutputManifest"] = None,
+    ) -> List[Path]:
+        """
+        Partition the diagram and export each page as a separate file.
+
+        Pages are rendered and exported concurrently. Stubs and overview
+        nodes link to the file of the page they refer to.
+
+        Args:
+            output_dir: Directory to write the pages to.
+            format: Output format of each page ('svg', 'png', 'pdf', 'html').
+            workers: Maximum number of concurrent page exports.
+            manifest: Output manifest used to skip pages whose content is
+                unchanged since the last export.
+
+        Returns:
+            Paths of all pages, the overview page first.
+
+        Example:
+            >>> gen = diagram(mypackage, diagram_type="class", recursive=True)
+            >>> gen.export_pages("docs/classes", format="svg")
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        output_dir = Path(output_dir)
+        pages = {page_stem(name): data for name, data in self.partition().items()}
+        page_link = "{page}." + format
+
+        def export_page(stem: str) -> Path:
+            path = output_dir / f"{stem}.{format}"
+            svg = self._render(pages[stem], page_link)
+            export_content(svg, path, format, self.theme, manifest)
+            return path
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(export_page, pages))
+
+    @classmethod
+    def from_index(
+        cls,
+        index: "RelationshipIndex",
+        center: str,
+        hops: int = 1,
+        kinds: Optional[List[str]] = None,
+        direction: str = "both",
+        **options: Any,
+    ) -> "ClassDiagramGenerator":
+        """
+        Create a generator for the neighbourhood of one class in an index.
+
+        Args:
+            index: A ``RelationshipIndex`` built from earlier analysis.
+            center: Qualified id or unique short name of the center class.
+            hops: Maximum number of relationships from the center class.
+            kinds: Relationship types to follow; defaults to all.
+            direction: ``"out"``, ``"in"`` or ``"both"``.
+            **options: Configuration options for diagram generation.
+
+        Returns:
+            A generator that renders the neighbourhood without re-analysis.
+        """
+        data = index.neighbourhood(center, hops=hops, kinds=kinds, direction=direction)
+        return cls.from_analysis(data, **options)
+
+    @classmethod
+    def export_history(
+        cls,
+        repository: Union[str, Path, "HistoryAnalyzer"],
+        output_dir: Union[str, Path],
+        revisions: Optional[Iterable[str]] = None,
+        root: str = "",
+        format: str = "svg",
+        diffs: bool = False,
+        manifest: Optional["OutputManifest"] = None,
+        **options: Any,
+    ) -> List[Path]:
+        """
+        Export one class diagram per revision of a git repository.
+
+        Sources are read from git objects without checking anything out.
+        Files are analyzed once per distinct blob and revisions with an
+        identical source tree reuse the rendered diagram, so the cost grows
+        with the number of distinct files and trees rather than revisions.
+
+        Args:
+            repository: Repository path, or a ``HistoryAnalyzer`` whose
+                caches should be reused.
+            output_dir: Directory to write the diagrams to.
+            revisions: Revisions to render; defaults to all tags, oldest first.
+            root: Directory that module names are relative to, e.g. ``"src"``.
+                Ignored when ``repository`` is a ``HistoryAnalyzer``.
+            format: Output format of each diagram.
+            diffs: Also export an animated diff between consecutive revisions.
+            manifest: Output manifest used to skip unchanged files.
+            **options: Configuration options for each diagram.
+
+        Returns:
+            Paths of the exported files in revision order, each diff following
+            the later of its two revisions.
+
+        Example:
+            >>> ClassDiagramGenerator.export_history(
+            ...     ".", "docs/history", root="src", layout="layered", diffs=True
+            ... )
+        """
+        from ..analysis.history import HistoryAnalyzer, diff_snapshots
+
+        history = (
+            repository if isinstance(repository, HistoryAnalyzer)
+            else HistoryAnalyzer(repository, root)
+        )
+        output_dir = Path(output_dir)
+        theme = options.get("theme", "light")
+        rendered: Dict[str, str] = {}
+        paths: List[Path] = []
+        previous: Optional[Dict[str, Any]] = None
+        try:
+            if revisions is None:
+                revisions = history.repository.tags()
+            for snapshot in history.snapshots(revisions):
+                svg = rendered.get(snapshot["tree"])
+                if svg is None:
+                    svg = cls.from_analysis(snapshot, **options).to_svg()
+                    rendered[snapshot["tree"]] = svg
+                path = output_dir / f"{page_stem(snapshot['name'])}.{format}"
+                export_content(svg, path, format, theme, manifest)
+                paths.append(path)
+
+                if (
+                    diffs
+                    and previous is not None
+                    and previous["tree"] != snapshot["tree"]
+                ):
+                    diff = diff_snapshots(previous, snapshot)
+                    path = output_dir / f"{page_stem(diff['name'])}.{format}"
+                    svg = cls.from_analysis(diff, **options).to_svg()
+                    export_content(svg, path, format, theme, manifest)
+                    paths.append(path)
+                previous = snapshot
+        finally:
+            if history is not repository:
+                history.close()
+        return paths
+
     def _generate_styles(self) -> str:
         """Generate CSS styles for the class diagram."""
-        if self.theme == "dark":
-            return """
-<defs>
-    <style>
-        .class-box { fill: #1f2937; stroke: #8b5cf6; stroke-width: 2; }
-        .class-name { fill: #f9fafb; font-family: Arial, sans-serif; font-size: 14px; font-weight: bold; }
-        .inheritance-line { stroke: #8b5cf6; stroke-width: 2; fill: none; marker-end: url(#triangle); }
-    </style>
+        return stylesheet("""\
+        .class-box { fill: $surface; stroke: $relation; stroke-width: 2; }
+        .class-box.stub { stroke-dasharray: 6 4; fill: none; }
+        .class-name { fill: $text; font-family: Arial, sans-serif; font-size: 14px;
+            font-weight: bold; }
+        .inheritance-line { stroke: $relation; stroke-width: 2; fill: none;
+            marker-end: url(#triangle); }
+        .association-line { stroke: $relation; stroke-width: 1.5; fill: none; }
+        .composition { marker-start: url(#diamond-filled); }
+        .aggregation { marker-start: url(#diamond-hollow); }
+        .association { marker-end: url(#arrow-open); }
+        .added { animation: rs-added 1.2s ease-out both; }
+        .removed { animation: rs-removed 1.2s ease-in both; }
+        .added > .class-box, path.added { stroke: $added; }
+        .removed > .class-box, path.removed { stroke: $removed; stroke-dasharray: 4 3; }
+        @keyframes rs-added { from { opacity: 0; } to { opacity: 1; } }
+        @keyframes rs-removed { from { opacity: 1; } to { opacity: 0.35; } }
+""", """\
     <marker id="triangle" markerWidth="10" markerHeight="10" refX="10" refY="5" orient="auto">
-        <polygon points="0 0, 10 5, 0 10" fill="#8b5cf6" />
+        <polygon points="0 0, 10 5, 0 10" style="fill: $relation" />
     </marker>
-</defs>"""
-        else:
-            return """
-<defs>
-    <style>
-        .class-box { fill: #ffffff; stroke: #8b5cf6; stroke-width: 2; }
-        .class-name { fill: #1f2937; font-family: Arial, sans-serif; font-size: 14px; font-weight: bold; }
-        .inheritance-line { stroke: #8b5cf6; stroke-width: 2; fill: none; marker-end: url(#triangle); }
-    </style>
-    <marker id="triangle" markerWidth="10" markerHeight="10" refX="10" refY="5" orient="auto">
-        <polygon points="0 0, 10 5, 0 10" fill="#8b5cf6" />
+    <marker id="diamond-filled" markerWidth="14" markerHeight="8" refX="0" refY="4"
+            orient="auto">
+        <polygon points="0 4, 7 0, 14 4, 7 8" style="fill: $relation" />
+    </marker>
+    <marker id="diamond-hollow" markerWidth="14" markerHeight="8" refX="0" refY="4"
+            orient="auto">
+        <polygon points="0 4, 7 0, 14 4, 7 8" style="fill: none; stroke: $relation" />
+    </marker>
+    <marker id="arrow-open" markerWidth="10" markerHeight="10" refX="10" refY="5"
+            orient="auto">
+        <polyline points="0 0, 10 5, 0 10" style="fill: none; stroke: $relation" />
     </marker>
-</defs>"""
+""", self.theme, self.color_scheme)
 
-    def _generate_class_box(self, cls_data: Dict[str, Any], x: int, y: int) -> str:
+    def _generate_class_box(
+        self,
+        cls_data: Dict[str, Any],
+        x: float,
+        y: float,
+        page_link: str = "{page}.svg"
+    ) -> str:
         """Generate a simple class box showing just the name."""
         width = 200
         height = 60
-        return f'''<rect x="{x}" y="{y}" width="{width}" height="{height}" rx="4" class="class-box"/>
-<text x="{x + width/2}" y="{y + 35}" text-anchor="middle" class="class-name">{cls_data["name"]}</text>'''
+        box_class = "class-box stub" if cls_data.get("stub") else "class-box"
+        box = (
+            f'<rect x="{x}" y="{y}" width="{width}" height="{height}" rx="4" '
+            f'class="{box_class}"/>\n'
+            f'<text x="{x + width/2}" y="{y + 35}" text-anchor="middle" '
+            f'class="class-name">{cls_data["name"]}</text>'
+        )
+        if "change" in cls_data:
+            box = f'<g class="{cls_data["change"]}">\n{box}\n</g>'
+        if "page" in cls_data:
+            href = page_link.format(page=page_stem(cls_data["page"]))
+            return f'<a href="{href}">\n{box}\n</a>'
+        return box
 
-    def _generate_inheritance_arrow(
-        self, 
-        from_pos: tuple, 
-        to_pos: tuple
+    def _generate_relationship(
+        self,
+        kind: str,
+        points: List[Tuple[float, float]],
+        change: Optional[str] = None
     ) -> str:
-        """Generate an inheritance arrow between two classes."""
-        x1, y1 = from_pos
-        x2, y2 = to_pos
-        return f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" class="inheritance-line"/>'
+        """Generate an orthogonal path for a routed relationship."""
+        if kind == "inheritance":
+            css_class = "inheritance-line"
+        else:
+            css_class = f"association-line {kind}"
+        if change:
+            css_class += f" {change}"
+        return f'<path d="{path_data(points)}" class="{css_class}"/>'
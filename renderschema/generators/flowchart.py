@@ -5,6 +5,7 @@ import ast
 import inspect
 
 from .base import BaseDiagramGenerator
+from ..themes import stylesheet
 
 
 class FlowchartGenerator(BaseDiagramGenerator):
@@ -58,8 +59,7 @@ class FlowchartGenerator(BaseDiagramGenerator):
         Returns:
             SVG string representing the flowchart.
         """
-        if self._diagram_data is None:
-            self._diagram_data = self.analyze()
+        data = self.analyzed()
 
         svg_parts = [
             '<?xml version="1.0" encoding="UTF-8"?>',
@@ -69,7 +69,7 @@ class FlowchartGenerator(BaseDiagramGenerator):
 
         # Generate flowchart nodes
         y_offset = 50
-        for node in self._diagram_data["nodes"]:
+        for node in data["nodes"]:
             svg_parts.append(self._generate_node(node, 250, y_offset))
             y_offset += 100
 
@@ -78,30 +78,16 @@ class FlowchartGenerator(BaseDiagramGenerator):
 
     def _generate_styles(self) -> str:
         """Generate CSS styles for flowchart."""
-        if self.theme == "dark":
-            return """
-<defs>
-    <style>
-        .flow-node { fill: #1f2937; stroke: #10b981; stroke-width: 2; }
-        .flow-text { fill: #f9fafb; font-family: Arial, sans-serif; font-size: 14px; }
-        .flow-arrow { stroke: #10b981; stroke-width: 2; fill: none; marker-end: url(#arrowhead); }
-    </style>
+        return stylesheet("""\
+        .flow-node { fill: $surface; stroke: $flow; stroke-width: 2; }
+        .flow-text { fill: $text; font-family: Arial, sans-serif; font-size: 14px; }
+        .flow-arrow { stroke: $flow; stroke-width: 2; fill: none;
+            marker-end: url(#arrowhead); }
+""", """\
     <marker id="arrowhead" markerWidth="10" markerHeight="10" refX="9" refY="3" orient="auto">
-        <polygon points="0 0, 10 3, 0 6" fill="#10b981" />
+        <polygon points="0 0, 10 3, 0 6" style="fill: $flow" />
     </marker>
-</defs>"""
-        else:
-            return """
-<defs>
-    <style>
-        .flow-node { fill: #ffffff; stroke: #10b981; stroke-width: 2; }
-        .flow-text { fill: #1f2937; font-family: Arial, sans-serif; font-size: 14px; }
-        .flow-arrow { stroke: #10b981; stroke-width: 2; fill: none; marker-end: url(#arrowhead); }
-    </style>
-    <marker id="arrowhead" markerWidth="10" markerHeight="10" refX="9" refY="3" orient="auto">
-        <polygon points="0 0, 10 3, 0 6" fill="#10b981" />
-    </marker>
-</defs>"""
+""", self.theme, self.color_scheme)
 
     def _generate_node(self, node: Dict[str, Any], x: int, y: int) -> str:
         """Generate SVG markup for a flowchart node."""
@@ -0,0 +1,214 @@
+"""Icicle diagrams of module import times from ``python -X importtime``."""
+
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from ..analysis.imports import (
+    capture_import_log,
+    diff_import_trees,
+    mark_hot_chains,
+    parse_import_log,
+)
+from ..themes import stylesheet
+from .base import BaseDiagramGenerator
+
+
+class ImportTimeGenerator(BaseDiagramGenerator):
+    """
+    Generate icicle diagrams of where import time is spent.
+
+    Each module is a bar as wide as its cumulative import time, placed below
+    the module that imported it; the uncovered part of a bar is the module's
+    own time. The slowest import chains (``hot_chains``, default 3) are
+    outlined.
+
+    The target is an importtime log (as text, or a path to a file holding
+    it), a module name, or a module object. Module names and modules are
+    imported in a fresh interpreter (``python`` and ``timeout`` options) to
+    capture the log. With a ``baseline`` in any of those forms, bars are
+    colored by how much slower or faster each module imports than in the
+    baseline; changes smaller than ``min_change`` microseconds (default 500)
+    or 20% of the baseline time are treated as noise.
+
+    Example:
+        >>> diagram("mycli", diagram_type="importtime").export("startup.svg")
+        >>> diagram("after.log", diagram_type="importtime", baseline="before.log")
+    """
+
+    WIDTH = 1200
+    ROW = 24
+    TOP = 60
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Parse the import log and compare it with the baseline, if any.
+
+        Returns:
+            Dictionary with the import tree, total time and, when diffing,
+            the modules the baseline imported but this run did not.
+        """
+        name, roots = self._load(self.target)
+        mark_hot_chains(roots, self.options.get("hot_chains", 3))
+        data: Dict[str, Any] = {
+            "type": "import_time",
+            "name": name,
+            "total": sum(root["cumulative"] for root in roots),
+            "roots": roots,
+        }
+        if self.options.get("baseline") is not None:
+            _, baseline = self._load(self.options["baseline"])
+            data["baseline_total"] = sum(root["cumulative"] for root in baseline)
+            data["removed"] = diff_import_trees(roots, baseline)
+        return data
+
+    def _load(self, source: Any) -> Tuple[str, List[Dict[str, Any]]]:
+        """Return a name and the parsed import tree of a log, file or module."""
+        if isinstance(source, types.ModuleType):
+            source = source.__name__
+        if isinstance(source, str) and "import time:" in source:
+            return "import time", parse_import_log(source)
+        if isinstance(source, Path) or (
+            isinstance(source, str) and Path(source).is_file()
+        ):
+            with open(source, encoding="utf-8", errors="replace") as handle:
+                return Path(source).name, parse_import_log(handle)
+        if isinstance(source, str):
+            log = capture_import_log(
+                source,
+                python=self.options.get("python"),
+                timeout=self.options.get("timeout", 60),
+            )
+            return f"import {source}", parse_import_log(log)
+        raise TypeError(
+            "ImportTimeGenerator requires an importtime log, a log file, "
+            f"a module name or a module, got {type(source)}"
+        )
+
+    def generate(self) -> str:
+        """
+        Generate SVG markup for the icicle diagram.
+
+        Bars narrower than ``min_width`` pixels (default 0.5) are left out
+        together with their imports.
+
+        Returns:
+            SVG string with the top-level imports in the first row.
+        """
+        data = self.analyzed()
+        width = self.options.get("width", self.WIDTH)
+        min_width = self.options.get("min_width", 0.5)
+        diffing = "removed" in data
+        scale = width / data["total"] if data["total"] else 0.0
+
+        bars: List[str] = []
+        deepest = 0
+        stack: List[Tuple[Dict[str, Any], float, int]] = []
+        x = 20.0
+        for root in data["roots"]:
+            stack.append((root, x, 0))
+            x += root["cumulative"] * scale
+        while stack:
+            node, x, depth = stack.pop()
+            bar_width = node["cumulative"] * scale
+            if bar_width < min_width:
+                continue
+            deepest = max(deepest, depth)
+            y = self.TOP + depth * self.ROW
+            bars.append(self._generate_bar(node, x, y, bar_width, diffing))
+            for child in node["children"]:
+                stack.append((child, x, depth + 1))
+                x += child["cumulative"] * scale
+
+        header = f'{escape(data["name"])}: {data["total"] / 1000:.1f} ms'
+        if diffing:
+            header += f' (baseline {data["baseline_total"] / 1000:.1f} ms)'
+        footer_y = self.TOP + (deepest + 1) * self.ROW + 24
+        svg_parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {round(width + 40)} {round(footer_y + 20)}">',
+            self._generate_styles(),
+            f'<text x="20" y="32" class="imp-header">{header}</text>',
+        ]
+        svg_parts.extend(bars)
+        if data.get("removed"):
+            removed = data["removed"]
+            shown = ", ".join(removed[:20])
+            more = f" and {len(removed) - 20} more" if len(removed) > 20 else ""
+            svg_parts.append(
+                f'<text x="20" y="{footer_y}" class="imp-removed">'
+                f"No longer imported: {escape(shown)}{more}</text>"
+            )
+        svg_parts.append("</svg>")
+        return "\n".join(svg_parts)
+
+    def _generate_bar(
+        self, node: Dict[str, Any], x: float, y: float, width: float, diffing: bool
+    ) -> str:
+        """Generate one module's bar, tooltip and label."""
+        classes = ["imp-node"]
+        details = (
+            f'self {node["self"] / 1000:.2f} ms, '
+            f'cumulative {node["cumulative"] / 1000:.2f} ms'
+        )
+        if diffing:
+            change = self._change(node)
+            classes.append(f"imp-{change}")
+            if node["baseline_cumulative"] is not None:
+                delta = node["cumulative"] - node["baseline_cumulative"]
+                details += (
+                    f', baseline {node["baseline_cumulative"] / 1000:.2f} ms '
+                    f"({delta / 1000:+.2f} ms)"
+                )
+            else:
+                details += ", not in baseline"
+        if node.get("hot"):
+            classes.append("imp-hot")
+        name = escape(node["name"])
+        parts = [
+            f'<g><title>{name}\n{details}</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{self.ROW - 2}" '
+            f'class="{" ".join(classes)}"/>'
+        ]
+        # About 7 pixels per character at the label's font size.
+        fits = int((width - 8) / 7)
+        if fits >= 3:
+            label = node["name"]
+            if len(label) > fits:
+                label = label[:fits - 1] + "…"
+            parts.append(
+                f'<text x="{x + 4:.2f}" y="{y + self.ROW / 2 + 3}" class="imp-label">'
+                f"{escape(label)}</text>"
+            )
+        parts.append("</g>")
+        return "".join(parts)
+
+    def _change(self, node: Dict[str, Any]) -> str:
+        """Classify a module's cumulative time against the baseline."""
+        before = node["baseline_cumulative"]
+        if before is None:
+            return "new"
+        delta = node["cumulative"] - before
+        if abs(delta) < max(self.options.get("min_change", 500), 0.2 * before):
+            return "same"
+        return "slower" if delta > 0 else "faster"
+
+    def _generate_styles(self) -> str:
+        """Generate CSS styles for the icicle diagram."""
+        return stylesheet("""\
+        .imp-header { fill: $text; font-family: Arial, sans-serif; font-size: 15px;
+            font-weight: bold; }
+        .imp-node { fill: $call; fill-opacity: 0.35; stroke: $surface;
+            stroke-width: 1; }
+        .imp-same { fill: $divider; fill-opacity: 0.8; }
+        .imp-slower, .imp-new { fill: $removed; fill-opacity: 0.75; }
+        .imp-new { stroke-dasharray: 3 2; }
+        .imp-faster { fill: $added; fill-opacity: 0.75; }
+        .imp-hot { fill-opacity: 0.9; stroke: $text; stroke-width: 1.5; }
+        .imp-label { fill: $text; font-family: 'Courier New', monospace;
+            font-size: 11px; pointer-events: none; }
+        .imp-removed { fill: $text_muted; font-family: Arial, sans-serif;
+            font-size: 12px; }
+""", "", self.theme, self.color_scheme)
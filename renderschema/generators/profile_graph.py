@@ -0,0 +1,220 @@
+"""Weighted call graphs from ``cProfile``/``pstats`` profiles."""
+
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from ..analysis.profiles import load_stats, profile_graph
+from ..layout import OrthogonalRouter, layered_layout, path_data
+from ..themes import stylesheet
+from .base import BaseDiagramGenerator
+
+
+class ProfileGraphGenerator(BaseDiagramGenerator):
+    """
+    Generate call graphs weighted by profiled time.
+
+    The target is a ``.prof`` file (as written by ``cProfile`` or
+    ``pstats.Stats.dump_stats()``), a ``pstats.Stats``, a finished
+    ``cProfile.Profile``, or a list of these to merge. Functions below
+    ``threshold`` (default 0.005, i.e. 0.5%) of the total time are pruned
+    and at most ``max_nodes`` (default 200) are kept. Boxes and edges grow
+    with cumulative time, boxes darken with their own time, and the hot path
+    is highlighted.
+
+    Example:
+        >>> diagram("job.prof", diagram_type="profile", threshold=0.01).export(
+        ...     "job.svg"
+        ... )
+    """
+
+    NODE_WIDTH = 240
+    NODE_HEIGHT = 56
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Load the profile and prune it to the expensive part of the call graph.
+
+        The raw profile is released before returning, so only the pruned
+        graph stays in memory.
+
+        Returns:
+            Dictionary with the kept functions, the calls between them and
+            the total profiled time.
+        """
+        target = self.target
+        if isinstance(target, (str, os.PathLike)):
+            name = Path(target).name
+        elif isinstance(target, (list, tuple)):
+            name = f"{len(target)} profiles"
+        else:
+            name = "profile"
+        return profile_graph(
+            load_stats(target),
+            threshold=self.options.get("threshold", 0.005),
+            max_nodes=self.options.get("max_nodes", 200),
+            name=name,
+        )
+
+    def generate(self) -> str:
+        """
+        Generate SVG markup for the profile call graph.
+
+        Returns:
+            SVG string with callers above the functions they call.
+        """
+        data = self.analyzed()
+        total = data["total"] or 1.0
+        slot_width, slot_height = self.NODE_WIDTH, self.NODE_HEIGHT
+        depth = {node["id"]: node["depth"] for node in data["nodes"]}
+        tree_edges: List[Tuple[str, str]] = [
+            (edge["to"], edge["from"]) for edge in data["edges"]
+            if depth[edge["to"]] == depth[edge["from"]] + 1
+        ]
+        positions = layered_layout(
+            [node["id"] for node in data["nodes"]],
+            tree_edges,
+            slot_width,
+            slot_height,
+            v_gap=100,
+        )
+
+        boxes: Dict[str, Tuple[float, float, float, float]] = {}
+        for node in data["nodes"]:
+            x, y = positions[node["id"]]
+            scale = self._scale(node["cumulative"] / total)
+            width, height = slot_width * scale, slot_height * scale
+            boxes[node["id"]] = (
+                x + (slot_width - width) / 2,
+                y + (slot_height - height) / 2,
+                width,
+                height,
+            )
+        router = OrthogonalRouter(boxes)
+
+        edge_parts = []
+        max_x = max((x + slot_width for x, _ in positions.values()), default=0)
+        max_y = max((y + slot_height for _, y in positions.values()), default=0)
+        min_x = min_y = 0.0
+        # Thin edges first, so heavy edges are drawn on top.
+        edges = sorted(
+            data["edges"], key=lambda edge: (edge.get("hot", False), edge["time"] or 0)
+        )
+        for edge in edges:
+            if edge["from"] == edge["to"]:
+                continue
+            points = router.route(edge["from"], edge["to"])
+            share = (edge["time"] or 0) / total
+            css_class = "prof-edge hot" if edge.get("hot") else "prof-edge"
+            timing = ""
+            if edge["time"] is not None:
+                timing = f', {edge["time"] * 1000:.1f} ms'
+            edge_parts.append(
+                f'<path d="{path_data(points)}" class="{css_class}" '
+                f'stroke-width="{1 + 7 * share:.1f}"><title>{edge["calls"]} calls'
+                f"{timing}</title></path>"
+            )
+            for x, y in points:
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+
+        min_x, min_y = min(0, min_x - 20), min(0, min_y - 20)
+        view_width = max(800, max_x + 50) - min_x
+        view_height = max(600, max_y + 70) - min_y
+        svg_parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{round(min_x)} {round(min_y)} '
+            f'{round(view_width)} {round(view_height)}">',
+            self._generate_styles(),
+        ]
+        svg_parts.extend(edge_parts)
+        slowest_self = max(
+            (node["self"] for node in data["nodes"]), default=0.0
+        ) or 1.0
+        for node in data["nodes"]:
+            svg_parts.append(
+                self._generate_node(node, boxes[node["id"]], total, slowest_self)
+            )
+        svg_parts.append(
+            f'<text x="50" y="{round(max_y + 40)}" class="prof-summary">'
+            f'{escape(data["name"])}: {total:.3f} s total; '
+            f'{data["pruned"]} functions below '
+            f'{self.options.get("threshold", 0.005):.1%} of the total time '
+            "hidden</text>"
+        )
+        svg_parts.append("</svg>")
+        return "\n".join(svg_parts)
+
+    @staticmethod
+    def _scale(share: float) -> float:
+        """Box scale for a share of the total time; area grows linearly."""
+        return 0.6 + 0.4 * math.sqrt(min(max(share, 0.0), 1.0))
+
+    def _generate_node(
+        self,
+        node: Dict[str, Any],
+        box: Tuple[float, float, float, float],
+        total: float,
+        slowest_self: float,
+    ) -> str:
+        """Generate a function box labelled with its name and times.
+
+        The box is shaded by the function's own time.
+        """
+        x, y, width, height = box
+        css_class = "prof-node hot" if node.get("hot") else "prof-node"
+        location = node["file"]
+        if node["line"]:
+            location = f'{Path(node["file"]).name}:{node["line"]}'
+        # About 7 pixels per character of the name.
+        fits = max(int((width - 12) / 7), 4)
+        name = node["name"]
+        if len(name) > fits:
+            name = name[:fits - 1] + "…"
+        shading = 0.05 + 0.75 * node["self"] / slowest_self
+        return (
+            f'<g><title>{escape(node["id"])}\n'
+            f'{node["calls"]} calls, self {node["self"] * 1000:.1f} ms, '
+            f'cumulative {node["cumulative"] * 1000:.1f} ms</title>'
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" '
+            f'height="{height:.1f}" rx="4" class="{css_class}"/>'
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" '
+            f'height="{height:.1f}" rx="4" '
+            f'class="prof-self" fill-opacity="{shading:.2f}"/>'
+            f'<text x="{x + width / 2:.1f}" y="{y + height / 2 - 3:.1f}" '
+            f'text-anchor="middle" class="prof-name">{escape(name)}</text>'
+            f'<text x="{x + width / 2:.1f}" y="{y + height / 2 + 12:.1f}" '
+            'text-anchor="middle" '
+            f'class="prof-time">{node["cumulative"] / total:.1%} · '
+            f"{escape(location)}</text></g>"
+        )
+
+    def _generate_styles(self) -> str:
+        """Generate CSS styles for the profile call graph."""
+        return stylesheet("""\
+        .prof-node { fill: $surface; stroke: $call; stroke-width: 2; }
+        .prof-node.hot { stroke: $hot; stroke-width: 3; }
+        .prof-self { fill: $call; stroke: none; }
+        .prof-name { fill: $text; font-family: 'Courier New', monospace;
+            font-size: 12px; font-weight: bold; }
+        .prof-time { fill: $text_muted; font-family: Arial, sans-serif;
+            font-size: 10px; }
+        .prof-edge { stroke: $call; stroke-opacity: 0.7; fill: none;
+            marker-end: url(#prof-arrow); }
+        .prof-edge.hot { stroke: $hot; stroke-opacity: 1;
+            marker-end: url(#prof-hot-arrow); }
+        .prof-summary { fill: $text_muted; font-family: Arial, sans-serif;
+            font-size: 12px; }
+""", """\
+    <marker id="prof-arrow" markerWidth="10" markerHeight="10" refX="10" refY="5"
+            orient="auto" markerUnits="userSpaceOnUse">
+        <polygon points="0 0, 10 5, 0 10" style="fill: $call" />
+    </marker>
+    <marker id="prof-hot-arrow" markerWidth="10" markerHeight="10" refX="10" refY="5"
+            orient="auto" markerUnits="userSpaceOnUse">
+        <polygon points="0 0, 10 5, 0 10" style="fill: $hot" />
+    </marker>
+""", self.theme, self.color_scheme)
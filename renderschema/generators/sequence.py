@@ -0,0 +1,235 @@
+"""Sequence diagram generator driven by runtime call traces."""
+
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from ..analysis.tracing import CallTracer, build_sequence
+from ..themes import stylesheet
+from .base import BaseDiagramGenerator
+
+# Options forwarded to the CallTracer created for a callable target.
+_TRACER_OPTIONS = (
+    "include", "exclude", "classes", "sample_rate", "buffer_size", "backend"
+)
+
+
+class SequenceDiagramGenerator(BaseDiagramGenerator):
+    """
+    Generate UML sequence diagrams from recorded calls.
+
+    The target is either a ``CallTracer`` that has already recorded calls,
+    or a callable that is run once, without arguments, under a new tracer
+    configured from the ``include``, ``exclude``, ``classes``,
+    ``sample_rate``, ``buffer_size`` and ``backend`` options. When tracing a
+    callable, ``include`` defaults to its top-level package.
+
+    Example:
+        >>> diagram(checkout_flow, diagram_type="sequence").export("checkout.svg")
+    """
+
+    SPACING = 190
+    BOX_WIDTH = 160
+    ROW = 34
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Collect the traced calls and collapse repeated patterns.
+
+        Returns:
+            Dictionary with the participants and each thread's messages.
+        """
+        tracer = self.target
+        if isinstance(tracer, CallTracer):
+            name = "trace"
+        elif callable(tracer):
+            name = getattr(tracer, "__qualname__", repr(tracer))
+            options = {
+                key: self.options[key] for key in _TRACER_OPTIONS if key in self.options
+            }
+            module = getattr(tracer, "__module__", None)
+            if "include" not in options and module:
+                options["include"] = [module.split(".")[0]]
+            tracer = CallTracer(**options)
+            with tracer:
+                self.target()
+        else:
+            raise TypeError(
+                "SequenceDiagramGenerator requires a CallTracer or a callable, "
+                f"got {type(tracer)}"
+            )
+        return build_sequence(
+            list(tracer.events), name=name, max_period=self.options.get("max_period", 4)
+        )
+
+    def generate(self) -> str:
+        """
+        Generate SVG markup for the sequence diagram.
+
+        At most ``max_messages`` (default 1000) messages are drawn.
+
+        Returns:
+            SVG string with one lifeline per participant.
+        """
+        data = self.analyzed()
+        participants = list(data["participants"])
+        column = {participant: index for index, participant in enumerate(participants)}
+        budget = [self.options.get("max_messages", 1000)]
+
+        body: List[str] = []
+        y = 100.0
+        threads = data["threads"]
+        for number, thread in enumerate(threads, start=1):
+            if len(threads) > 1:
+                body.append(
+                    f'<text x="10" y="{y}" class="seq-thread">Thread {number}</text>'
+                )
+                y += 20
+            y = self._draw_messages(thread["messages"], column, y, body, budget)
+            y += 10
+        if budget[0] < 0:
+            body.append(
+                f'<text x="10" y="{y + 10}" class="seq-label">'
+                "Diagram truncated; raise max_messages to show more calls</text>"
+            )
+            y += 20
+
+        last = self._x(max(len(participants) - 1, 0))
+        width = max(800, last + self.BOX_WIDTH / 2 + 50)
+        height = max(400, y + 40)
+        svg_parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {round(width)} {round(height)}">',
+            self._generate_styles(),
+        ]
+        for index, participant in enumerate(participants):
+            svg_parts.append(
+                self._generate_participant(participant, self._x(index), height - 20)
+            )
+        svg_parts.extend(body)
+        svg_parts.append("</svg>")
+        return "\n".join(svg_parts)
+
+    def _x(self, index: int) -> float:
+        """Horizontal center of a participant's lifeline."""
+        return 40 + self.BOX_WIDTH / 2 + index * self.SPACING
+
+    def _draw_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        column: Dict[str, int],
+        y: float,
+        parts: List[str],
+        budget: List[int],
+    ) -> float:
+        """
+        Append SVG for ``messages`` starting at ``y``; return the next free y.
+
+        ``budget`` holds the number of messages still allowed, and becomes
+        negative once messages had to be left out.
+        """
+        for message in messages:
+            if budget[0] <= 0:
+                budget[0] = -1
+                return y
+            if message["type"] == "loop":
+                low, high = self._span(message["messages"], column)
+                top = y
+                frame_index = len(parts)
+                y = self._draw_messages(
+                    message["messages"], column, y + 26, parts, budget
+                )
+                left = self._x(low) - self.BOX_WIDTH / 2 + 10
+                right = self._x(high) + self.BOX_WIDTH / 2 - 10
+                parts.insert(frame_index, (
+                    f'<rect x="{left}" y="{top}" width="{right - left}" '
+                    f'height="{y - top + 4}" class="seq-loop"/>\n'
+                    f'<text x="{left + 6}" y="{top + 15}" class="seq-loop-label">'
+                    f'loop ×{message["count"]}</text>'
+                ))
+                y += 14
+                continue
+
+            budget[0] -= 1
+            target = self._x(column[message["to"]])
+            label = escape(f'{message["method"]}()')
+            if message["from"] is None:
+                parts.append(
+                    f'<circle cx="20" cy="{y}" r="4" class="seq-found"/>\n'
+                    f'<line x1="20" y1="{y}" x2="{target}" y2="{y}" '
+                    'class="seq-message"/>\n'
+                    f'<text x="{(20 + target) / 2}" y="{y - 6}" text-anchor="middle" '
+                    f'class="seq-label">{label}</text>'
+                )
+                y += self.ROW
+            elif message["from"] == message["to"]:
+                parts.append(
+                    f'<path d="M {target} {y} h 30 v 14 h -30" class="seq-message"/>\n'
+                    f'<text x="{target + 36}" y="{y + 4}" '
+                    f'class="seq-label">{label}</text>'
+                )
+                y += self.ROW + 14
+            else:
+                source = self._x(column[message["from"]])
+                parts.append(
+                    f'<line x1="{source}" y1="{y}" x2="{target}" y2="{y}" '
+                    'class="seq-message"/>\n'
+                    f'<text x="{(source + target) / 2}" y="{y - 6}" '
+                    'text-anchor="middle" '
+                    f'class="seq-label">{label}</text>'
+                )
+                y += self.ROW
+            y = self._draw_messages(message["messages"], column, y, parts, budget)
+        return y
+
+    def _span(
+        self, messages: List[Dict[str, Any]], column: Dict[str, int]
+    ) -> Tuple[int, int]:
+        """Return the leftmost and rightmost participant columns of ``messages``."""
+        columns: List[int] = []
+        stack = list(messages)
+        while stack:
+            message = stack.pop()
+            if message["type"] == "call":
+                columns.append(column[message["to"]])
+                if message["from"] is not None:
+                    columns.append(column[message["from"]])
+            stack.extend(message["messages"])
+        return (min(columns), max(columns)) if columns else (0, 0)
+
+    def _generate_participant(self, participant: str, x: float, bottom: float) -> str:
+        """Generate the header box and lifeline of a participant."""
+        short = escape(participant.rsplit(".", 1)[-1])
+        left = x - self.BOX_WIDTH / 2
+        return (
+            f'<g><title>{escape(participant)}</title>'
+            f'<rect x="{left}" y="20" width="{self.BOX_WIDTH}" height="36" '
+            f'class="seq-participant" rx="4"/>'
+            f'<text x="{x}" y="43" text-anchor="middle" class="seq-name">'
+            f'{short}</text></g>\n'
+            f'<line x1="{x}" y1="56" x2="{x}" y2="{bottom}" class="seq-lifeline"/>'
+        )
+
+    def _generate_styles(self) -> str:
+        """Generate CSS styles for the sequence diagram."""
+        return stylesheet("""\
+        .seq-participant { fill: $surface; stroke: $sequence; stroke-width: 2; }
+        .seq-name { fill: $text; font-family: Arial, sans-serif; font-size: 13px;
+            font-weight: bold; }
+        .seq-lifeline { stroke: $divider; stroke-width: 1; stroke-dasharray: 5 4; }
+        .seq-message { stroke: $sequence; stroke-width: 1.5; fill: none;
+            marker-end: url(#seq-arrow); }
+        .seq-found { fill: $sequence; }
+        .seq-label { fill: $text_muted; font-family: 'Courier New', monospace;
+            font-size: 12px; }
+        .seq-loop { fill: none; stroke: $text_muted; stroke-width: 1; }
+        .seq-loop-label { fill: $text; font-family: Arial, sans-serif; font-size: 11px;
+            font-weight: bold; }
+        .seq-thread { fill: $text; font-family: Arial, sans-serif; font-size: 12px;
+            font-weight: bold; }
+""", """\
+    <marker id="seq-arrow" markerWidth="10" markerHeight="10" refX="10" refY="5"
+            orient="auto">
+        <polygon points="0 0, 10 5, 0 10" style="fill: $sequence" />
+    </marker>
+""", self.theme, self.color_scheme)
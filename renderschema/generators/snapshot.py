@@ -0,0 +1,243 @@
+"""Immutable analysis snapshots that can be rendered concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ..exporters.manifest import OutputManifest
+from ..exporters.output import OutputTarget
+
+if TYPE_CHECKING:
+    from .base import BaseDiagramGenerator
+
+
+class FrozenDict(dict):
+    """A ``dict`` that rejects modification after construction."""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Snapshot data is immutable")
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a deeply immutable copy of analysis data.
+
+    Dictionaries become ``FrozenDict``, lists and tuples become tuples and
+    sets become frozensets; other values are kept as they are.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+class DiagramSnapshot:
+    """
+    The analysis of one diagram, frozen so it can be shared between threads.
+
+    A snapshot holds no rendering state: theme and options are passed per
+    call and every render works on a private generator, so one analysis can
+    serve any number of concurrent renders.
+
+    Example:
+        >>> snap = diagram(mymodule, diagram_type="class").snapshot()
+        >>> snap.export("light.svg")
+        >>> snap.export("dark.svg", theme="dark")
+        >>> snap.export_many({"a.svg": {"layout": "layered"}, "b.png": {}}, workers=4)
+    """
+
+    __slots__ = ("_generator_class", "_data", "_options")
+
+    _generator_class: Type["BaseDiagramGenerator"]
+    _data: FrozenDict
+    _options: FrozenDict
+
+    def __init__(
+        self,
+        generator_class: Type["BaseDiagramGenerator"],
+        data: Mapping[str, Any],
+        options: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Capture analysis data.
+
+        Args:
+            generator_class: Generator class that renders the data.
+            data: Data in the format returned by the generator's ``analyze()``.
+            options: Default options for every render.
+        """
+        object.__setattr__(self, "_generator_class", generator_class)
+        object.__setattr__(self, "_data", freeze(dict(data)))
+        object.__setattr__(self, "_options", FrozenDict(options or {}))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("DiagramSnapshot is immutable")
+
+    @property
+    def generator_class(self) -> Type["BaseDiagramGenerator"]:
+        """Generator class that renders this snapshot."""
+        return self._generator_class
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """The frozen analysis data."""
+        return self._data
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        """Default options applied to every render."""
+        return self._options
+
+    def generator(self, **options: Any) -> "BaseDiagramGenerator":
+        """
+        Create a private generator over the snapshot's data.
+
+        Args:
+            **options: Options overriding the snapshot's defaults.
+
+        Returns:
+            A new generator that will not re-analyze its target.
+        """
+        merged = {**self._options, **options}
+        return self._generator_class.from_analysis(self._data, **merged)
+
+    def render(self, **options: Any) -> str:
+        """
+        Render the diagram as SVG.
+
+        Args:
+            **options: Options for this render, e.g. ``theme="dark"``.
+
+        Returns:
+            SVG markup as a string.
+        """
+        return self.generator(**options).to_svg()
+
+    def to_html(self, interactive: bool = True, **options: Any) -> str:
+        """
+        Render the diagram as an HTML document.
+
+        Args:
+            interactive: Whether to include the pan/zoom viewer.
+            **options: Options for this render.
+
+        Returns:
+            HTML markup as a string.
+        """
+        return self.generator(**options).to_html(interactive=interactive)
+
+    def to_bytes(self, format: str = "svg", **options: Any) -> bytes:
+        """
+        Render the diagram in an export format without writing a file.
+
+        Args:
+            format: Output format, e.g. ``"png"`` or ``"svgz"``.
+            **options: Options for this render.
+
+        Returns:
+            The encoded diagram.
+        """
+        return self.generator(**options).to_bytes(format)
+
+    def export(
+        self,
+        output_path: OutputTarget,
+        format: Optional[str] = None,
+        manifest: Optional[OutputManifest] = None,
+        **options: Any,
+    ) -> bool:
+        """
+        Render the diagram and write it to a file.
+
+        Args:
+            output_path: Path where the diagram should be saved, or a binary
+                file object to write it to.
+            format: Output format; inferred from the suffix when omitted.
+            manifest: Output manifest to consult and update.
+            **options: Options for this render.
+
+        Returns:
+            True if the file was written, False if it was already current.
+        """
+        generator = self.generator(**options)
+        return generator.export(output_path, format=format, manifest=manifest)
+
+    def render_many(
+        self,
+        variants: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Render several variants of the diagram in a thread pool.
+
+        Args:
+            variants: Options for each render, e.g. ``[{"theme": "light"},
+                {"theme": "dark"}]``.
+            workers: Maximum number of threads; defaults to the executor's
+                default.
+
+        Returns:
+            SVG markup of each variant, in order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda variant: self.render(**variant), variants))
+
+    def export_many(
+        self,
+        outputs: Union[
+            Mapping[Union[str, Path], Mapping[str, Any]],
+            Iterable[Tuple[Union[str, Path], Mapping[str, Any]]],
+        ],
+        workers: Optional[int] = None,
+        manifest: Optional[OutputManifest] = None,
+    ) -> List[bool]:
+        """
+        Export several files in a thread pool.
+
+        Args:
+            outputs: Output paths with the options to render each with, as a
+                mapping or as ``(path, options)`` pairs. Formats are inferred
+                from the suffixes.
+            workers: Maximum number of threads.
+            manifest: Output manifest to consult and update.
+
+        Returns:
+            For each output, whether the file was written.
+        """
+        items = list(outputs.items()) if isinstance(outputs, Mapping) else list(outputs)
+
+        def export_one(item: Tuple[Union[str, Path], Mapping[str, Any]]) -> bool:
+            path, options = item
+            return self.export(path, manifest=manifest, **options)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(export_one, items))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        arguments = (self._generator_class, self._data, dict(self._options))
+        return (DiagramSnapshot, arguments)
+
+    def __repr__(self) -> str:
+        name = self._data.get("name")
+        return f"<DiagramSnapshot {self._generator_class.__name__} {name!r}>"
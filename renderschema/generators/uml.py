@@ -1,10 +1,13 @@
 """UML diagram generator for Python classes and modules."""
 
 import inspect
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, Iterator, List, Optional, Type
 from pathlib import Path
 
 from .base import BaseDiagramGenerator
+from ..analysis.members import MemberEnumerator
+from ..analysis.types import TypeIndex
+from ..themes import stylesheet
 
 
 class UMLDiagramGenerator(BaseDiagramGenerator):
@@ -15,6 +18,18 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
     and relationships, then generates clean UML diagrams.
     """
 
+    def __init__(self, target: Any, **options: Any) -> None:
+        """
+        Initialize the UML diagram generator.
+
+        Args:
+            target: A class, module, or path to diagram.
+            **options: Configuration options for diagram generation.
+        """
+        super().__init__(target, **options)
+        self._type_index = TypeIndex()
+        self._members = MemberEnumerator(self._describe_member)
+
     def analyze(self) -> Dict[str, Any]:
         """
         Analyze the target class or module to extract UML information.
@@ -24,6 +39,10 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
         """
         if inspect.isclass(self.target):
             return self._analyze_class(self.target)
+        elif self._is_recursive_package(self.target):
+            return self._merge_module_results(
+                self.target.__name__, self._package_results()
+            )
         elif inspect.ismodule(self.target):
             return self._analyze_module(self.target)
         elif isinstance(self.target, (str, Path)):
@@ -39,27 +58,11 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
         attributes = []
         methods = []
 
-        for name, obj in inspect.getmembers(cls):
-            if name.startswith("_") and not name.startswith("__"):
-                continue  # Skip private members unless dunder
-
-            if inspect.ismethod(obj) or inspect.isfunction(obj):
-                sig = inspect.signature(obj)
-                methods.append({
-                    "name": name,
-                    "parameters": list(sig.parameters.keys()),
-                    "return_type": self._get_type_name(sig.return_annotation),
-                    "visibility": self._get_visibility(name),
-                })
-            elif not callable(obj) or name.startswith("__"):
-                # Class attributes or dunder methods
-                type_hint = self._get_type_hint(cls, name)
-                if not inspect.ismethod(obj) and not inspect.isfunction(obj):
-                    attributes.append({
-                        "name": name,
-                        "type": type_hint,
-                        "visibility": self._get_visibility(name),
-                    })
+        for member in self._members.sorted_members(cls):
+            if member["kind"] == "method":
+                methods.append(member["data"])
+            else:
+                attributes.append(member["data"])
 
         return {
             "name": cls.__name__,
@@ -70,17 +73,88 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
             "docstring": inspect.getdoc(cls),
         }
 
+    def _describe_member(
+        self, cls: Type, name: str, obj: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Describe one raw entry of a class ``__dict__``.
+
+        The raw value is inspected without attribute access, so properties and
+        other descriptors are never evaluated.
+        """
+        if name.startswith("_") and not name.startswith("__"):
+            return None  # Skip private members unless dunder
+
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+
+        if inspect.isfunction(obj):
+            try:
+                sig = inspect.signature(obj)
+            except (TypeError, ValueError):
+                return None
+            return {"kind": "method", "data": {
+                "name": name,
+                "parameters": list(sig.parameters.keys()),
+                "return_type": self._get_type_name(sig.return_annotation),
+                "visibility": self._get_visibility(name),
+            }}
+
+        if isinstance(obj, property):
+            type_hint = self._get_type_hint(cls, name)
+            if type_hint == "Any" and obj.fget is not None:
+                return_hint = getattr(obj.fget, "__annotations__", {}).get("return")
+                if return_hint is not None:
+                    type_hint = self._get_type_name(return_hint)
+        elif not callable(obj) or name.startswith("__"):
+            # Class attributes or dunder methods
+            type_hint = self._get_type_hint(cls, name)
+        else:
+            return None
+
+        return {"kind": "attribute", "data": {
+            "name": name,
+            "type": type_hint,
+            "visibility": self._get_visibility(name),
+        }}
+
     def _analyze_module(self, module: Any) -> Dict[str, Any]:
         """Analyze a Python module to find all classes."""
-        classes = []
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and obj.__module__ == module.__name__:
-                classes.append(self._analyze_class(obj))
-
         return {
             "type": "module",
             "name": module.__name__,
-            "classes": classes,
+            "classes": list(self._iter_module_classes(module)),
+        }
+
+    def _iter_module_classes(
+        self, module: Any, release: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the analysis of each class defined in a module.
+
+        Args:
+            module: The module to analyze.
+            release: Drop cached analysis of classes without subclasses once
+                they have been analyzed.
+        """
+        for _, obj in inspect.getmembers(module):
+            if inspect.isclass(obj) and obj.__module__ == module.__name__:
+                yield self._analyze_class(obj)
+                if release and not type.__subclasses__(obj):
+                    self._members.forget(obj)
+                    self._type_index.forget(obj)
+
+    def _merge_module_results(
+        self, name: str, results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge the classes of recursively analyzed modules into one diagram."""
+        from ..analysis.packages import merge_classes, module_statuses
+
+        return {
+            "type": "package",
+            "name": name,
+            "classes": merge_classes(results),
+            "modules": module_statuses(results),
         }
 
     def _analyze_path(self, path: Path) -> Dict[str, Any]:
@@ -102,10 +176,10 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
             return "public"
 
     def _get_type_hint(self, cls: Type, attr_name: str) -> str:
-        """Extract type hint for a class attribute."""
-        hints = getattr(cls, "__annotations__", {})
+        """Extract type hint for a class attribute, including inherited hints."""
+        hints = self._type_index.resolve_hints(cls)
         if attr_name in hints:
-            return self._get_type_name(hints[attr_name])
+            return self._get_type_name(hints[attr_name][0])
         return "Any"
 
     def _get_type_name(self, type_annotation: Any) -> str:
@@ -123,54 +197,93 @@ class UMLDiagramGenerator(BaseDiagramGenerator):
         Returns:
             SVG string representing the UML diagram.
         """
-        if self._diagram_data is None:
-            self._diagram_data = self.analyze()
+        return "\n".join(self._iter_svg_parts(self.analyzed()))
+
+    def iter_svg(self, window: Optional[int] = None) -> Iterator[str]:
+        """
+        Generate the diagram as SVG chunks while analyzing it.
+
+        Modules and recursively analyzed packages are analyzed one class at a
+        time and each class box is emitted as soon as it is ready, so memory
+        stays bounded by ``window`` modules rather than by the number of
+        classes. The joined chunks equal ``generate()``. With a ``budget``
+        option the budgeted ``to_svg()`` is yielded as a single chunk.
+
+        Args:
+            window: Maximum number of package modules analyzed ahead.
+
+        Yields:
+            Consecutive pieces of SVG markup.
+        """
+        if self.options.get("budget") is not None:
+            yield self.to_svg()
+            return
+        if self._diagram_data is None and inspect.ismodule(self.target):
+            parts = self._iter_svg_parts({"classes": self.iter_classes(window)})
+        else:
+            parts = self._iter_svg_parts(self.analyzed())
+
+        separator = ""
+        for part in parts:
+            yield separator + part
+            separator = "\n"
 
+    def iter_classes(self, window: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze the target lazily, yielding one class description at a time.
+
+        Cached member analysis of classes that nothing else inherits from is
+        released once they have been yielded.
+
+        Args:
+            window: Maximum number of package modules analyzed ahead.
+
+        Yields:
+            Class descriptions in the same order as ``analyze()``.
+        """
+        if inspect.isclass(self.target):
+            yield self._analyze_class(self.target)
+        elif self._is_recursive_package(self.target):
+            for result in self._iter_package_modules(self.target, window):
+                if result["status"] == "ok":
+                    yield from result["data"]["classes"]
+        elif inspect.ismodule(self.target):
+            yield from self._iter_module_classes(self.target, release=True)
+        else:
+            yield from self.analyze()["classes"]
+
+    def _iter_svg_parts(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the SVG parts of a diagram, whose classes may be a lazy iterable."""
         # Start building SVG
-        svg_parts = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 600">',
-        ]
+        yield '<?xml version="1.0" encoding="UTF-8"?>'
+        yield '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 600">'
 
         # Add styles based on theme
-        svg_parts.append(self._generate_styles())
+        yield self._generate_styles()
 
         # Generate class boxes
-        if "classes" in self._diagram_data:
+        if "classes" in data:
             # Module with multiple classes
             y_offset = 50
-            for cls_data in self._diagram_data["classes"]:
-                svg_parts.append(self._generate_class_box(cls_data, 50, y_offset))
+            for cls_data in data["classes"]:
+                yield self._generate_class_box(cls_data, 50, y_offset)
                 y_offset += 200
         else:
             # Single class
-            svg_parts.append(self._generate_class_box(self._diagram_data, 50, 50))
+            yield self._generate_class_box(data, 50, 50)
 
-        svg_parts.append("</svg>")
-        return "\n".join(svg_parts)
+        yield "</svg>"
 
     def _generate_styles(self) -> str:
         """Generate CSS styles for the SVG based on theme."""
-        if self.theme == "dark":
-            return """
-<defs>
-    <style>
-        .class-box { fill: #1f2937; stroke: #4b5563; stroke-width: 2; }
-        .class-name { fill: #f9fafb; font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }
-        .class-text { fill: #d1d5db; font-family: 'Courier New', monospace; font-size: 12px; }
-        .section-line { stroke: #4b5563; stroke-width: 1; }
-    </style>
-</defs>"""
-        else:
-            return """
-<defs>
-    <style>
-        .class-box { fill: #ffffff; stroke: #3b82f6; stroke-width: 2; }
-        .class-name { fill: #1f2937; font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }
-        .class-text { fill: #374151; font-family: 'Courier New', monospace; font-size: 12px; }
-        .section-line { stroke: #e5e7eb; stroke-width: 1; }
-    </style>
-</defs>"""
+        return stylesheet("""\
+        .class-box { fill: $surface; stroke: $uml_border; stroke-width: 2; }
+        .class-name { fill: $text; font-family: Arial, sans-serif; font-size: 16px;
+            font-weight: bold; }
+        .class-text { fill: $text_muted; font-family: 'Courier New', monospace;
+            font-size: 12px; }
+        .section-line { stroke: $divider; stroke-width: 1; }
+""", theme=self.theme, color_scheme=self.color_scheme)
 
     def _generate_class_box(self, cls_data: Dict[str, Any], x: int, y: int) -> str:
         """Generate SVG markup for a single class box."""
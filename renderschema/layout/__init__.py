@@ -0,0 +1,13 @@
+"""Node placement and edge routing for generated diagrams."""
+
+from .force import force_layout
+from .layered import layered_layout
+from .routing import GridIndex, OrthogonalRouter, path_data
+
+__all__ = [
+    "GridIndex",
+    "OrthogonalRouter",
+    "force_layout",
+    "layered_layout",
+    "path_data",
+]
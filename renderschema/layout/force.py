@@ -0,0 +1,296 @@
+"""Force-directed node placement with Barnes-Hut approximated repulsion."""
+
+import math
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Below this many nodes the NumPy backend computes repulsion exactly.
+_EXACT_LIMIT = 256
+
+
+def force_layout(
+    nodes: Sequence[str],
+    edges: Iterable[Tuple[str, str]],
+    node_width: float = 200,
+    node_height: float = 60,
+    gap: float = 40,
+    iterations: int = 60,
+    seed: int = 0,
+    theta: float = 0.8,
+    origin: Tuple[float, float] = (50, 50),
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Place nodes with a force-directed (Fruchterman-Reingold) simulation.
+
+    Connected nodes attract, all nodes repel. Repulsion is approximated with
+    a Barnes-Hut quadtree, so an iteration costs O(n log n) rather than
+    O(n^2). The simulation runs in a space stretched to the box aspect ratio
+    so that wide boxes get more horizontal room. Results are deterministic
+    for a given seed and backend.
+
+    Args:
+        nodes: Node ids.
+        edges: Undirected ``(node, node)`` pairs.
+        node_width: Width of every node box.
+        node_height: Height of every node box.
+        gap: Desired clearance between neighbouring boxes.
+        iterations: Number of simulation steps.
+        seed: Seed for the initial placement.
+        theta: Barnes-Hut opening angle of the pure-Python backend; smaller
+            is more accurate and slower.
+        origin: Top-left corner of the layout.
+        use_numpy: Force (True) or forbid (False) the vectorized NumPy
+            backend. By default it is used when NumPy is installed.
+
+    Returns:
+        Mapping of node id to the top-left corner of its box.
+    """
+    nodes = list(nodes)
+    if not nodes:
+        return {}
+    position_of = {node: index for index, node in enumerate(nodes)}
+    pairs = [
+        (position_of[a], position_of[b]) for a, b in edges
+        if a in position_of and b in position_of and a != b
+    ]
+
+    k = node_height + gap
+    rng = random.Random(seed)
+    side = k * math.sqrt(len(nodes))
+    start = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in nodes]
+
+    if use_numpy is None:
+        try:
+            import numpy  # noqa: F401
+            use_numpy = True
+        except ImportError:
+            use_numpy = False
+
+    if use_numpy:
+        points = _simulate_numpy(start, pairs, k, iterations)
+    else:
+        points = _simulate_python(start, pairs, k, iterations, theta)
+
+    stretch = (node_width + gap) / k
+    min_x = min(x for x, _ in points) * stretch
+    min_y = min(y for _, y in points)
+    x0, y0 = origin
+    return {
+        node: (round(x0 + x * stretch - min_x, 1), round(y0 + y - min_y, 1))
+        for node, (x, y) in zip(nodes, points)
+    }
+
+
+def _temperatures(side: float, iterations: int) -> List[float]:
+    """Maximum displacement per step, cooling linearly."""
+    start = side / 10
+    return [start * (1 - step / iterations) + 1.0 for step in range(iterations)]
+
+
+class _QuadNode:
+    """A square region of the Barnes-Hut quadtree."""
+
+    __slots__ = ("x", "y", "size", "mass", "cx", "cy", "body", "children")
+
+    def __init__(self, x: float, y: float, size: float) -> None:
+        self.x, self.y, self.size = x, y, size
+        self.mass = 0
+        self.cx = self.cy = 0.0
+        self.body = -1
+        self.children: Optional[List[Optional[_QuadNode]]] = None
+
+
+def _build_quadtree(points: List[List[float]]) -> _QuadNode:
+    """Build a quadtree over ``points`` with mass and center of mass per node."""
+    min_x = min(p[0] for p in points)
+    min_y = min(p[1] for p in points)
+    size = max(
+        max(p[0] for p in points) - min_x, max(p[1] for p in points) - min_y, 1.0
+    ) * 1.0001
+    root = _QuadNode(min_x, min_y, size)
+    for index, (px, py) in enumerate(points):
+        node = root
+        depth = 0
+        while True:
+            node.cx = (node.cx * node.mass + px) / (node.mass + 1)
+            node.cy = (node.cy * node.mass + py) / (node.mass + 1)
+            node.mass += 1
+            if node.mass == 1:
+                node.body = index
+                break
+            if depth > 40:
+                # Coincident points: keep them together in one leaf.
+                node.body = -1
+                break
+            half = node.size / 2
+            if node.children is None:
+                node.children = [None, None, None, None]
+                if node.body >= 0:
+                    # Push the existing body one level down.
+                    ox, oy = points[node.body]
+                    quadrant = (ox >= node.x + half) + 2 * (oy >= node.y + half)
+                    pushed = _QuadNode(
+                        node.x + half * (quadrant & 1),
+                        node.y + half * (quadrant >> 1),
+                        half,
+                    )
+                    pushed.mass, pushed.cx, pushed.cy = 1, ox, oy
+                    pushed.body = node.body
+                    node.children[quadrant] = pushed
+                    node.body = -1
+            quadrant = (px >= node.x + half) + 2 * (py >= node.y + half)
+            child = node.children[quadrant]
+            if child is None:
+                child = _QuadNode(
+                    node.x + half * (quadrant & 1), node.y + half * (quadrant >> 1),
+                    half,
+                )
+                node.children[quadrant] = child
+            node = child
+            depth += 1
+    return root
+
+
+def _simulate_python(
+    start: List[Tuple[float, float]],
+    pairs: List[Tuple[int, int]],
+    k: float,
+    iterations: int,
+    theta: float,
+) -> List[Tuple[float, float]]:
+    """Run the simulation in pure Python with a Barnes-Hut quadtree."""
+    points = [[x, y] for x, y in start]
+    k2 = k * k
+    theta2 = theta * theta
+    gravity = 1.0 / math.sqrt(len(points))
+    for temperature in _temperatures(k * math.sqrt(len(points)), iterations):
+        root = _build_quadtree(points)
+        center_x = root.cx
+        center_y = root.cy
+        displacement = []
+        for index, (px, py) in enumerate(points):
+            fx = (center_x - px) * gravity
+            fy = (center_y - py) * gravity
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                dx = px - node.cx
+                dy = py - node.cy
+                d2 = dx * dx + dy * dy
+                if node.children is None or node.size * node.size < theta2 * d2:
+                    if node.body == index:
+                        continue
+                    if d2 < 1e-6:
+                        dx, dy = 0.01 * (index % 7 - 3), 0.01 * (index % 5 - 2)
+                        d2 = 1e-4
+                    force = k2 * node.mass / d2
+                    fx += dx * force
+                    fy += dy * force
+                else:
+                    stack.extend(child for child in node.children if child is not None)
+            displacement.append([fx, fy])
+
+        for a, b in pairs:
+            dx = points[a][0] - points[b][0]
+            dy = points[a][1] - points[b][1]
+            factor = math.sqrt(dx * dx + dy * dy) / k
+            displacement[a][0] -= dx * factor
+            displacement[a][1] -= dy * factor
+            displacement[b][0] += dx * factor
+            displacement[b][1] += dy * factor
+
+        for point, (fx, fy) in zip(points, displacement):
+            length = math.sqrt(fx * fx + fy * fy)
+            if length > 0:
+                scale = min(length, temperature) / length
+                point[0] += fx * scale
+                point[1] += fy * scale
+    return [(x, y) for x, y in points]
+
+
+def _simulate_numpy(
+    start: List[Tuple[float, float]],
+    pairs: List[Tuple[int, int]],
+    k: float,
+    iterations: int,
+) -> List[Tuple[float, float]]:
+    """
+    Run the simulation with NumPy, updating all positions at once.
+
+    The quadtree is stored level by level as dense grids of cell masses and
+    centers of mass. At each level a node feels the cells that are children
+    of its parent's neighbours but not its own neighbours (the cells that
+    were too close at the level above); at the finest level it also feels
+    its neighbouring cells and the rest of its own cell.
+    """
+    import numpy as np
+
+    pos = np.array(start, dtype=float)
+    count = len(pos)
+    k2 = k * k
+    gravity = 1.0 / math.sqrt(count)
+    src = np.array([a for a, _ in pairs], dtype=np.intp)
+    dst = np.array([b for _, b in pairs], dtype=np.intp)
+    levels = max(2, min(10, math.ceil(math.log2(math.sqrt(count))) + 1))
+    offsets = [(dx, dy) for dx in range(-2, 4) for dy in range(-2, 4)]
+
+    for temperature in _temperatures(k * math.sqrt(count), iterations):
+        center = pos.mean(axis=0)
+        disp = (center - pos) * gravity
+
+        if count <= _EXACT_LIMIT:
+            delta = pos[:, None, :] - pos[None, :, :]
+            d2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+            np.fill_diagonal(d2, np.inf)
+            disp += (delta * (k2 / d2)[:, :, None]).sum(axis=1)
+        else:
+            low = pos.min(axis=0)
+            size = max(float((pos.max(axis=0) - low).max()), 1.0) * 1.0001
+            for level in range(2, levels + 1):
+                grid = 2 ** level
+                cell = ((pos - low) / (size / grid)).astype(np.intp)
+                cell = np.minimum(cell, grid - 1)
+                flat = cell[:, 0] * grid + cell[:, 1]
+                mass = np.bincount(flat, minlength=grid * grid).astype(float)
+                sum_x = np.bincount(flat, weights=pos[:, 0], minlength=grid * grid)
+                sum_y = np.bincount(flat, weights=pos[:, 1], minlength=grid * grid)
+                base = (cell // 2) * 2
+                finest = level == levels
+                for dx, dy in offsets:
+                    cx = base[:, 0] + dx
+                    cy = base[:, 1] + dy
+                    valid = (cx >= 0) & (cx < grid) & (cy >= 0) & (cy < grid)
+                    if not finest:
+                        far_x = np.abs(cx - cell[:, 0]) > 1
+                        valid &= far_x | (np.abs(cy - cell[:, 1]) > 1)
+                    index = np.where(valid, cx * grid + cy, 0)
+                    m = np.where(valid, mass[index], 0.0)
+                    mx = np.where(valid, sum_x[index], 0.0)
+                    my = np.where(valid, sum_y[index], 0.0)
+                    if finest:
+                        own = valid & (index == flat)
+                        m = m - own
+                        mx = mx - own * pos[:, 0]
+                        my = my - own * pos[:, 1]
+                    occupied = m > 0
+                    safe = np.where(occupied, m, 1.0)
+                    ddx = pos[:, 0] - mx / safe
+                    ddy = pos[:, 1] - my / safe
+                    d2 = np.maximum(ddx * ddx + ddy * ddy, 1e-4)
+                    force = np.where(occupied, k2 * m / d2, 0.0)
+                    disp[:, 0] += ddx * force
+                    disp[:, 1] += ddy * force
+
+        if len(src):
+            delta = pos[src] - pos[dst]
+            pull = delta * (np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None]
+            np.subtract.at(disp, src, pull)
+            np.add.at(disp, dst, pull)
+
+        length = np.sqrt((disp ** 2).sum(axis=1))
+        capped = np.minimum(length, temperature) / np.maximum(length, 1e-12)
+        scale = np.where(length > 0, capped, 0.0)
+        pos += disp * scale[:, None]
+
+    return [(float(x), float(y)) for x, y in pos]
@@ -0,0 +1,334 @@
+"""Orthogonal edge routing around node boxes using a uniform-grid spatial index."""
+
+from collections import defaultdict
+from typing import DefaultDict, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Point = Tuple[float, float]
+# (x, y, width, height)
+Box = Tuple[float, float, float, float]
+
+
+class GridIndex:
+    """
+    Uniform-grid spatial index of axis-aligned boxes.
+
+    Each box is registered in every grid cell it overlaps, so a query only
+    inspects the boxes in the cells covered by the query rectangle.
+    """
+
+    def __init__(self, cell_size: float = 100.0) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            cell_size: Width and height of a grid cell. Roughly twice the
+                typical box size works well.
+        """
+        self.cell_size = cell_size
+        self._cells: DefaultDict[Tuple[int, int], List[Hashable]] = defaultdict(list)
+        self._boxes: Dict[Hashable, Box] = {}
+
+    def insert(self, key: Hashable, box: Box) -> None:
+        """Add a box under ``key``."""
+        self._boxes[key] = box
+        x, y, w, h = box
+        for cell in self._cells_for(x, y, x + w, y + h):
+            self._cells[cell].append(key)
+
+    def query(self, x1: float, y1: float, x2: float, y2: float) -> Set[Hashable]:
+        """Return the keys of all boxes whose interior intersects the rectangle."""
+        return {
+            key for key in self._candidates(x1, y1, x2, y2)
+            if self._intersects(self._boxes[key], x1, y1, x2, y2)
+        }
+
+    def first_hit(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        ignore: Iterable[Hashable] = (),
+    ) -> Optional[Hashable]:
+        """
+        Return any box whose interior intersects the rectangle, or ``None``.
+
+        Stops at the first hit, which keeps obstacle checks along long
+        segments cheap.
+        """
+        ignored = set(ignore)
+        for key in self._candidates(x1, y1, x2, y2):
+            box = self._boxes[key]
+            if key not in ignored and self._intersects(box, x1, y1, x2, y2):
+                return key
+        return None
+
+    def box(self, key: Hashable) -> Box:
+        """Return the box registered under ``key``."""
+        return self._boxes[key]
+
+    def _candidates(
+        self, x1: float, y1: float, x2: float, y2: float
+    ) -> Iterable[Hashable]:
+        seen: Set[Hashable] = set()
+        cells = self._cells_for(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        for cell in cells:
+            for key in self._cells.get(cell, ()):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def _cells_for(
+        self, x1: float, y1: float, x2: float, y2: float
+    ) -> Iterable[Tuple[int, int]]:
+        size = self.cell_size
+        for cx in range(int(x1 // size), int(x2 // size) + 1):
+            for cy in range(int(y1 // size), int(y2 // size) + 1):
+                yield (cx, cy)
+
+    @staticmethod
+    def _intersects(box: Box, x1: float, y1: float, x2: float, y2: float) -> bool:
+        bx, by, bw, bh = box
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+        return left < bx + bw and right > bx and top < by + bh and bottom > by
+
+
+class OrthogonalRouter:
+    """
+    Route edges as orthogonal polylines that avoid node boxes.
+
+    Edges leave the source box towards the target and enter the target box
+    from the facing side. Edges into the same target share their final
+    channel and segment, which bundles them into one visual trunk; parallel
+    edges between the same pair of boxes are spread apart. Every segment of
+    a route is checked against the other boxes and detours around any box
+    it would cross. Each check is a spatial index lookup, so routing cost
+    grows with the number of edges rather than edges times boxes. An edge
+    from a box to itself loops around the box's top right corner.
+    """
+
+    def __init__(
+        self,
+        boxes: Dict[str, Box],
+        margin: float = 16.0,
+        lane_spacing: float = 6.0,
+        max_lanes: int = 8,
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            boxes: Node boxes keyed by node id.
+            margin: Clearance kept between routes and boxes.
+            lane_spacing: Distance between detour lanes of different targets.
+            max_lanes: Number of distinct detour lanes before lanes repeat.
+        """
+        self.boxes = boxes
+        self.margin = margin
+        self.lane_spacing = lane_spacing
+        self.max_lanes = max_lanes
+
+        sizes = sorted(max(w, h) for _, _, w, h in boxes.values()) or [50.0]
+        self.index = GridIndex(cell_size=max(50.0, 2 * sizes[len(sizes) // 2]))
+        for key, box in boxes.items():
+            self.index.insert(key, box)
+
+        self._lanes: Dict[str, int] = {}
+        self._pairs: Dict[Tuple[str, str], int] = {}
+
+    def route(self, source: str, target: str) -> List[Point]:
+        """
+        Route an edge between two boxes.
+
+        Args:
+            source: Id of the box the edge starts at.
+            target: Id of the box the edge ends at.
+
+        Returns:
+            Corner points of the orthogonal polyline, from source to target.
+        """
+        if source == target:
+            return self._loop(source)
+        sx, sy, sw, sh = self.boxes[source]
+        tx, ty, tw, th = self.boxes[target]
+        lane = self._lanes.setdefault(target, len(self._lanes) % self.max_lanes)
+        offset = self._parallel_offset(source, target)
+        start_x = sx + sw / 2 + offset
+        end_x = tx + tw / 2 + offset
+        ignore = (source, target)
+        margin = self.margin
+        clearance = margin + lane * self.lane_spacing
+
+        if sy >= ty + th + 2 * margin:
+            # Target above: leave through the top, enter through the bottom.
+            start, end, direction = (start_x, sy), (end_x, ty + th), -1
+        elif ty >= sy + sh + 2 * margin:
+            # Target below: leave through the bottom, enter through the top.
+            start, end, direction = (start_x, sy + sh), (end_x, ty), 1
+        else:
+            # Overlapping rows: arc over both boxes.
+            top = min(sy, ty) - clearance
+            points = [(start_x, sy), (start_x, top), (end_x, top), (end_x, ty)]
+            return self._simplify(self._avoid_boxes(points, ignore, clearance))
+
+        channel_y = end[1] - direction * margin
+        if self.index.first_hit(start_x, start[1], start_x, channel_y, ignore) is None:
+            points = [start, (start_x, channel_y), (end_x, channel_y), end]
+        else:
+            jog_y = start[1] + direction * margin
+            free_x = self._free_x(start_x, jog_y, channel_y, ignore, lane)
+            points = [
+                start,
+                (start_x, jog_y),
+                (free_x, jog_y),
+                (free_x, channel_y),
+                (end_x, channel_y),
+                end,
+            ]
+        return self._simplify(self._avoid_boxes(points, ignore, clearance))
+
+    def _loop(self, key: str) -> List[Point]:
+        """
+        Route an edge from a box to itself around its top right corner.
+
+        The loop leaves through the top and enters through the right side;
+        repeated self-edges of one box get wider loops.
+        """
+        x, y, w, h = self.boxes[key]
+        count = self._pairs.get((key, key), 0)
+        self._pairs[(key, key)] = count + 1
+        reach = self.margin + 2 * count * self.lane_spacing
+        right, exit_x, entry_y = x + w, x + w * 3 / 4, y + h / 4
+        points = [
+            (exit_x, y),
+            (exit_x, y - reach),
+            (right + reach, y - reach),
+            (right + reach, entry_y),
+            (right, entry_y),
+        ]
+        return self._simplify(self._avoid_boxes(points, (key, key), self.margin))
+
+    def _parallel_offset(self, source: str, target: str) -> float:
+        """Spread repeated edges between the same two boxes apart."""
+        pair = (source, target) if source <= target else (target, source)
+        count = self._pairs.get(pair, 0)
+        self._pairs[pair] = count + 1
+        step = (count + 1) // 2 * 2 * self.lane_spacing
+        return step if count % 2 else -step
+
+    def _avoid_boxes(
+        self, points: List[Point], ignore: Tuple[str, str], clearance: float
+    ) -> List[Point]:
+        """
+        Detour every segment of an orthogonal polyline around the boxes it crosses.
+
+        A blocked segment is split around the blocking box, passing it on the
+        side nearer to the segment; the new segments are checked in turn.
+        """
+        points = list(points)
+        detours = 4 * len(points) + 16
+        index = 0
+        while index < len(points) - 1:
+            (x1, y1), (x2, y2) = points[index], points[index + 1]
+            blocker = self.index.first_hit(x1, y1, x2, y2, ignore) if detours else None
+            if blocker is None:
+                index += 1
+                continue
+            detours -= 1
+            points[index + 1:index + 1] = self._bypass(
+                points[index], points[index + 1], self.index.box(blocker), clearance
+            )
+        return points
+
+    @staticmethod
+    def _bypass(start: Point, end: Point, box: Box, clearance: float) -> List[Point]:
+        """Corners leading an axis-aligned segment around ``box``."""
+        vertical = start[0] == end[0]
+        if vertical:
+            # Route in transposed coordinates, then swap back.
+            start, end = (start[1], start[0]), (end[1], end[0])
+            box = (box[1], box[0], box[3], box[2])
+        (x1, y), (x2, _) = start, end
+        bx, by, bw, bh = box
+        low, high = bx - clearance, bx + bw + clearance
+        if x2 >= x1:
+            enter, leave = max(low, x1), min(high, x2)
+        else:
+            enter, leave = min(high, x1), max(low, x2)
+        above, below = by - clearance, by + bh + clearance
+        side = above if y - above <= below - y else below
+        corners = [(enter, y), (enter, side), (leave, side), (leave, y)]
+        if vertical:
+            return [(b, a) for a, b in corners]
+        return corners
+
+    def _free_x(
+        self,
+        x: float,
+        y1: float,
+        y2: float,
+        ignore: Tuple[str, str],
+        lane: int,
+    ) -> float:
+        """Find the nearest x at which a vertical run from y1 to y2 is clear."""
+        clearance = self.margin + lane * self.lane_spacing
+        candidates = []
+        for side in (1, -1):
+            candidate = x
+            for _ in range(64):
+                blocker = self.index.first_hit(candidate, y1, candidate, y2, ignore)
+                if blocker is None:
+                    candidates.append(candidate)
+                    break
+                bx, _, bw, _ = self.index.box(blocker)
+                candidate = bx + bw + clearance if side > 0 else bx - clearance
+        if not candidates:
+            return x
+        return min(candidates, key=lambda c: abs(c - x))
+
+    @staticmethod
+    def _simplify(points: List[Point]) -> List[Point]:
+        """Drop repeated points and corners that lie on a straight run."""
+        result: List[Point] = []
+        for point in points:
+            if result and result[-1] == point:
+                continue
+            if len(result) >= 2:
+                (ax, ay), (bx, by) = result[-2], result[-1]
+                if (ax == bx == point[0]) or (ay == by == point[1]):
+                    result[-1] = point
+                    continue
+            result.append(point)
+        return result
+
+
+def _format_number(value: float) -> str:
+    """Format a coordinate compactly, without a trailing ``.0``."""
+    text = f"{value:.1f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def path_data(points: List[Point]) -> str:
+    """
+    Encode a polyline as compact SVG path data using ``H``/``V`` commands.
+
+    Args:
+        points: Corner points of the polyline.
+
+    Returns:
+        Path data, e.g. ``"M300 170V155H300V110"``.
+    """
+    if not points:
+        return ""
+    x, y = points[0]
+    parts = [f"M{_format_number(x)} {_format_number(y)}"]
+    for nx, ny in points[1:]:
+        if nx == x:
+            parts.append(f"V{_format_number(ny)}")
+        elif ny == y:
+            parts.append(f"H{_format_number(nx)}")
+        else:
+            parts.append(f"L{_format_number(nx)} {_format_number(ny)}")
+        x, y = nx, ny
+    return "".join(parts)
@@ -0,0 +1,197 @@
+"""Lazy registries of diagram generators and exporters, extended by entry points."""
+
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+GENERATOR_GROUP = "renderschema.generators"
+EXPORTER_GROUP = "renderschema.exporters"
+
+
+class Registry:
+    """
+    Map names to classes that are imported only when first requested.
+
+    Entries are ``"package.module:Attribute"`` strings (or classes). Entry
+    points in the registry's group are only scanned, and only the matching
+    entry point is loaded, when a name is not registered directly, so
+    installing plugins costs nothing until one of them is used. Resolved
+    classes are cached.
+
+    Example:
+        In a plugin's ``pyproject.toml``::
+
+            [project.entry-points."renderschema.generators"]
+            sequence = "my_plugin.sequence:SequenceDiagramGenerator"
+    """
+
+    def __init__(self, group: str, builtins: Optional[Dict[str, str]] = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            group: Entry-point group searched for unknown names.
+            builtins: Initial mapping of name to ``"module:attribute"``.
+        """
+        self.group = group
+        self._targets: Dict[str, Any] = {
+            name.lower(): target for name, target in (builtins or {}).items()
+        }
+        self._resolved: Dict[str, Any] = {}
+        self._entry_points: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: Union[str, type]) -> None:
+        """
+        Register a class, or a lazy ``"module:attribute"`` reference to one.
+
+        Args:
+            name: Diagram type or format name (case-insensitive).
+            target: The class or its import reference.
+        """
+        key = name.lower()
+        with self._lock:
+            self._targets[key] = target
+            self._resolved.pop(key, None)
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Return the class registered under ``name``, importing it if needed.
+
+        Args:
+            name: Diagram type or format name (case-insensitive).
+
+        Returns:
+            The class, or None if nothing is registered under ``name``.
+        """
+        key = name.lower()
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+
+        with self._lock:
+            target = self._targets.get(key)
+            entry_point = self._discover().get(key) if target is None else None
+
+        # Import without holding the lock: a plugin module may look up the
+        # registry while it is being imported.
+        if target is None:
+            if entry_point is None:
+                return None
+            loaded = entry_point.load()
+        elif isinstance(target, str):
+            loaded = _import_target(target)
+        else:
+            loaded = target
+
+        with self._lock:
+            if self._targets.get(key) is not target:
+                # Re-registered while importing; leave the new target unresolved.
+                return loaded
+            resolved = self._resolved.setdefault(key, loaded)
+        return resolved
+
+    def names(self) -> List[str]:
+        """Return every registered and discoverable name, without importing any."""
+        with self._lock:
+            return sorted(set(self._targets) | set(self._discover()))
+
+    def __contains__(self, name: str) -> bool:
+        key = name.lower()
+        with self._lock:
+            return key in self._targets or key in self._discover()
+
+    def _discover(self) -> Dict[str, Any]:
+        """Read (once) the entry points of this group, without loading them."""
+        if self._entry_points is None:
+            self._entry_points = {
+                entry_point.name.lower(): entry_point
+                for entry_point in _iter_entry_points(self.group)
+            }
+        return self._entry_points
+
+
+def _import_target(target: str, package: Optional[str] = None) -> Any:
+    """Import the attribute named by a ``"module:attribute"`` reference."""
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name, package), attribute)
+
+
+def lazy_attributes(
+    module_name: str, targets: Dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` that imports attributes on first access.
+
+    Packages use it to re-export names whose modules are costly to import,
+    so that ``import renderschema`` stays cheap. Resolved attributes are
+    stored on the module and later lookups bypass ``__getattr__``.
+
+    Args:
+        module_name: ``__name__`` of the re-exporting package.
+        targets: Mapping of attribute name to ``"module:attribute"``; the
+            module may be relative to the package, e.g. ``".text:DOTExporter"``.
+
+    Returns:
+        The ``__getattr__`` function for the module.
+    """
+    def lookup(name: str) -> Any:
+        target = targets.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = _import_target(target, module_name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return lookup
+
+
+def _iter_entry_points(group: str) -> List[Any]:
+    """Return the entry points of ``group`` across Python versions."""
+    from importlib import metadata
+
+    if sys.version_info >= (3, 10):
+        return list(metadata.entry_points(group=group))
+    return list(metadata.entry_points().get(group, []))
+
+
+generators = Registry(
+    GENERATOR_GROUP,
+    {
+        "uml": "renderschema.generators.uml:UMLDiagramGenerator",
+        "flowchart": "renderschema.generators.flowchart:FlowchartGenerator",
+        "class": "renderschema.generators.class_diagram:ClassDiagramGenerator",
+        "callgraph": "renderschema.generators.call_graph:CallGraphGenerator",
+        "sequence": "renderschema.generators.sequence:SequenceDiagramGenerator",
+        "importtime": "renderschema.generators.import_time:ImportTimeGenerator",
+        "profile": "renderschema.generators.profile_graph:ProfileGraphGenerator",
+        "objects": "renderschema.generators.object_graph:ObjectGraphGenerator",
+    },
+)
+
+exporters = Registry(
+    EXPORTER_GROUP,
+    {
+        "svg": "renderschema.exporters.svg:SVGExporter",
+        "svgz": "renderschema.exporters.svgz:SVGZExporter",
+        "png": "renderschema.exporters.png:PNGExporter",
+        "pdf": "renderschema.exporters.pdf:PDFExporter",
+        "html": "renderschema.exporters.html:HTMLExporter",
+        "dzi": "renderschema.exporters.tiles:TileExporter",
+        "xyz": "renderschema.exporters.tiles:XYZTileExporter",
+        "mmd": "renderschema.exporters.text:MermaidExporter",
+        "dot": "renderschema.exporters.text:DOTExporter",
+        "puml": "renderschema.exporters.text:PlantUMLExporter",
+    },
+)
+
+
+def register_generator(name: str, target: Union[str, type]) -> None:
+    """Register a diagram generator for ``diagram(..., diagram_type=name)``."""
+    generators.register(name, target)
+
+
+def register_exporter(name: str, target: Union[str, type]) -> None:
+    """Register an exporter for the ``name`` output format."""
+    exporters.register(name, target)
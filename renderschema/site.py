@@ -0,0 +1,560 @@
+"""Static documentation sites with lazily loaded diagrams and a search index."""
+
+import glob
+import hashlib
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from .exporters.html import (
+    THEME_TOGGLE_SCRIPT,
+    VIEWER_SCRIPT,
+    VIEWER_STYLES,
+    HTMLExporter,
+)
+from .exporters.manifest import OutputManifest
+from .generators.base import export_content
+from .themes import palette, variable_rules
+
+# Loads each diagram when its container approaches the viewport and answers
+# searches from the prebuilt index: names are sorted case-insensitively, so
+# prefix matches are found by binary search.
+_SITE_SCRIPT = """
+(function () {
+    'use strict';
+
+    const LIMIT = 30;
+    const KINDS = { M: 'module', c: 'class', m: 'method', d: 'diagram' };
+
+    function load(container) {
+        if (!container.rsLoading) {
+            container.dataset.state = 'loading';
+            container.rsLoading = fetch(container.dataset.src)
+                .then(function (response) {
+                    if (!response.ok) {
+                        throw new Error(response.statusText);
+                    }
+                    return response.text();
+                })
+                .then(function (text) {
+                    container.innerHTML = text.replace(/^<\\?xml[^>]*>/, '');
+                    container.dataset.state = 'loaded';
+                    return window.RenderSchemaViewer.init(container);
+                })
+                .catch(function () {
+                    container.dataset.state = 'error';
+                    container.textContent = 'Could not load ' + container.dataset.src;
+                    return null;
+                });
+        }
+        return container.rsLoading;
+    }
+
+    const lazy = document.querySelectorAll('[data-src]');
+    if ('IntersectionObserver' in window) {
+        const observer = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    load(entry.target);
+                }
+            });
+        }, { rootMargin: '300px 0px' });
+        lazy.forEach(function (container) { observer.observe(container); });
+    } else {
+        lazy.forEach(load);
+    }
+
+    const input = document.querySelector('[data-rs-search]');
+    const results = document.querySelector('[data-rs-results]');
+    if (!input || !results) {
+        return;
+    }
+    let index = null;
+    let lower = null;
+    let indexLoading = null;
+
+    function loadIndex() {
+        if (!indexLoading) {
+            indexLoading = fetch(input.dataset.rsSearch)
+                .then(function (response) { return response.json(); })
+                .then(function (data) {
+                    index = data;
+                    lower = data.names.map(function (name) {
+                        return name.toLowerCase();
+                    });
+                });
+        }
+        return indexLoading;
+    }
+
+    function search(query) {
+        const q = query.trim().toLowerCase();
+        if (!q) {
+            return [];
+        }
+        let lo = 0;
+        let hi = lower.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (lower[mid] < q) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        const found = [];
+        for (let i = lo; i < lower.length && found.length < LIMIT; i++) {
+            if (!lower[i].startsWith(q)) {
+                break;
+            }
+            found.push(i);
+        }
+        for (let i = 0; i < lower.length && found.length < LIMIT; i++) {
+            if (lower[i].indexOf(q) > 0) {
+                found.push(i);
+            }
+        }
+        return found;
+    }
+
+    function qualifier(i) {
+        const parent = index.parents[i];
+        return parent < 0 ? '' : index.names[parent];
+    }
+
+    function jump(i) {
+        const section = document.getElementById(index.pages[index.page[i]]);
+        if (!section) {
+            return;
+        }
+        section.scrollIntoView();
+        const container = section.querySelector('[data-src]');
+        const kind = index.kinds[i];
+        const target = kind === 'm' ? index.names[index.parents[i]] : index.names[i];
+        load(container).then(function (viewer) {
+            if (!viewer || (kind !== 'c' && kind !== 'm')) {
+                return;
+            }
+            const texts = Array.from(container.querySelectorAll('text'));
+            const label = texts.find(function (text) {
+                return text.textContent.trim() === target;
+            });
+            if (label) {
+                const group = label.parentNode.tagName === 'g';
+                viewer.focus(group ? label.parentNode : label);
+            }
+        });
+    }
+
+    function render(found) {
+        results.textContent = '';
+        found.forEach(function (i) {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = '#' + index.pages[index.page[i]];
+            link.textContent = index.names[i];
+            const detail = document.createElement('small');
+            detail.textContent = ' ' + KINDS[index.kinds[i]] +
+                (qualifier(i) ? ' in ' + qualifier(i) : '');
+            link.appendChild(detail);
+            link.addEventListener('click', function (e) {
+                e.preventDefault();
+                history.replaceState(null, '', link.href);
+                jump(i);
+            });
+            item.appendChild(link);
+            results.appendChild(item);
+        });
+    }
+
+    input.addEventListener('focus', loadIndex, { once: true });
+    input.addEventListener('input', function () {
+        loadIndex().then(function () { render(search(input.value)); });
+    });
+    input.addEventListener('keydown', function (e) {
+        if (e.key === 'Enter') {
+            const first = results.querySelector('a');
+            if (first) {
+                first.click();
+            }
+        }
+    });
+})();
+"""
+
+_SITE_STYLES = """
+body {
+    margin: 0;
+    display: flex;
+    background-color: $background;
+    color: $text;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+}
+.rs-sidebar {
+    position: sticky;
+    top: 0;
+    box-sizing: border-box;
+    width: 300px;
+    height: 100vh;
+    padding: 16px;
+    overflow-y: auto;
+    border-right: 1px solid $divider;
+}
+.rs-sidebar h1 {
+    font-size: 18px;
+}
+.rs-sidebar input {
+    box-sizing: border-box;
+    width: 100%;
+    padding: 6px 8px;
+    border: 1px solid $divider;
+    border-radius: 4px;
+    background: $surface;
+    color: $text;
+    font: inherit;
+}
+.rs-sidebar a {
+    color: inherit;
+}
+.rs-results small {
+    opacity: 0.7;
+}
+main {
+    flex: 1;
+    min-width: 0;
+    padding: 16px 24px;
+}
+.rs-diagram .container {
+    height: 70vh;
+    overflow: hidden;
+    border: 1px solid $divider;
+    border-radius: 6px;
+    background: $surface;
+    touch-action: none;
+    cursor: grab;
+    outline: none;
+}
+.rs-theme-toggle {
+    position: fixed;
+    top: 12px;
+    right: 12px;
+    padding: 4px 10px;
+    border: 1px solid $divider;
+    border-radius: 4px;
+    background: $surface;
+    color: $text;
+    font: inherit;
+    cursor: pointer;
+}"""
+
+
+class SiteBuilder:
+    """
+    Render many diagrams into one static documentation site.
+
+    The site is a single ``index.html`` with a section per diagram. Each
+    diagram is written as its own SVG file and fetched only when its section
+    scrolls into view. The viewer script and styles live in one shared,
+    content-hashed bundle under ``assets/`` that browsers can cache across
+    rebuilds, and ``search.<hash>.json`` holds a compact index of module,
+    class and method names.
+
+    Example:
+        >>> site = SiteBuilder("docs/site", title="Shop internals")
+        >>> site.add_package(shop, diagram_type="class")
+        >>> site.add("Checkout flow", diagram(checkout, diagram_type="sequence"))
+        >>> site.build()
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        title: str = "RenderSchema Diagrams",
+        theme: str = "light",
+        manifest: Optional[OutputManifest] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        """
+        Configure a site.
+
+        Args:
+            output_dir: Directory the site is written to.
+            title: Page title.
+            theme: Theme of the page and every diagram; ``"auto"`` adds a
+                theme toggle.
+            manifest: Output manifest used to skip rewriting unchanged
+                diagrams; defaults to ``.renderschema-manifest.json`` in the
+                output directory.
+            workers: Maximum number of threads rendering diagrams.
+        """
+        self.output_dir = Path(output_dir)
+        self.title = title
+        self.theme = theme
+        self.manifest = manifest or OutputManifest(
+            self.output_dir / ".renderschema-manifest.json"
+        )
+        self.workers = workers
+        self._diagrams: List[Tuple[str, str, Any]] = []
+        self._slugs: Dict[str, int] = {}
+
+    def add(self, name: str, diagram: Any) -> str:
+        """
+        Add a diagram to the site.
+
+        Args:
+            name: Section heading.
+            diagram: A generator or ``DiagramSnapshot``.
+
+        Returns:
+            The section's anchor id.
+        """
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", name).strip("-") or "diagram"
+        count = self._slugs.get(slug, 0)
+        self._slugs[slug] = count + 1
+        if count:
+            slug = f"{slug}-{count + 1}"
+        self._diagrams.append((name, slug, diagram))
+        return slug
+
+    def add_package(
+        self, package: Any, diagram_type: str = "class", **options: Any
+    ) -> List[str]:
+        """
+        Add one diagram per subpackage of a recursively analyzed package.
+
+        Args:
+            package: The package to document.
+            diagram_type: ``"class"`` or ``"uml"``.
+            **options: Options for the generator, e.g. ``exclude``.
+
+        Returns:
+            The anchor ids of the added sections.
+        """
+        from .core import diagram
+
+        generator = diagram(
+            package, diagram_type=diagram_type, recursive=True, **options
+        )
+        return [
+            self.add(name, sub) for name, sub in generator.subpackage_diagrams().items()
+        ]
+
+    def build(self) -> Path:
+        """
+        Render every diagram and write the site.
+
+        Diagrams are rendered concurrently. Files whose content is unchanged
+        are left untouched, and SVG files of removed diagrams are deleted.
+
+        Returns:
+            Path of ``index.html``.
+        """
+        diagrams_dir = self.output_dir / "diagrams"
+        diagrams_dir.mkdir(parents=True, exist_ok=True)
+
+        def render(item: Tuple[str, str, Any]) -> Tuple[str, Dict[str, Any]]:
+            _, slug, source = item
+            snapshot = source if hasattr(source, "render") else source.snapshot()
+            svg = snapshot.render(theme=self.theme)
+            path = diagrams_dir / f"{slug}.svg"
+            export_content(svg, path, "svg", self.theme, self.manifest)
+            return svg, snapshot.data
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            rendered = list(pool.map(render, self._diagrams))
+        self.manifest.save()
+
+        current = {f"{slug}.svg" for _, slug, _ in self._diagrams}
+        for stale in diagrams_dir.glob("*.svg"):
+            if stale.name not in current:
+                stale.unlink()
+
+        assets = self.output_dir / "assets"
+        script = VIEWER_SCRIPT + _SITE_SCRIPT
+        if self.theme == "auto":
+            script += THEME_TOGGLE_SCRIPT
+        script_name = _write_hashed(assets, "renderschema", ".js", script)
+        styles_name = _write_hashed(assets, "renderschema", ".css", self._styles())
+
+        sections = [
+            (name, slug, svg, data)
+            for (name, slug, _), (svg, data) in zip(self._diagrams, rendered)
+        ]
+        index = build_search_index(
+            [(name, slug, data) for name, slug, _, data in sections]
+        )
+        search_name = _write_hashed(
+            self.output_dir, "search", ".json", json.dumps(index, separators=(",", ":"))
+        )
+
+        page = self._page(
+            [(name, slug, svg) for name, slug, svg, _ in sections],
+            f"assets/{script_name}",
+            f"assets/{styles_name}",
+            search_name,
+        )
+        index_path = self.output_dir / "index.html"
+        _write_if_changed(index_path, page)
+        return index_path
+
+    def _styles(self) -> str:
+        """Build the shared stylesheet for the site's theme."""
+        from string import Template
+
+        if self.theme == "auto":
+            colors = {name: f"var(--rs-{name.replace('_', '-')})" for name in palette()}
+            prefix = variable_rules(root=":root")
+        else:
+            colors = palette(self.theme)
+            prefix = ""
+        styles = Template(_SITE_STYLES).substitute(colors)
+        return prefix + styles + VIEWER_STYLES + "\n"
+
+    def _page(
+        self,
+        sections: List[Tuple[str, str, str]],
+        script: str,
+        styles: str,
+        search: str,
+    ) -> str:
+        """Build ``index.html``."""
+        viewer = HTMLExporter()
+        nav = "\n".join(
+            f'            <li><a href="#{slug}">{escape(name)}</a></li>'
+            for name, slug, _ in sections
+        )
+        body = "\n".join(
+            f'        <section id="{slug}" class="rs-diagram">\n'
+            f"            <h2>{escape(name)}</h2>\n"
+            f"            <div {viewer.viewer_container_attributes(svg)} "
+            f'data-src="diagrams/{slug}.svg"></div>\n'
+            f"        </section>"
+            for name, slug, svg in sections
+        )
+        toggle = ""
+        if self.theme == "auto":
+            toggle = (
+                '\n    <button type="button" class="rs-theme-toggle" '
+                "data-rs-theme-toggle>Theme: auto</button>"
+            )
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{escape(self.title)}</title>
+    <link rel="stylesheet" href="{styles}">
+    <script defer src="{script}"></script>
+</head>
+<body>{toggle}
+    <nav class="rs-sidebar">
+        <h1>{escape(self.title)}</h1>
+        <input type="search" placeholder="Search modules, classes, methods"
+            aria-label="Search" data-rs-search={quoteattr(search)}>
+        <ol class="rs-results" data-rs-results></ol>
+        <ul class="rs-pages">
+{nav}
+        </ul>
+    </nav>
+    <main>
+{body}
+    </main>
+</body>
+</html>
+"""
+
+
+def build_search_index(
+    diagrams: List[Tuple[str, str, Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Build the compact search index of a site.
+
+    Entries are stored column-wise and sorted case-insensitively by name:
+    ``names``, a ``kinds`` string with one letter per entry (``M`` module,
+    ``c`` class, ``m`` method, ``d`` diagram), ``parents`` (index of the
+    enclosing module or class entry, or -1) and ``page`` (index into
+    ``pages``, the section anchors). Each module and class is indexed once,
+    in the first diagram that contains it.
+
+    Args:
+        diagrams: ``(name, anchor, analysis data)`` for each diagram.
+
+    Returns:
+        The index as a JSON-serializable dictionary.
+    """
+    entries: List[Tuple[str, str, Optional[int], int]] = []
+    keys: Dict[Tuple[str, str], int] = {}
+
+    def add(kind: str, name: str, key: str, parent: Optional[int], page: int) -> int:
+        if (kind, key) in keys:
+            return keys[(kind, key)]
+        keys[(kind, key)] = len(entries)
+        entries.append((kind, name, parent, page))
+        return len(entries) - 1
+
+    for page, (name, _, data) in enumerate(diagrams):
+        add("d", name, f"{page}", None, page)
+        for cls in _classes(data):
+            module = cls.get("module")
+            parent = add("M", module, module, None, page) if module else None
+            class_id = cls.get("id") or f"{module}.{cls['name']}"
+            owner = add("c", cls["name"], class_id, parent, page)
+            for method in cls.get("methods", []):
+                method_name = method["name"] if isinstance(method, dict) else method
+                add("m", method_name, f"{class_id}.{method_name}", owner, page)
+
+    order = sorted(
+        range(len(entries)), key=lambda i: (entries[i][1].lower(), entries[i][0])
+    )
+    position = {old: new for new, old in enumerate(order)}
+    parents = [entries[i][2] for i in order]
+    return {
+        "pages": [anchor for _, anchor, _ in diagrams],
+        "names": [entries[i][1] for i in order],
+        "kinds": "".join(entries[i][0] for i in order),
+        "parents": [-1 if parent is None else position[parent] for parent in parents],
+        "page": [entries[i][3] for i in order],
+    }
+
+
+def _classes(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the class descriptions in any generator's analysis data."""
+    if "classes" in data:
+        return [cls for cls in data["classes"] if not cls.get("stub")]
+    if "methods" in data and "name" in data:
+        return [data]
+    return []
+
+
+def _write_hashed(directory: Path, stem: str, suffix: str, content: str) -> str:
+    """
+    Write ``content`` to ``{stem}.{hash}{suffix}`` and remove older versions.
+
+    Returns:
+        The file name.
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    name = f"{stem}.{digest}{suffix}"
+    directory.mkdir(parents=True, exist_ok=True)
+    pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(suffix)}")
+    for old in directory.glob(f"{glob.escape(stem)}.*{suffix}"):
+        if old.name != name and pattern.fullmatch(old.name):
+            old.unlink()
+    _write_if_changed(directory / name, content)
+    return name
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write a text file unless it already has exactly this content."""
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
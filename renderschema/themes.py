@@ -0,0 +1,173 @@
+"""Theme and color scheme definitions shared by all diagram generators."""
+
+import re
+from string import Template
+from typing import Dict
+
+#: Colors per color scheme and theme. Generator stylesheets refer to these
+#: names as ``$name`` placeholders.
+COLOR_SCHEMES: Dict[str, Dict[str, Dict[str, str]]] = {
+    "tailwind": {
+        "light": {
+            "background": "#f8fafc",
+            "surface": "#ffffff",
+            "text": "#1f2937",
+            "text_muted": "#374151",
+            "divider": "#e5e7eb",
+            "uml_border": "#3b82f6",
+            "flow": "#10b981",
+            "relation": "#8b5cf6",
+            "call": "#f59e0b",
+            "sequence": "#0ea5e9",
+            "hot": "#e11d48",
+            "added": "#16a34a",
+            "removed": "#dc2626",
+        },
+        "dark": {
+            "background": "#0f172a",
+            "surface": "#1f2937",
+            "text": "#f9fafb",
+            "text_muted": "#d1d5db",
+            "divider": "#4b5563",
+            "uml_border": "#4b5563",
+            "flow": "#10b981",
+            "relation": "#8b5cf6",
+            "call": "#f59e0b",
+            "sequence": "#0ea5e9",
+            "hot": "#fb7185",
+            "added": "#16a34a",
+            "removed": "#dc2626",
+        },
+    },
+}
+
+#: Fixed themes, plus ``"auto"`` which follows the viewer's color scheme.
+THEMES = ("light", "dark", "auto")
+
+_VARIABLE = re.compile(r"var\(--rs-([\w-]+)\)")
+
+
+def palette(theme: str = "light", color_scheme: str = "tailwind") -> Dict[str, str]:
+    """
+    Look up the colors of a fixed theme.
+
+    Unknown themes fall back to the light colors and unknown color schemes
+    to ``"tailwind"``.
+
+    Args:
+        theme: ``"light"`` or ``"dark"``.
+        color_scheme: Name of an entry in ``COLOR_SCHEMES``.
+
+    Returns:
+        Mapping of color name to CSS color.
+    """
+    themes = COLOR_SCHEMES.get(color_scheme, COLOR_SCHEMES["tailwind"])
+    return themes.get(theme, themes["light"])
+
+
+def variable_rules(color_scheme: str = "tailwind", root: str = "svg") -> str:
+    """
+    Build CSS rules defining every color as a ``--rs-*`` custom property.
+
+    Light colors are the default and dark colors apply under
+    ``prefers-color-scheme: dark``. A ``data-theme="light"`` or
+    ``data-theme="dark"`` attribute on ``root`` or any ancestor overrides the
+    media query, which is how the HTML exporter's toggle works.
+
+    Args:
+        color_scheme: Name of an entry in ``COLOR_SCHEMES``.
+        root: Selector of the element that carries the properties.
+
+    Returns:
+        CSS rules as a string.
+    """
+    light = _declarations(palette("light", color_scheme))
+    dark = _declarations(palette("dark", color_scheme))
+    return (
+        f"{root} {{ {light} }}\n"
+        f"@media (prefers-color-scheme: dark) {{ {root} {{ {dark} }} }}\n"
+        f'{root}[data-theme="light"], [data-theme="light"] {root} {{ {light} }}\n'
+        f'{root}[data-theme="dark"], [data-theme="dark"] {root} {{ {dark} }}\n'
+    )
+
+
+def stylesheet(
+    css: str, markers: str = "", theme: str = "light", color_scheme: str = "tailwind"
+) -> str:
+    """
+    Render a generator's ``<defs>`` block for a theme.
+
+    Fixed themes substitute literal colors. The ``"auto"`` theme substitutes
+    ``var(--rs-*)`` references and embeds ``variable_rules()``, so a single
+    SVG follows the viewer's light or dark preference.
+
+    Args:
+        css: Style rules with ``$name`` color placeholders.
+        markers: SVG marker definitions with ``$name`` color placeholders;
+            colors must be set through ``style`` attributes so that custom
+            properties apply.
+        theme: ``"light"``, ``"dark"`` or ``"auto"``.
+        color_scheme: Name of an entry in ``COLOR_SCHEMES``.
+
+    Returns:
+        SVG ``<defs>`` markup.
+    """
+    if theme == "auto":
+        colors = {
+            name: f"var(--rs-{_property(name)})"
+            for name in palette("light", color_scheme)
+        }
+        css = _indent(variable_rules(color_scheme)) + css
+    else:
+        colors = palette(theme, color_scheme)
+    return (
+        "\n<defs>\n    <style>\n"
+        + Template(css).substitute(colors)
+        + "    </style>\n"
+        + Template(markers).substitute(colors)
+        + "</defs>"
+    )
+
+
+def resolve_variables(svg: str, theme: str = "light") -> str:
+    """
+    Replace ``var(--rs-*)`` references with the colors of a fixed theme.
+
+    Renderers without custom property support (such as cairosvg) need this
+    for SVG generated with ``theme="auto"``. The colors are read from the
+    rules embedded in the SVG itself; other SVG is returned unchanged.
+
+    Args:
+        svg: SVG markup.
+        theme: ``"light"`` or ``"dark"``.
+
+    Returns:
+        SVG markup without theme custom properties.
+    """
+    if "var(--rs-" not in svg:
+        return svg
+    rule = re.search(
+        r'svg\[data-theme="' + re.escape(theme) + r'"\][^{]*\{([^}]*)\}', svg
+    )
+    declarations = rule.group(1) if rule else ""
+    colors = dict(re.findall(r"--rs-([\w-]+):\s*([^;]+);", declarations))
+    return _VARIABLE.sub(
+        lambda match: colors.get(match.group(1), match.group(0)), svg
+    )
+
+
+def _property(name: str) -> str:
+    """Custom property suffix of a palette color name."""
+    return name.replace("_", "-")
+
+
+def _declarations(colors: Dict[str, str]) -> str:
+    """Declare each color as a ``--rs-*`` custom property."""
+    return " ".join(
+        f"--rs-{_property(name)}: {value};" for name, value in colors.items()
+    )
+
+
+def _indent(rules: str) -> str:
+    """Indent CSS rules to sit inside the generated ``<style>`` element."""
+    return "".join(f"        {line}\n" for line in rules.splitlines())
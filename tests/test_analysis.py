@@ -0,0 +1,69 @@
+"""Unit tests for the shared analysis helpers."""
+
+from renderschema.analysis import MemberEnumerator
+from renderschema.analysis.members import INTERPRETER_ATTRIBUTES
+
+
+class Base:
+    """A base class shared by many subclasses."""
+
+    def shared(self) -> None:
+        pass
+
+    def overridden(self) -> None:
+        pass
+
+
+class TestMemberEnumerator:
+    """Test suite for MemberEnumerator."""
+
+    def test_base_described_once(self):
+        """Test that a shared base is only walked once for many subclasses."""
+        seen = []
+
+        def describe(cls, name, value):
+            seen.append((cls, name))
+            return {"name": name, "owner": cls.__name__}
+
+        subclasses = [
+            type(f"Sub{i}", (Base,), {"overridden": lambda self: None})
+            for i in range(50)
+        ]
+        enumerator = MemberEnumerator(describe)
+        for sub in subclasses:
+            members = enumerator.members(sub)
+            assert members["overridden"]["owner"] == sub.__name__
+            assert members["shared"]["owner"] == "Base"
+
+        assert sum(1 for cls, _ in seen if cls is Base) == len(
+            vars(Base).keys() - INTERPRETER_ATTRIBUTES
+        )
+
+    def test_skipped_member_shadows_inherited(self):
+        """Test that a member skipped on a subclass hides the inherited one."""
+        def describe(cls, name, value):
+            return None if cls.__name__ == "Child" else {"name": name}
+
+        child = type("Child", (Base,), {"shared": None})
+        members = MemberEnumerator(describe).members(child)
+
+        assert "shared" not in members
+        assert "overridden" in members
+
+    def test_multiple_inheritance_follows_mro(self):
+        """Test that diamond hierarchies resolve members in MRO order."""
+        left = type("Left", (Base,), {"overridden": 1})
+        right = type("Right", (Base,), {"overridden": 2})
+        diamond = type("Diamond", (left, right), {})
+
+        enumerator = MemberEnumerator(lambda cls, name, value: {"owner": cls.__name__})
+        members = enumerator.members(diamond)
+
+        assert members["overridden"]["owner"] == "Left"
+
+    def test_interpreter_attributes_are_skipped(self):
+        """Test that entries the interpreter adds to classes are not members."""
+        enumerator = MemberEnumerator(lambda cls, name, value: {"name": name})
+        members = enumerator.members(Base)
+
+        assert set(members) == {"shared", "overridden"}
@@ -0,0 +1,194 @@
+"""Unit tests for render budgets."""
+
+import pytest
+
+from renderschema import RenderBudget
+from renderschema.generators.budget import (
+    _steps,
+    collapse_members,
+    count_nodes,
+    summarize_packages,
+)
+from renderschema.generators.class_diagram import ClassDiagramGenerator
+from renderschema.generators.uml import UMLDiagramGenerator
+
+
+def method(name):
+    return {
+        "visibility": "public",
+        "name": name,
+        "parameters": ["self"],
+        "return_type": None,
+    }
+
+
+UML_DATA = {
+    "type": "module",
+    "name": "app",
+    "classes": [
+        {"name": "User", "module": "app.models", "bases": [],
+         "attributes": [{"visibility": "public", "name": "name", "type": "str"}],
+         "methods": [method("save"), method("delete")]},
+        {"name": "Order", "module": "app.models", "bases": [],
+         "attributes": [], "methods": [method("total")]},
+        {"name": "Api", "module": "app.web", "bases": [],
+         "attributes": [], "methods": []},
+    ],
+}
+
+
+def class_data(count):
+    """A class diagram of ``count`` classes spread over four subpackages."""
+    classes = [
+        {"id": f"app.pkg{i % 4}.mod{i % 8}.C{i}", "name": f"C{i}",
+         "module": f"app.pkg{i % 4}.mod{i % 8}", "bases": [], "base_ids": [],
+         "associations": [], "methods": []}
+        for i in range(count)
+    ]
+    relationships = [
+        {"type": "association", "from": classes[i]["id"], "to": classes[i - 1]["id"]}
+        for i in range(1, count)
+    ]
+    return {
+        "type": "class", "name": "app",
+        "classes": classes, "relationships": relationships,
+    }
+
+
+class TestRenderBudget:
+    """Test suite for render budgets."""
+
+    def test_validation(self):
+        """Test that limits must be positive and budgets can be given as mappings."""
+        with pytest.raises(ValueError, match="max_nodes"):
+            RenderBudget(max_nodes=0)
+        assert RenderBudget.coerce({"max_bytes": 10}).max_bytes == 10
+        with pytest.raises(TypeError):
+            RenderBudget.coerce(5)
+
+    def test_reductions(self):
+        """Test member collapsing and package summaries."""
+        assert count_nodes(UML_DATA) == 7
+        collapsed = collapse_members(UML_DATA)
+        assert count_nodes(collapsed) == 3
+        assert collapse_members(collapsed) is None
+        assert count_nodes(UML_DATA["classes"][0]) == 4
+        assert collapse_members(UML_DATA["classes"][0])["methods"] == []
+
+        summary = summarize_packages(class_data(16), depth=2)
+        assert [cls["name"] for cls in summary["classes"]] == [
+            f"app.pkg{i} (4 classes)" for i in range(4)
+        ]
+        edge = {
+            "type": "association", "from": "app.pkg1", "to": "app.pkg0", "label": "4"
+        }
+        assert edge in summary["relationships"]
+        assert len(summarize_packages(class_data(16), depth=3)["classes"]) == 8
+        assert summarize_packages(class_data(8), depth=3) is None
+
+    def test_unbudgeted_generate_is_unchanged(self):
+        """Test that generators without a budget render as before."""
+        generator = UMLDiagramGenerator.from_analysis(UML_DATA)
+        budgeted = UMLDiagramGenerator.from_analysis(
+            UML_DATA, budget=RenderBudget(max_nodes=100)
+        )
+
+        lines = budgeted.to_svg().splitlines()
+        assert lines[1].startswith("<!-- render budget: degraded: none;")
+        assert "\n".join(lines[:1] + lines[2:]) == generator.to_svg()
+        assert budgeted.generate() == generator.generate()
+        assert generator.last_render_report is None
+        assert budgeted.last_render_report["degraded"] == []
+
+    def test_export_paths_honour_the_budget(self, tmp_path):
+        """Test that exports and streamed exports apply the budget."""
+        generator = UMLDiagramGenerator.from_analysis(UML_DATA, budget={"max_nodes": 5})
+
+        assert b"degraded: collapsed members" in generator.to_bytes("svg")
+        generator.stream_export(tmp_path / "app.svg")
+        streamed = (tmp_path / "app.svg").read_text(encoding="utf-8")
+        assert "degraded: collapsed members" in streamed
+        assert "save(" not in streamed
+
+    def test_collapses_members_to_fit_nodes(self):
+        """Test that members are dropped when the boxes would exceed max_nodes."""
+        generator = UMLDiagramGenerator.from_analysis(UML_DATA, budget={"max_nodes": 5})
+        svg = generator.to_svg()
+
+        assert generator.last_render_report["degraded"] == ["collapsed members"]
+        assert "save(" not in svg and ">User<" in svg
+        assert "<!-- render budget: degraded: collapsed members; 3 of 7 elements" in svg
+
+    def test_summarizes_packages_and_simplifies_layout(self):
+        """Test that packages are summarized and the layout simplified in turn."""
+        data = class_data(40)
+        generator = ClassDiagramGenerator.from_analysis(
+            data, layout="force", budget=RenderBudget(max_nodes=10)
+        )
+        svg = generator.to_svg()
+        report = generator.last_render_report
+
+        assert report["degraded"] == ["summarized packages (depth 3)"]
+        assert report["nodes"] == 8 and report["full_nodes"] == 40
+        assert "app.pkg0.mod0 (5 classes)" in svg
+
+        full = ClassDiagramGenerator.from_analysis(data, layout="force").generate()
+        generator = ClassDiagramGenerator.from_analysis(
+            data, layout="force", budget=RenderBudget(max_bytes=len(full) // 3)
+        )
+        generator.to_svg()
+        degraded = generator.last_render_report["degraded"]
+        assert degraded[0].startswith("summarized packages")
+        assert generator.last_render_report["within_budget"]
+
+        *_, (degraded, _, options) = _steps(generator, data, {"layout": "force"})
+        assert degraded == ["summarized packages (depth 1)", "vertical layout"]
+        assert options == {"layout": "vertical"}
+
+    def test_estimates_time_before_the_first_render(self, monkeypatch):
+        """Test that a render expected to overrun max_seconds is never started."""
+        from renderschema.generators import class_diagram
+
+        laid_out = []
+        force_layout = class_diagram.force_layout
+
+        def recording_layout(nodes, *args, **kwargs):
+            laid_out.append(len(nodes))
+            return force_layout(nodes, *args, **kwargs)
+
+        monkeypatch.setattr(class_diagram, "force_layout", recording_layout)
+        monkeypatch.setattr(
+            ClassDiagramGenerator, "LAYOUT_SECONDS_PER_NODE", {"force": 1.0}
+        )
+        generator = ClassDiagramGenerator.from_analysis(
+            class_data(40), layout="force", budget=RenderBudget(max_seconds=30)
+        )
+        generator.to_svg()
+
+        assert laid_out == [8]
+        report = generator.last_render_report
+        assert report["degraded"] == ["summarized packages (depth 3)"]
+
+    def test_placeholder_when_nothing_fits(self):
+        """Test the placeholder returned when no step fits the budget."""
+        generator = ClassDiagramGenerator.from_analysis(
+            class_data(40), budget=RenderBudget(max_bytes=100)
+        )
+        svg = generator.to_svg()
+
+        assert generator.last_render_report["degraded"] == ["placeholder"]
+        assert not generator.last_render_report["within_budget"]
+        assert "app: 40 elements" in svg
+
+    def test_max_bytes_counts_the_comment(self):
+        """Test that the reported and limited size is that of the annotated SVG."""
+        full = UMLDiagramGenerator.from_analysis(UML_DATA).generate()
+        generator = UMLDiagramGenerator.from_analysis(
+            UML_DATA, budget={"max_bytes": len(full.encode("utf-8"))}
+        )
+        svg = generator.to_svg()
+        report = generator.last_render_report
+
+        assert report["bytes"] == len(svg.encode("utf-8"))
+        assert report["degraded"] == ["collapsed members"]
+        assert report["within_budget"] and report["bytes"] <= len(full)
@@ -0,0 +1,130 @@
+"""Unit tests for the call graph generator and symbol table."""
+
+import pytest
+
+from renderschema import diagram
+from renderschema.analysis.symbols import SymbolTable
+from renderschema.generators.call_graph import CallGraphGenerator
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small project exercising the supported resolution rules."""
+    root = tmp_path / "proj"
+    (root / "store").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "store" / "__init__.py").write_text(
+        "from .backend import Backend as Storage\n"
+    )
+    (root / "store" / "backend.py").write_text(
+        "class Base:\n"
+        "    def write(self, item):\n"
+        "        return self.encode(item)\n\n"
+        "    def encode(self, item):\n"
+        "        return str(item)\n\n"
+        "class Backend(Base):\n"
+        "    def write(self, item):\n"
+        "        return super().write(item)\n"
+    )
+    (root / "service.py").write_text(
+        "from proj.store import Storage\n"
+        "from proj import helpers as h\n\n"
+        "class Service:\n"
+        "    storage: Storage\n\n"
+        "    def __init__(self):\n"
+        "        self.cache = Storage()\n\n"
+        "    def save(self, item):\n"
+        "        h.validate(item)\n"
+        "        self.cache.write(item)\n"
+        "        return self.storage.write(item)\n\n"
+        "def main():\n"
+        "    service = Service()\n"
+        "    service.save(1)\n"
+    )
+    (root / "helpers.py").write_text(
+        "def validate(item):\n    return check(item)\n\n"
+        "def check(item):\n    return item is not None\n"
+    )
+    return tmp_path
+
+
+class TestSymbolTable:
+    """Test suite for static call resolution."""
+
+    def test_resolves_imports_aliases_self_and_attributes(self, project):
+        """Test resolution through aliases, re-exports, self, super and attributes."""
+        table = SymbolTable.build(project, workers=0)
+
+        assert table.callees("proj.service.main") == [
+            "proj.service.Service.__init__",
+            "proj.service.Service.save",
+        ]
+        assert table.callees("proj.service.Service.save") == [
+            "proj.helpers.validate",
+            "proj.store.backend.Backend.write",
+        ]
+        assert table.callees("proj.store.backend.Backend.write") == [
+            "proj.store.backend.Base.write",
+        ]
+        assert table.callees("proj.store.backend.Base.write") == [
+            "proj.store.backend.Base.encode",
+        ]
+
+    def test_call_graph_depth(self, project):
+        """Test breadth-first collection with a depth limit."""
+        table = SymbolTable.build(project, workers=0)
+
+        nodes, edges = table.call_graph("proj.service.main", max_depth=2)
+
+        assert dict(nodes)["proj.helpers.validate"] == 2
+        assert "proj.helpers.check" not in dict(nodes)
+        assert ("proj.service.main", "proj.service.Service.save") in edges
+
+        with pytest.raises(ValueError, match="Unknown function"):
+            table.call_graph("proj.missing")
+
+
+class TestCallGraphGenerator:
+    """Test suite for CallGraphGenerator."""
+
+    def test_generate_with_shared_index(self, project):
+        """Test rendering call graphs from one prebuilt index."""
+        table = SymbolTable.build(project, workers=0)
+        generator = diagram("proj.service.main", diagram_type="callgraph", index=table)
+
+        svg = generator.generate()
+
+        assert isinstance(generator, CallGraphGenerator)
+        assert 'class="call-node root"' in svg
+        assert "Service.save" in svg
+        assert svg.count('class="call-edge"') == len(generator.analyze()["edges"])
+
+    def test_function_target(self):
+        """Test resolving a function object against its own package."""
+        from renderschema import core
+
+        generator = CallGraphGenerator(core.diagram, workers=0)
+        data = generator.analyze()
+
+        assert data["name"] == "renderschema.core.diagram"
+        ids = [node["id"] for node in data["nodes"]]
+        assert "renderschema.registry.Registry.get" in ids
+        assert "index" not in generator.options
+        assert "index" not in generator.snapshot().options
+
+    def test_labels_are_escaped(self):
+        """Test that node names are escaped in the SVG."""
+        data = {
+            "type": "call_graph",
+            "name": "app.main",
+            "nodes": [
+                {"id": "app.main", "name": "main", "module": "app", "depth": 0},
+                {"id": "app.<lambda>", "name": "<lambda>", "module": "app", "depth": 1},
+            ],
+            "edges": [{"from": "app.main", "to": "app.<lambda>"}],
+        }
+
+        svg = CallGraphGenerator.from_analysis(data).generate()
+
+        assert "<lambda>" not in svg
+        assert "<title>app.&lt;lambda&gt;</title>&lt;lambda&gt;</text>" in svg
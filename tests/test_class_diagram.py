@@ -0,0 +1,414 @@
+"""Unit tests for the class relationship diagram generator."""
+
+import importlib
+from typing import Dict, List, Optional
+
+import pytest
+
+from renderschema.generators.class_diagram import ClassDiagramGenerator
+
+
+class Engine:
+    """An engine."""
+
+    power: int
+
+
+class Wheel:
+    """A wheel."""
+
+
+class Driver:
+    """A driver."""
+
+
+class Vehicle:
+    """A vehicle owning an engine and referring to its driver."""
+
+    engine: Engine
+    wheels: List[Wheel]
+    driver: Optional["Driver"]
+    spares: Dict[str, "Wheel"]
+
+
+class Car(Vehicle):
+    """A car inherits the vehicle's associations."""
+
+
+class Node:
+    """A linked list node referring to its own class."""
+
+    next: Optional["Node"]
+
+
+# Same short name as the class above, but from a different module.
+ForeignDriver = type("Driver", (), {"__module__": "elsewhere.people"})
+
+
+def _edges(data):
+    return {
+        (rel["type"], rel["from"].rsplit(".", 1)[-1], rel["to"].rsplit(".", 1)[-1])
+        for rel in data["relationships"]
+    }
+
+
+class TestClassDiagramGenerator:
+    """Test suite for ClassDiagramGenerator."""
+
+    def test_inheritance_relationship(self):
+        """Test that inheritance edges use qualified class identifiers."""
+        data = ClassDiagramGenerator([Vehicle, Car]).analyze()
+
+        assert {
+            "type": "inheritance",
+            "from": f"{__name__}.Car",
+            "to": f"{__name__}.Vehicle",
+        } in data["relationships"]
+
+    def test_associations_from_type_hints(self):
+        """Test composition, aggregation and association edge kinds."""
+        data = ClassDiagramGenerator([Vehicle, Engine, Wheel, Driver]).analyze()
+
+        assert _edges(data) == {
+            ("composition", "Vehicle", "Engine"),
+            ("aggregation", "Vehicle", "Wheel"),
+            ("association", "Vehicle", "Driver"),
+        }
+
+    def test_inherited_associations_drawn_once(self):
+        """Test that inherited hints only produce edges from the declaring base."""
+        with_base = ClassDiagramGenerator([Vehicle, Car, Engine]).analyze()
+        without_base = ClassDiagramGenerator([Car, Engine]).analyze()
+
+        assert ("composition", "Car", "Engine") not in _edges(with_base)
+        assert ("composition", "Car", "Engine") in _edges(without_base)
+
+    def test_name_collision_creates_no_edge(self):
+        """Test that a same-named class from another module is not linked."""
+        data = ClassDiagramGenerator([Vehicle, ForeignDriver]).analyze()
+
+        assert _edges(data) == set()
+
+    def test_generate_draws_association_lines(self):
+        """Test that associations are rendered with their relationship kind."""
+        svg = ClassDiagramGenerator([Vehicle, Engine, Wheel]).generate()
+
+        assert 'class="association-line composition"' in svg
+        assert 'class="association-line aggregation"' in svg
+
+
+class TestPackageAnalysis:
+    """Test suite for recursive package analysis."""
+
+    @pytest.fixture
+    def package(self, tmp_path, monkeypatch):
+        """Create an importable package with healthy and misbehaving modules."""
+        root = tmp_path / "rs_samplepkg"
+        (root / "sub").mkdir(parents=True)
+        (root / "__init__.py").write_text("")
+        (root / "base.py").write_text("class Base:\n    pass\n")
+        (root / "sub" / "__init__.py").write_text("")
+        (root / "sub" / "child.py").write_text(
+            "from rs_samplepkg.base import Base\n\n"
+            "class Child(Base):\n    owner: Base\n"
+        )
+        (root / "broken.py").write_text("raise RuntimeError('<import_error>')\n")
+        (root / "crash.py").write_text("import os\nos._exit(3)\n")
+        (root / "slow.py").write_text("import time\ntime.sleep(60)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        return importlib.import_module("rs_samplepkg")
+
+    def test_recursive_analysis_isolates_failures(self, package):
+        """Test that crashing, failing and slow imports do not stop the run."""
+        data = ClassDiagramGenerator(
+            package, recursive=True, workers=2, import_timeout=3
+        ).analyze()
+
+        statuses = {m["name"]: m["status"] for m in data["modules"]}
+        assert statuses == {
+            "rs_samplepkg": "ok",
+            "rs_samplepkg.base": "ok",
+            "rs_samplepkg.broken": "error",
+            "rs_samplepkg.crash": "crashed",
+            "rs_samplepkg.slow": "timeout",
+            "rs_samplepkg.sub": "ok",
+            "rs_samplepkg.sub.child": "ok",
+        }
+        assert {(r["type"], r["from"], r["to"]) for r in data["relationships"]} == {
+            ("inheritance", "rs_samplepkg.sub.child.Child", "rs_samplepkg.base.Base"),
+            ("composition", "rs_samplepkg.sub.child.Child", "rs_samplepkg.base.Base"),
+        }
+
+    def test_filters_and_subpackage_split(self, package):
+        """Test depth/exclude filters and one diagram per subpackage."""
+        generator = ClassDiagramGenerator(
+            package,
+            recursive=True,
+            workers=0,
+            exclude=["rs_samplepkg.crash", "rs_samplepkg.slow", "*.broken"],
+        )
+
+        diagrams = generator.subpackage_diagrams()
+
+        assert sorted(diagrams) == ["rs_samplepkg", "rs_samplepkg.sub"]
+        sub_svg = diagrams["rs_samplepkg.sub"].to_svg()
+        assert ">Child<" in sub_svg
+        assert ">Base<" not in sub_svg
+
+        shallow = ClassDiagramGenerator(
+            package, recursive=True, workers=0, max_depth=1,
+            include=["rs_samplepkg.ba*", "rs_samplepkg.sub*"],
+        ).analyze()
+        assert [m["name"] for m in shallow["modules"]] == [
+            "rs_samplepkg.base", "rs_samplepkg.sub"
+        ]
+
+
+class TestPartitioning:
+    """Test suite for partitioning class graphs into pages."""
+
+    def test_partition_by_package(self):
+        """Test grouping classes into one page per module plus an overview."""
+        pages = ClassDiagramGenerator(
+            [Vehicle, Engine, ForeignDriver], max_cluster_size=2
+        ).partition()
+
+        assert set(pages) == {"overview", __name__, "elsewhere.people"}
+        overview = pages["overview"]
+        assert [c["name"] for c in overview["classes"]] == [
+            f"{__name__} (2)", "elsewhere.people (1)"
+        ]
+
+    def test_cluster_cannot_replace_overview(self):
+        """Test that a package named like the overview page gets its own page."""
+        report = type("Report", (), {"__module__": "overview"})
+
+        pages = ClassDiagramGenerator([Vehicle, report]).partition()
+
+        assert pages["overview"]["type"] == "overview"
+        assert [c["name"] for c in pages["overview-2"]["classes"]] == ["Report"]
+        linked = {c["page"] for c in pages["overview"]["classes"]}
+        assert linked == {__name__, "overview-2"}
+
+    def test_community_partition_splits_components(self):
+        """Test that disconnected groups land in different communities."""
+        pages = ClassDiagramGenerator(
+            [Vehicle, Engine, Wheel, Driver, ForeignDriver], partition="community"
+        ).partition()
+
+        clusters = [
+            sorted(c["name"] for c in page["classes"] if not c.get("stub"))
+            for name, page in pages.items() if name != "overview"
+        ]
+        assert sorted(clusters) == [
+            ["Driver"], ["Driver", "Engine", "Vehicle", "Wheel"]
+        ]
+
+    def test_oversized_clusters_get_stub_links(self, tmp_path):
+        """Test exporting split pages with links between them."""
+        generator = ClassDiagramGenerator(
+            [Vehicle, Engine, Wheel, Driver], max_cluster_size=2
+        )
+
+        paths = generator.export_pages(tmp_path, workers=2)
+
+        assert [p.name for p in paths] == [
+            "overview.svg",
+            f"{__name__}_1.svg",
+            f"{__name__}_2.svg",
+        ]
+        first_page = paths[1].read_text()
+        assert 'class="class-box stub"' in first_page
+        assert f'<a href="{__name__}_2.svg">' in first_page
+        assert f'<a href="{__name__}_1.svg">' in paths[0].read_text()
+
+    def test_unknown_partition_strategy(self):
+        """Test that an unknown strategy is rejected."""
+        with pytest.raises(ValueError, match="Unknown partition strategy"):
+            ClassDiagramGenerator([Vehicle], partition="random").partition()
+
+
+class TestRendering:
+    """Test suite for class diagram layout and edge rendering."""
+
+    def test_edges_are_orthogonal_paths(self):
+        """Test that relationships are routed as paths instead of lines."""
+        svg = ClassDiagramGenerator([Vehicle, Engine, Car], layout="layered").generate()
+
+        assert "<line" not in svg
+        assert '<path d="M' in svg
+
+    def test_force_layout(self):
+        """Test that the force layout places every class."""
+        svg = ClassDiagramGenerator(
+            [Engine, Wheel, Driver, Vehicle, Car], layout="force", seed=1
+        ).generate()
+
+        assert svg.count('class="class-box"') == 5
+        assert "<path" in svg
+
+    @pytest.mark.parametrize("layout", ["vertical", "layered", "force"])
+    def test_self_associations_are_drawn(self, layout):
+        """Test that an association of a class with itself is a visible loop."""
+        svg = ClassDiagramGenerator([Node], layout=layout).generate()
+
+        paths = [
+            line for line in svg.splitlines() if 'class="association-line' in line
+        ]
+        assert len(paths) == 1 and paths[0].count("V") + paths[0].count("H") >= 4
+
+    def test_unknown_layout(self):
+        """Test that an unknown layout is rejected."""
+        with pytest.raises(ValueError, match="Unknown layout"):
+            ClassDiagramGenerator([Vehicle], layout="circular").generate()
+
+
+class TestRelationshipIndex:
+    """Test suite for neighbourhood queries on a persistent relationship index."""
+
+    @pytest.fixture
+    def index_path(self, tmp_path):
+        from renderschema.analysis import RelationshipIndex
+
+        data = ClassDiagramGenerator([Engine, Wheel, Driver, Vehicle, Car]).analyze()
+        path = tmp_path / "classes.db"
+        with RelationshipIndex(path) as index:
+            index.add(data)
+        return path
+
+    def test_neighbourhood_hops_and_kinds(self, index_path):
+        """Test that queries expand by hop count and relationship kind."""
+        from renderschema.analysis import RelationshipIndex
+
+        with RelationshipIndex(index_path) as index:
+            assert len(index) == 5
+            one_hop = index.neighbourhood("Car")
+            two_hops = index.neighbourhood("Car", hops=2)
+            inheritance = index.neighbourhood("Car", hops=2, kinds=["inheritance"])
+
+        assert {cls["name"] for cls in one_hop["classes"]} == {"Car", "Vehicle"}
+        assert {cls["name"] for cls in two_hops["classes"]} == {
+            "Car", "Vehicle", "Engine", "Wheel", "Driver"
+        }
+        assert ("composition", "Vehicle", "Engine") in _edges(two_hops)
+        assert _edges(inheritance) == {("inheritance", "Car", "Vehicle")}
+
+    def test_from_index_renders_without_analysis(self, index_path):
+        """Test that a neighbourhood renders directly from the index."""
+        from renderschema.analysis import RelationshipIndex
+
+        with RelationshipIndex(index_path) as index:
+            svg = ClassDiagramGenerator.from_index(
+                index, f"{__name__}.Engine", direction="in"
+            ).generate()
+            with pytest.raises(ValueError, match="Unknown class"):
+                index.neighbourhood("Missing")
+
+        assert svg.count('class="class-box"') == 2
+        assert 'class="association-line composition"' in svg
+
+    def test_edges_across_separately_added_batches(self, tmp_path):
+        """Test that relationships to classes added later are kept."""
+        from renderschema.analysis import RelationshipIndex
+
+        with RelationshipIndex(tmp_path / "classes.db") as index:
+            for batch in ([Car], [Vehicle], [Engine, Wheel, Driver]):
+                index.add(ClassDiagramGenerator(batch).analyze())
+            separate = index.neighbourhood("Car", hops=2)
+        with RelationshipIndex() as index:
+            classes = [Engine, Wheel, Driver, Vehicle, Car]
+            index.add(ClassDiagramGenerator(classes).analyze())
+            together = index.neighbourhood("Car", hops=2)
+
+        assert ("inheritance", "Car", "Vehicle") in _edges(separate)
+        assert ("composition", "Vehicle", "Engine") in _edges(separate)
+        assert _edges(separate) == _edges(together)
+
+    def test_external_bases_do_not_link_classes(self):
+        """Test that hops never pass through classes missing from the index."""
+        from renderschema.analysis import RelationshipIndex
+
+        classes = [
+            type(name, (Exception,), {"__module__": __name__})
+            for name in ("ErrA", "ErrB", "ErrC")
+        ]
+        with RelationshipIndex() as index:
+            index.add(ClassDiagramGenerator(classes).analyze())
+            data = index.neighbourhood("ErrA", hops=2)
+
+        assert [cls["name"] for cls in data["classes"]] == ["ErrA"]
+        assert data["relationships"] == []
+
+
+class TestHistory:
+    """Test suite for class diagrams of git history."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create a repository with three tagged revisions."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                cwd=tmp_path, check=True, capture_output=True,
+            )
+
+        src = tmp_path / "src" / "app"
+        src.mkdir(parents=True)
+        (src / "__init__.py").write_text("")
+        (src / "base.py").write_text("class Base:\n    pass\n")
+        (src / "models.py").write_text(
+            "from typing import List\nfrom .base import Base\n\n"
+            "class Part:\n    pass\n\nclass Machine(Base):\n    parts: List[Part]\n"
+        )
+        git("init", "-q")
+        git("add", ".")
+        git("commit", "-qm", "one")
+        git("tag", "v1")
+        (tmp_path / "README").write_text("docs only\n")
+        git("add", ".")
+        git("commit", "-qm", "two")
+        git("tag", "v2")
+        (src / "models.py").write_text(
+            "from .base import Base\n\nclass Machine(Base):\n    pass\n\n"
+            "class Robot(Machine):\n    pass\n"
+        )
+        git("add", ".")
+        git("commit", "-qm", "three")
+        git("tag", "v3")
+        return tmp_path
+
+    def test_snapshots_reuse_blob_analysis(self, repository):
+        """Test that unchanged files are parsed once across revisions."""
+        from renderschema.analysis.history import HistoryAnalyzer
+
+        with HistoryAnalyzer(repository, root="src") as history:
+            v1, v2, v3 = history.snapshots(["v1", "v2", "v3"])
+
+            assert history.parsed_blobs == 4
+
+        assert v1["tree"] == v2["tree"]
+        assert {cls["id"] for cls in v1["classes"]} == {
+            "app.base.Base", "app.models.Part", "app.models.Machine",
+        }
+        assert {(r["type"], r["from"], r["to"]) for r in v1["relationships"]} == {
+            ("inheritance", "app.models.Machine", "app.base.Base"),
+            ("aggregation", "app.models.Machine", "app.models.Part"),
+        }
+        assert "app.models.Robot" in {cls["id"] for cls in v3["classes"]}
+
+    def test_export_history_with_diffs(self, repository, tmp_path):
+        """Test exporting every tag plus animated diffs between changes."""
+        output = tmp_path / "out"
+        paths = ClassDiagramGenerator.export_history(
+            repository, output, root="src", diffs=True, layout="layered"
+        )
+
+        assert [p.name for p in paths] == ["v1.svg", "v2.svg", "v3.svg", "v2..v3.svg"]
+        assert (output / "v1.svg").read_text() == (output / "v2.svg").read_text()
+        diff = (output / "v2..v3.svg").read_text()
+        assert '<g class="added">' in diff
+        assert '<g class="removed">' in diff
+        assert "aggregation removed" in diff
+        assert "@keyframes rs-added" in diff
@@ -1,9 +1,10 @@
 """Unit tests for the core diagram function."""
 
 import pytest
+
 from renderschema import diagram
-from renderschema.generators.uml import UMLDiagramGenerator
 from renderschema.generators.flowchart import FlowchartGenerator
+from renderschema.generators.uml import UMLDiagramGenerator
 
 
 class TestClass:
@@ -44,3 +45,150 @@ class TestDiagramFunction:
         gen = diagram(TestClass, theme="dark", color_scheme="custom")
         assert gen.theme == "dark"
         assert gen.options["color_scheme"] == "custom"
+
+
+class TestRegistry:
+    """Test suite for the lazy generator and exporter registries."""
+
+    def test_lazy_reference_imported_on_first_use(self, tmp_path, monkeypatch):
+        """Test that a registered module is only imported when requested."""
+        import sys
+
+        from renderschema.registry import Registry
+
+        (tmp_path / "rs_lazy_plugin.py").write_text("class Plugin:\n    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        registry = Registry("rs.test", {"lazy": "rs_lazy_plugin:Plugin"})
+
+        assert "rs_lazy_plugin" not in sys.modules
+        plugin = registry.get("LAZY")
+        assert plugin.__name__ == "Plugin"
+        assert registry.get("lazy") is plugin
+
+    def test_reentrant_plugin_import(self, tmp_path, monkeypatch):
+        """Test that a plugin looking up the registry on import does not deadlock."""
+        import threading
+
+        from renderschema import registry as registry_module
+
+        (tmp_path / "rs_reentrant_plugin.py").write_text(
+            "from renderschema.registry import generators\n"
+            "Base = generators.get('uml')\n"
+            "class Plugin(Base):\n"
+            "    pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        registry = registry_module.generators
+        monkeypatch.setattr(registry, "_targets", dict(registry._targets))
+        monkeypatch.setattr(registry, "_resolved", dict(registry._resolved))
+        registry.register("reentrant", "rs_reentrant_plugin:Plugin")
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(registry.get("reentrant")), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive(), "registry lookup deadlocked"
+        assert issubclass(results[0], UMLDiagramGenerator)
+        assert registry.get("reentrant") is results[0]
+
+    def test_entry_points_loaded_only_on_miss(self, monkeypatch):
+        """Test that entry points are scanned on a miss and loaded individually."""
+        from renderschema import registry as registry_module
+
+        loaded = []
+
+        class FakeEntryPoint:
+            def __init__(self, name):
+                self.name = name
+
+            def load(self):
+                loaded.append(self.name)
+                return FlowchartGenerator
+
+        scans = []
+
+        def fake_entry_points(group):
+            scans.append(group)
+            return [FakeEntryPoint("chart"), FakeEntryPoint("other")]
+
+        monkeypatch.setattr(registry_module, "_iter_entry_points", fake_entry_points)
+        registry = registry_module.Registry("rs.test", {"uml": UMLDiagramGenerator})
+
+        assert registry.get("uml") is UMLDiagramGenerator
+        assert scans == []
+        assert registry.get("chart") is FlowchartGenerator
+        assert registry.get("missing") is None
+        assert scans == ["rs.test"]
+        assert loaded == ["chart"]
+        assert registry.names() == ["chart", "other", "uml"]
+
+    def test_register_generator(self):
+        """Test that registered generators are available to diagram()."""
+        from renderschema import register_generator
+
+        class CustomGenerator(UMLDiagramGenerator):
+            pass
+
+        register_generator("custom-uml", CustomGenerator)
+        generator = diagram(TestClass, diagram_type="custom-uml")
+        assert isinstance(generator, CustomGenerator)
+
+
+class TestDiagramSnapshot:
+    """Test suite for immutable snapshots and concurrent rendering."""
+
+    def test_snapshot_is_immutable(self):
+        """Test that snapshot data and attributes cannot be modified."""
+        snapshot = diagram(TestClass).snapshot()
+
+        with pytest.raises(TypeError):
+            snapshot.data["name"] = "Other"
+        with pytest.raises(AttributeError):
+            snapshot.options = {}
+        assert isinstance(snapshot.data["attributes"], tuple)
+
+    def test_concurrent_renders_share_one_analysis(self, tmp_path):
+        """Test that threads render many themes from a single analysis."""
+        calls = []
+
+        class CountingGenerator(UMLDiagramGenerator):
+            def analyze(self):
+                calls.append(1)
+                return super().analyze()
+
+        generator = CountingGenerator(TestClass)
+        snapshot = generator.snapshot()
+        svgs = snapshot.render_many(
+            [{"theme": "light"}, {"theme": "dark"}] * 8, workers=4
+        )
+        written = snapshot.export_many(
+            {tmp_path / "light.svg": {}, tmp_path / "dark.svg": {"theme": "dark"}},
+            workers=2,
+        )
+
+        assert calls == [1]
+        assert len(set(svgs)) == 2
+        assert svgs[0] == generator.to_svg()
+        assert written == [True, True]
+        assert "#1f2937" in (tmp_path / "dark.svg").read_text()
+
+    def test_shared_generator_analyzes_once(self):
+        """Test that threads sharing a generator analyze it only once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+
+        class CountingGenerator(UMLDiagramGenerator):
+            def analyze(self):
+                calls.append(1)
+                return super().analyze()
+
+        generator = CountingGenerator(TestClass)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: generator.to_svg(), range(16)))
+
+        assert calls == [1]
+        assert len(set(results)) == 1
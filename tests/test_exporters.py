@@ -1,8 +1,27 @@
 """Unit tests for SVG exporter."""
 
-import pytest
+import gzip
+import io
+import sys
 from pathlib import Path
+
+import pytest
+
+from renderschema.exporters.html import HTMLExporter
+from renderschema.exporters.manifest import OutputManifest
+from renderschema.exporters.pdf import PDFExporter
+from renderschema.exporters.png import PNGExporter
 from renderschema.exporters.svg import SVGExporter
+from renderschema.exporters.svgz import SVGZExporter
+from renderschema.generators.class_diagram import ClassDiagramGenerator
+from renderschema.generators.uml import UMLDiagramGenerator
+from renderschema.site import SiteBuilder, build_search_index
+
+
+class Sample:
+    """A small class to export."""
+
+    value: int = 1
 
 
 class TestSVGExporter:
@@ -13,9 +32,9 @@ class TestSVGExporter:
         exporter = SVGExporter()
         output_file = tmp_path / "test.svg"
         svg_content = '<svg><rect x="0" y="0" width="100" height="100"/></svg>'
-        
+
         exporter.export(svg_content, output_file)
-        
+
         assert output_file.exists()
         assert output_file.read_text() == svg_content
 
@@ -24,8 +43,417 @@ class TestSVGExporter:
         exporter = SVGExporter()
         output_file = tmp_path / "subdir" / "test.svg"
         svg_content = "<svg></svg>"
-        
+
         exporter.export(svg_content, output_file)
-        
+
         assert output_file.exists()
         assert output_file.parent.exists()
+
+    def test_export_to_file_object_and_bytes(self):
+        """Test that SVG and HTML can be written without touching the disk."""
+        generator = UMLDiagramGenerator(Sample)
+        buffer = io.BytesIO()
+
+        assert generator.export(buffer, format="svg")
+        assert buffer.getvalue() == generator.to_svg().encode("utf-8")
+        assert not buffer.closed
+        assert generator.to_bytes("html").startswith(b"<!DOCTYPE html>")
+
+    def test_png_requires_cairosvg_without_writing(self, monkeypatch):
+        """Test that a missing dependency is reported before writing."""
+        monkeypatch.setitem(sys.modules, "cairosvg", None)
+        buffer = io.BytesIO()
+
+        with pytest.raises(ImportError, match="pip install cairosvg"):
+            PNGExporter().export("<svg></svg>", buffer)
+        assert buffer.getvalue() == b""
+
+
+class TestSVGZExporter:
+    """Test suite for SVGZExporter."""
+
+    def test_export_is_reproducible_gzip(self, tmp_path):
+        """Test that .svgz output decompresses to the SVG and is deterministic."""
+        generator = UMLDiagramGenerator(Sample)
+        output_file = tmp_path / "sample.svgz"
+
+        generator.export(output_file)
+
+        data = output_file.read_bytes()
+        assert gzip.decompress(data) == generator.to_svg().encode("utf-8")
+        assert SVGZExporter().to_bytes(generator.to_svg()) == data
+
+    def test_stream_export_compresses_chunks(self, tmp_path):
+        """Test that streamed chunks are compressed into one gzip member."""
+        output_file = tmp_path / "stream.svgz"
+        chunks = ["<svg>", "<g/>" * 10000, "</svg>"]
+
+        UMLDiagramGenerator(Sample).stream_export(output_file)
+        SVGZExporter().export_stream(iter(chunks), output_file)
+
+        assert gzip.decompress(output_file.read_bytes()).decode() == "".join(chunks)
+
+
+class TestHTMLExporter:
+    """Test suite for HTMLExporter."""
+
+    def test_interactive_viewer_structure(self, sample_svg):
+        """Test that interactive output embeds the viewBox-based viewer."""
+        html = HTMLExporter().to_string(sample_svg)
+
+        assert "<?xml" not in html
+        assert "data-rs-viewer" in html
+        assert 'tabindex="0"' in html
+        assert 'data-degrade="false"' in html
+        assert "requestAnimationFrame" in html
+        assert "'viewBox'" in html
+        assert "transform" not in html
+
+    def test_non_interactive_has_no_viewer(self, sample_svg):
+        """Test that non-interactive output omits the viewer script."""
+        html = HTMLExporter().to_string(sample_svg, interactive=False)
+
+        assert "data-rs-viewer" not in html
+        assert "<script>" not in html
+        assert 'width="400" height="300"' in html
+
+    def test_large_diagram_degrades(self):
+        """Test that very large diagrams are flagged for degraded interaction."""
+        rects = '<rect x="0" y="0" width="1" height="1"/>' * 50000
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+            f"{rects}</svg>"
+        )
+
+        html = HTMLExporter().to_string(svg)
+
+        assert 'data-degrade="true"' in html
+        assert 'data-element-count="50002"' in html
+
+    def test_auto_theme_toggle(self):
+        """Test that auto-themed pages follow the color scheme and can toggle it."""
+        svg = UMLDiagramGenerator(Sample, theme="auto").to_svg()
+
+        auto = HTMLExporter().to_string(svg, theme="auto")
+        light = HTMLExporter().to_string(svg, theme="light")
+
+        assert "data-rs-theme-toggle" in auto
+        assert "background-color: var(--rs-background)" in auto
+        assert ':root[data-theme="dark"]' in auto
+        assert "data-rs-theme-toggle" not in light
+
+
+class TestPDFExporter:
+    """Test suite for PDFExporter."""
+
+    def test_export_pages_requires_cairosvg(self, tmp_path, sample_svg, monkeypatch):
+        """Test that multi-page export reports the missing optional dependency."""
+        monkeypatch.setitem(sys.modules, "cairosvg", None)
+
+        with pytest.raises(ImportError, match="pip install cairosvg"):
+            PDFExporter().export_pages([sample_svg], tmp_path / "book.pdf")
+
+    def test_page_titles_default_to_diagram_names(self, tmp_path, sample_svg):
+        """Test the bookmark titles derived from each kind of source."""
+        svg_file = tmp_path / "page.svg"
+        svg_file.write_text(sample_svg)
+
+        sources = PDFExporter._iter_svg_sources(
+            [UMLDiagramGenerator(Sample), svg_file, sample_svg]
+        )
+
+        assert [title for _, title in sources] == ["Sample", "page", None]
+
+    def test_export_pages_single_document(self, tmp_path, sample_svg):
+        """Test that several diagrams become pages of one PDF."""
+        pytest.importorskip("cairosvg")
+        svg_file = tmp_path / "page.svg"
+        svg_file.write_text(sample_svg)
+        output_file = tmp_path / "book.pdf"
+
+        pages = PDFExporter().export_pages(
+            iter([sample_svg, sample_svg.encode("utf-8"), svg_file]), output_file
+        )
+
+        assert pages == 3
+        assert output_file.read_bytes().startswith(b"%PDF")
+        assert output_file.read_bytes().count(b"/Type /Page") >= 3
+
+
+class TestTileExporter:
+    """Test suite for TileExporter."""
+
+    WIDE_SVG = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 300">'
+        '<rect x="10" y="10" width="980" height="280"/></svg>'
+    )
+
+    @pytest.fixture
+    def fake_cairosvg(self, monkeypatch):
+        """Record rasterized tiles instead of drawing them."""
+        import types
+
+        rendered = {}
+
+        def svg2png(bytestring, write_to):
+            rendered[write_to] = bytestring.decode("utf-8")
+            Path(write_to).write_bytes(b"\x89PNG")
+
+        fake = types.SimpleNamespace(svg2png=svg2png)
+        monkeypatch.setitem(sys.modules, "cairosvg", fake)
+        return rendered
+
+    def test_levels(self):
+        """Test the DeepZoom and XYZ pyramid geometry."""
+        from renderschema.exporters.tiles import TileExporter
+
+        dzi = TileExporter().levels(1000, 300)
+        xyz = TileExporter(layout="xyz").levels(1000, 300)
+
+        assert dzi[0] == (0, 1 / 1024, 1, 1)
+        assert dzi[-1] == (10, 1.0, 4, 2)
+        assert [level[0] for level in xyz] == [0, 1, 2]
+        assert xyz[0][2:] == (1, 1)
+
+    def test_deepzoom_tiles_are_clipped_views(self, tmp_path, fake_cairosvg):
+        """Test that each tile renders only its own area of the diagram."""
+        from renderschema.exporters.tiles import TileExporter
+
+        output = tmp_path / "wall.dzi"
+        TileExporter(workers=0).export(self.WIDE_SVG, output)
+
+        tile = tmp_path / "wall_files" / "10" / "1_0.png"
+        assert tile.exists()
+        sizing = 'width="258" height="257" viewBox="255.0 0.0 258.0 257.0"'
+        assert sizing in fake_cairosvg[str(tile)]
+        assert len(fake_cairosvg) == sum(
+            columns * rows for _, _, columns, rows in TileExporter().levels(1000, 300)
+        )
+        assert 'TileSize="256"' in output.read_text()
+        assert '<Size Width="1000" Height="300"/>' in output.read_text()
+        viewer = (tmp_path / "wall.html").read_text()
+        assert "wall_files/{level}/{col}_{row}.png" in viewer
+
+    def test_xyz_layout_through_registry(self, tmp_path, fake_cairosvg):
+        """Test exporting XYZ tiles via get_exporter."""
+        from renderschema.exporters import get_exporter
+
+        exporter = get_exporter("xyz")
+        exporter.workers = 0
+        exporter.export(self.WIDE_SVG, tmp_path / "map.xyz")
+
+        assert (tmp_path / "map" / "0" / "0" / "0.png").exists()
+        assert (tmp_path / "map" / "2" / "3" / "1.png").exists()
+        assert (tmp_path / "map.html").exists()
+
+    def test_to_bytes_and_file_objects_get_a_zip(self, fake_cairosvg):
+        """Test that tiles without a target directory are packed into a zip."""
+        import zipfile
+
+        from renderschema.exporters.tiles import TileExporter
+
+        exporter = TileExporter(layout="xyz", workers=0)
+        archive = zipfile.ZipFile(io.BytesIO(exporter.to_bytes(self.WIDE_SVG)))
+        buffer = io.BytesIO()
+        exporter.export(self.WIDE_SVG, buffer)
+
+        names = archive.namelist()
+        assert "diagram.html" in names and "diagram/2/3/1.png" in names
+        assert zipfile.ZipFile(buffer).namelist() == names
+
+    def test_requires_cairosvg(self, tmp_path, monkeypatch):
+        """Test that tile export reports the missing optional dependency."""
+        from renderschema.exporters.tiles import TileExporter
+
+        monkeypatch.setitem(sys.modules, "cairosvg", None)
+        with pytest.raises(ImportError, match="pip install cairosvg"):
+            TileExporter().export(self.WIDE_SVG, tmp_path / "wall.dzi")
+
+
+class TestOutputManifest:
+    """Test suite for OutputManifest."""
+
+    def test_unchanged_export_is_skipped(self, tmp_path):
+        """Test that re-exporting identical content leaves the file untouched."""
+        output_file = tmp_path / "out" / "diagram.svg"
+        manifest_file = tmp_path / "manifest.json"
+
+        with OutputManifest(manifest_file) as manifest:
+            assert UMLDiagramGenerator(Sample).export(output_file, manifest=manifest)
+        first_mtime = output_file.stat().st_mtime_ns
+
+        with OutputManifest(manifest_file) as manifest:
+            generator = UMLDiagramGenerator(Sample)
+            assert not generator.export(output_file, manifest=manifest)
+        assert output_file.stat().st_mtime_ns == first_mtime
+        assert "out/diagram.svg" in manifest_file.read_text()
+
+    def test_changed_or_missing_output_is_rewritten(self, tmp_path):
+        """Test that theme changes and deleted files trigger a new export."""
+        output_file = tmp_path / "diagram.html"
+        manifest = OutputManifest(tmp_path / "manifest.json")
+
+        dark = UMLDiagramGenerator(Sample, theme="dark")
+        assert UMLDiagramGenerator(Sample).export(output_file, manifest=manifest)
+        assert dark.export(output_file, manifest=manifest)
+        output_file.unlink()
+        assert dark.export(output_file, manifest=manifest)
+
+
+class Other:
+    """A second class for site tests."""
+
+    def ping(self):
+        return Sample()
+
+
+class TestSiteBuilder:
+    """Test suite for SiteBuilder."""
+
+    def test_build_writes_lazy_site(self, tmp_path):
+        """Test that diagrams are external files loaded by a shared bundle."""
+        site = SiteBuilder(tmp_path, title="Sample site")
+        site.add("Classes", ClassDiagramGenerator([Sample, Other]))
+        site.add("Classes", UMLDiagramGenerator(Sample).snapshot())
+        index = site.build()
+        html = index.read_text()
+
+        assert (tmp_path / "diagrams" / "Classes.svg").exists()
+        assert (tmp_path / "diagrams" / "Classes-2.svg").exists()
+        assert 'data-src="diagrams/Classes-2.svg"' in html
+        assert "<svg" not in html
+        scripts = list((tmp_path / "assets").glob("renderschema.*.js"))
+        assert len(scripts) == 1 and f"assets/{scripts[0].name}" in html
+        assert "RenderSchemaViewer" in scripts[0].read_text()
+
+    def test_rebuild_removes_stale_files(self, tmp_path):
+        """Test that changed diagrams are rewritten and dropped ones deleted."""
+        first = SiteBuilder(tmp_path)
+        first.add("a", UMLDiagramGenerator(Sample))
+        first.add("b", UMLDiagramGenerator(Other))
+        first.build()
+        kept = tmp_path / "diagrams" / "a.svg"
+
+        second = SiteBuilder(tmp_path, theme="auto")
+        second.add("a", UMLDiagramGenerator(Sample, theme="auto"))
+        second.build()
+
+        assert not (tmp_path / "diagrams" / "b.svg").exists()
+        assert len(list((tmp_path / "assets").glob("*.css"))) == 1
+        assert "data-rs-theme-toggle" in (tmp_path / "index.html").read_text()
+        assert "var(--rs-" in kept.read_text()
+
+    def test_search_index_is_sorted_and_linked(self):
+        """Test the compact search index layout."""
+        data = ClassDiagramGenerator([Sample, Other]).analyze()
+        index = build_search_index([("Classes", "classes", data)])
+
+        names = index["names"]
+        assert names == sorted(names, key=str.lower)
+        assert len(index["kinds"]) == len(names) == len(index["parents"])
+        ping = names.index("ping")
+        assert index["kinds"][ping] == "m"
+        assert names[index["parents"][ping]] == "Other"
+        assert names[index["parents"][index["parents"][ping]]] == __name__
+        assert index["pages"] == ["classes"] and set(index["page"]) == {0}
+
+    def test_hashed_assets_with_special_stem(self, tmp_path):
+        """Test that stale hashed files are found for stems with regex characters."""
+        from renderschema.site import _write_hashed
+
+        other = _write_hashed(tmp_path, "ab", ".js", "other")
+        _write_hashed(tmp_path, "a+b", ".js", "one")
+        current = _write_hashed(tmp_path, "a+b", ".js", "two")
+
+        assert {path.name for path in tmp_path.iterdir()} == {current, other}
+
+
+class Owner(Sample):
+    """A subclass that holds another sample."""
+
+    child: Sample
+
+
+class TestTextExporters:
+    """Test suite for the Mermaid, DOT and PlantUML exporters."""
+
+    def test_class_relationships(self):
+        """Test that classes and relationships are written in each format."""
+        generator = ClassDiagramGenerator([Sample, Owner])
+
+        mermaid = generator.to_bytes("mmd").decode()
+        dot = generator.to_bytes("dot").decode()
+        plantuml = generator.to_bytes("puml").decode()
+
+        sample, owner = f"{__name__}.Sample", f"{__name__}.Owner"
+        ids = {name: name.replace(".", "_") for name in (sample, owner)}
+        assert mermaid.startswith("classDiagram\n")
+        assert f'class {ids[owner]}["Owner"]' in mermaid
+        assert f"{ids[sample]} <|-- {ids[owner]}" in mermaid
+        assert f"{ids[owner]} *-- {ids[sample]} : child" in mermaid
+        assert f'"{owner}" -> "{sample}" [arrowhead=empty];' in dot
+        composition = '[dir=back, arrowtail=diamond, label="child"]'
+        assert f'"{owner}" -> "{sample}" {composition};' in dot
+        assert plantuml.startswith("@startuml\n") and plantuml.endswith("@enduml\n")
+        assert f"{ids[sample]} <|-- {ids[owner]}" in plantuml
+
+    def test_uml_members_and_flowchart(self):
+        """Test UML members and flowchart nodes."""
+        from renderschema.exporters.text import MermaidExporter, PlantUMLExporter
+
+        uml = UMLDiagramGenerator(Owner).analyze()
+        assert "+int value" in MermaidExporter().render(uml)
+        assert "+value : int" in PlantUMLExporter().render(uml)
+
+        flow = {"name": "f", "nodes": [
+            {"type": "start", "label": "Start"},
+            {"type": "process", "label": 'say "hi"'},
+            {"type": "end", "label": "End"},
+        ]}
+        assert MermaidExporter().render(flow) == (
+            'flowchart TD\n    n0(["Start"])\n    n1["say #quot;hi#quot;"]\n'
+            '    n2(["End"])\n'
+            "    n0 --> n1\n    n1 --> n2\n"
+        )
+        assert PlantUMLExporter().render(flow) == (
+            '@startuml\nstart\n:say "hi";\nstop\n@enduml\n'
+        )
+        with pytest.raises(ValueError, match="Mermaid"):
+            MermaidExporter().render({"type": "sequence", "participants": []})
+
+    def test_edges_to_classes_outside_the_diagram_are_skipped(self):
+        """Test that relationships and edges to undrawn ids do not raise."""
+        from renderschema.exporters.text import (
+            DOTExporter,
+            MermaidExporter,
+            PlantUMLExporter,
+        )
+
+        classes = {
+            "type": "class",
+            "classes": [{"id": "app.A", "name": "A"}],
+            "relationships": [
+                {"type": "inheritance", "from": "app.A", "to": "lib.Base"},
+            ],
+        }
+        graph = {
+            "nodes": [{"id": "a", "name": "a"}],
+            "edges": [{"from": "a", "to": "missing"}],
+        }
+        for exporter in (MermaidExporter(), DOTExporter(), PlantUMLExporter()):
+            assert "lib.Base" not in exporter.render(classes)
+            assert "missing" not in exporter.render(graph)
+
+    def test_export_skips_svg_generation(self, tmp_path, monkeypatch):
+        """Test that text formats are written from the analysis without SVG."""
+        generator = ClassDiagramGenerator([Sample, Owner])
+
+        def fail():
+            raise AssertionError("generate() called")
+
+        monkeypatch.setattr(generator, "generate", fail)
+        assert generator.export(tmp_path / "classes.mmd")
+        assert (tmp_path / "classes.mmd").read_text().startswith("classDiagram")
+        assert generator.export(tmp_path / "classes.gv", format="dot")
+        assert "digraph classes" in (tmp_path / "classes.gv").read_text()
@@ -0,0 +1,94 @@
+"""Unit tests for import-time parsing and the icicle diagram generator."""
+
+import pytest
+
+from renderschema import diagram
+from renderschema.analysis.imports import parse_import_log
+from renderschema.generators.import_time import ImportTimeGenerator
+
+LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       148 |        148 |   _io
+import time:       287 |        435 | _frozen_importlib_external
+import time:      2000 |       2000 |       re._compiler
+import time:       600 |       2600 |     re
+import time:       500 |       3100 |   json.decoder
+import time:       600 |        600 |   json.encoder
+import time:       300 |       4000 | json
+Traceback lines and other stderr output are ignored
+"""
+
+BASELINE = """\
+import time:       287 |        287 | _frozen_importlib_external
+import time:       200 |        200 |       re._compiler
+import time:       600 |        800 |     re
+import time:       500 |       1300 |   json.decoder
+import time:       600 |        600 |   json.encoder
+import time:       100 |        100 |   json.tool
+import time:       300 |       2300 | json
+"""
+
+
+class TestImportLog:
+    """Test suite for importtime log parsing."""
+
+    def test_builds_tree_from_post_order_log(self):
+        """Test that children printed before their parent are nested under it."""
+        roots = parse_import_log(LOG)
+
+        names = [root["name"] for root in roots]
+        assert names == ["_frozen_importlib_external", "json"]
+        json_node = roots[1]
+        assert json_node["self"] == 300 and json_node["cumulative"] == 4000
+        decoder, encoder = json_node["children"]
+        assert decoder["name"] == "json.decoder" and encoder["name"] == "json.encoder"
+        assert decoder["children"][0]["children"][0]["name"] == "re._compiler"
+
+    def test_truncated_log_keeps_orphans(self):
+        """Test that imports whose parent never finished become roots."""
+        roots = parse_import_log(LOG.splitlines()[:4])
+
+        names = [root["name"] for root in roots]
+        assert names == ["_frozen_importlib_external", "re._compiler"]
+
+
+class TestImportTimeGenerator:
+    """Test suite for ImportTimeGenerator."""
+
+    def test_hot_chain_is_highlighted(self):
+        """Test that the slowest chain from the slowest import is outlined."""
+        generator = diagram(LOG, diagram_type="importtime", hot_chains=1)
+        data = generator.analyze()
+        svg = generator.generate()
+
+        hot = []
+        stack = list(data["roots"])
+        while stack:
+            node = stack.pop()
+            if node.get("hot"):
+                hot.append(node["name"])
+            stack.extend(node["children"])
+        assert sorted(hot) == ["json", "json.decoder", "re", "re._compiler"]
+        assert svg.count("imp-node imp-hot") == 4
+        assert "import time: 4.4 ms" in svg
+
+    def test_diff_against_baseline(self, tmp_path):
+        """Test that regressions, new and removed modules are marked."""
+        baseline = tmp_path / "before.log"
+        baseline.write_text(BASELINE)
+
+        svg = ImportTimeGenerator(LOG, baseline=baseline, hot_chains=1).generate()
+
+        assert 'class="imp-node imp-slower imp-hot"' in svg
+        assert 'class="imp-node imp-new"' in svg
+        assert "No longer imported: json.tool" in svg
+        assert "(baseline 2.6 ms)" in svg
+
+    def test_captures_log_in_subprocess(self):
+        """Test importing a module in a fresh interpreter."""
+        data = ImportTimeGenerator("json").analyze()
+
+        assert data["name"] == "import json"
+        assert "json" in [root["name"] for root in data["roots"]]
+        with pytest.raises(ValueError, match="Not a module name"):
+            ImportTimeGenerator("json; import os").analyze()
@@ -0,0 +1,179 @@
+"""Unit tests for node placement and edge routing."""
+
+import pytest
+
+from renderschema.layout import (
+    GridIndex,
+    OrthogonalRouter,
+    force_layout,
+    layered_layout,
+    path_data,
+)
+
+
+def _segments(points):
+    return list(zip(points, points[1:]))
+
+
+class TestGridIndex:
+    """Test suite for GridIndex."""
+
+    def test_query_and_first_hit(self):
+        """Test rectangle queries against indexed boxes."""
+        index = GridIndex(cell_size=50)
+        index.insert("a", (0, 0, 100, 60))
+        index.insert("b", (300, 0, 100, 60))
+
+        assert index.query(50, -10, 50, 500) == {"a"}
+        assert index.first_hit(50, -10, 50, 500, ignore=["a"]) is None
+        assert index.query(0, 30, 400, 30) == {"a", "b"}
+        assert index.query(150, 0, 250, 60) == set()
+
+
+class TestOrthogonalRouter:
+    """Test suite for OrthogonalRouter."""
+
+    def test_routes_around_intervening_boxes(self):
+        """Test that a route never crosses a box other than its endpoints."""
+        boxes = {name: (200, 50 + i * 120, 200, 60) for i, name in enumerate("abcd")}
+        router = OrthogonalRouter(boxes)
+        index = GridIndex()
+        for name, box in boxes.items():
+            index.insert(name, box)
+
+        points = router.route("d", "a")
+
+        assert points[0] == (300, 410) and points[-1] == (300, 110)
+        for (x1, y1), (x2, y2) in _segments(points):
+            assert x1 == x2 or y1 == y2
+            assert index.first_hit(x1, y1, x2, y2, ignore=["a", "d"]) is None
+
+    def test_channel_detours_around_blocker(self):
+        """Test that horizontal channel segments avoid boxes too."""
+        boxes = {
+            "s": (0, 400, 200, 60), "t": (600, 0, 200, 60), "x": (300, 50, 200, 60),
+        }
+        router = OrthogonalRouter(boxes)
+        index = GridIndex()
+        for name, box in boxes.items():
+            index.insert(name, box)
+
+        for source, target in (("s", "t"), ("t", "s"), ("s", "x"), ("x", "t")):
+            points = router.route(source, target)
+            for (x1, y1), (x2, y2) in _segments(points):
+                assert x1 == x2 or y1 == y2
+                hit = index.first_hit(x1, y1, x2, y2, ignore=[source, target])
+                assert hit is None
+
+    def test_arc_over_overlapping_rows_avoids_boxes(self):
+        """Test that the arc between boxes on one row goes around a taller box."""
+        boxes = {
+            "a": (0, 100, 100, 60),
+            "b": (400, 100, 100, 60),
+            "tall": (200, 0, 100, 200),
+        }
+        router = OrthogonalRouter(boxes)
+
+        points = router.route("a", "b")
+
+        assert points[0] == (50, 100) and points[-1] == (450, 100)
+        for (x1, y1), (x2, y2) in _segments(points):
+            assert router.index.first_hit(x1, y1, x2, y2, ignore=["a", "b"]) is None
+
+    def test_edges_to_same_target_share_trunk(self):
+        """Test that edges into one target end on the same final segment."""
+        boxes = {
+            "base": (250, 50, 200, 60),
+            "x": (50, 250, 200, 60),
+            "y": (450, 250, 200, 60),
+        }
+        router = OrthogonalRouter(boxes)
+
+        first, second = router.route("x", "base"), router.route("y", "base")
+
+        assert first[-2:] == second[-2:]
+
+    def test_parallel_edges_are_spread(self):
+        """Test that repeated edges between a pair do not overlap."""
+        boxes = {"a": (0, 0, 200, 60), "b": (0, 200, 200, 60)}
+        router = OrthogonalRouter(boxes)
+
+        assert router.route("b", "a") != router.route("b", "a")
+
+    def test_self_edges_loop_around_a_corner(self):
+        """Test that an edge from a box to itself is a visible loop."""
+        boxes = {"a": (200, 100, 200, 60), "b": (500, 100, 200, 60)}
+        router = OrthogonalRouter(boxes)
+
+        first, second = router.route("a", "a"), router.route("a", "a")
+
+        assert first == [(350, 100), (350, 84), (416, 84), (416, 115), (400, 115)]
+        assert second != first and second[0] == first[0] and second[-1] == first[-1]
+        for (x1, y1), (x2, y2) in _segments(first):
+            assert x1 == x2 or y1 == y2
+            assert router.index.first_hit(x1, y1, x2, y2) is None
+
+    def test_path_data_is_compact(self):
+        """Test that axis-aligned runs use H/V commands."""
+        assert path_data([(300, 410), (300, 394), (416.5, 394), (416.5, 110)]) == (
+            "M300 410V394H416.5V110"
+        )
+
+
+class TestLayeredLayout:
+    """Test suite for layered_layout."""
+
+    def test_parents_above_children(self):
+        """Test that every class is placed below its bases."""
+        positions = layered_layout(
+            ["child", "base", "grandchild"],
+            [("child", "base"), ("grandchild", "child")],
+        )
+
+        assert positions["base"][1] < positions["child"][1] < positions["grandchild"][1]
+
+
+class TestForceLayout:
+    """Test suite for force_layout."""
+
+    @staticmethod
+    def _graph(count):
+        nodes = [f"n{i}" for i in range(count)]
+        edges = [(f"n{i}", f"n{(i * 7) // 10}") for i in range(1, count)]
+        return nodes, edges
+
+    def test_deterministic_and_within_origin(self):
+        """Test that a seed reproduces the layout and boxes start at the origin."""
+        nodes, edges = self._graph(60)
+
+        first = force_layout(nodes, edges, seed=3, use_numpy=False)
+        second = force_layout(nodes, edges, seed=3, use_numpy=False)
+
+        assert first == second
+        assert set(first) == set(nodes)
+        assert min(x for x, _ in first.values()) == 50
+        assert min(y for _, y in first.values()) == 50
+        assert first != force_layout(nodes, edges, seed=4, use_numpy=False)
+
+    def test_connected_nodes_are_closer(self):
+        """Test that attraction pulls related nodes together."""
+        nodes, edges = self._graph(300)
+        positions = force_layout(nodes, edges, use_numpy=False)
+
+        def distance(a, b):
+            (ax, ay), (bx, by) = positions[a], positions[b]
+            return ((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5
+
+        linked = sum(distance(a, b) for a, b in edges) / len(edges)
+        unlinked = sum(distance(nodes[i], nodes[-1 - i]) for i in range(100)) / 100
+        assert linked < unlinked / 2
+
+    def test_numpy_backend(self):
+        """Test the vectorized backend above the exact-repulsion limit."""
+        pytest.importorskip("numpy")
+        nodes, edges = self._graph(600)
+
+        positions = force_layout(nodes, edges, use_numpy=True)
+
+        assert positions == force_layout(nodes, edges, use_numpy=True)
+        assert len(set(positions.values())) == len(nodes)
@@ -0,0 +1,89 @@
+"""Unit tests for object graph walking and the retained-memory generator."""
+
+import gc
+import weakref
+
+from renderschema import diagram
+from renderschema.analysis.objects import object_graph
+from renderschema.generators.object_graph import ObjectGraphGenerator
+
+
+class Entry:
+    """A cached value."""
+
+    def __init__(self, key, previous=None):
+        self.key = key
+        self.payload = [b"x" * 64 for _ in range(3)]
+        self.previous = previous
+
+
+class Cache:
+    """Keeps entries in a dict and a linked chain."""
+
+    def __init__(self, size):
+        self.entries = {key: Entry(key) for key in range(size)}
+        self.chain = None
+        for key in range(size):
+            self.chain = Entry(key, self.chain)
+
+
+def groups_by_name(data):
+    return {group["name"]: group for group in data["groups"]}
+
+
+class TestObjectGraph:
+    """Test suite for object_graph."""
+
+    def test_aggregates_by_type(self):
+        """Test counts, sizes and references between type groups."""
+        data = object_graph(Cache(50))
+        groups = groups_by_name(data)
+
+        assert groups["Cache (root)"]["root"]
+        assert groups["Entry"]["count"] == 100
+        assert groups["bytes"]["count"] == 1  # one constant shared by all payloads
+        total = sum(group["size"] for group in data["groups"])
+        assert groups["Cache (root)"]["retained"] == total
+        assert groups["Entry"]["retained"] < groups["Cache (root)"]["retained"]
+        edge = {"from": f"{__name__}.Cache (root)", "to": "builtins.dict", "count": 1}
+        assert edge in data["edges"]
+
+    def test_include_attributes_owned_objects(self):
+        """Test that types outside include are folded into their owner."""
+        data = object_graph(Cache(50), include=[__name__])
+
+        assert [group["name"] for group in data["groups"]] == ["Cache (root)", "Entry"]
+        assert data["groups"][0]["size"] > 0
+        assert data["edges"] == [
+            {"from": f"{__name__}.Cache (root)", "to": f"{__name__}.Entry", "count": 51}
+        ]
+
+    def test_bounds_filters_and_no_references(self):
+        """Test max_objects, max_depth, exclude, and that nothing is retained."""
+        cache = Cache(200)
+        probe = weakref.ref(cache.chain)
+
+        truncated = object_graph(cache, max_objects=10)
+        shallow = object_graph(cache, max_depth=1)
+        excluded = object_graph(cache, exclude=["builtins.list"])
+        del cache
+        gc.collect()
+
+        assert truncated["truncated"] and truncated["objects"] == 10
+        assert "Entry" in groups_by_name(shallow)
+        assert groups_by_name(shallow)["Entry"]["count"] == 1
+        assert "list" not in groups_by_name(excluded)
+        assert probe() is None
+
+
+class TestObjectGraphGenerator:
+    """Test suite for ObjectGraphGenerator."""
+
+    def test_generate(self):
+        """Test rendering through the registry."""
+        svg = diagram(Cache(20), diagram_type="objects", max_groups=3).generate()
+
+        assert 'class="obj-node root"' in svg
+        assert ">Cache (root)<" in svg
+        assert "smaller types not shown" in svg
+        assert ObjectGraphGenerator(Cache(5)).to_svg().count('class="obj-node') >= 4
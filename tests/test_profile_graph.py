@@ -0,0 +1,97 @@
+"""Unit tests for profile loading and the profile call graph generator."""
+
+import cProfile
+import pstats
+
+import pytest
+
+from renderschema import diagram
+from renderschema.analysis.profiles import load_stats, profile_graph
+from renderschema.generators.profile_graph import ProfileGraphGenerator
+
+MAIN = ("app.py", 1, "main")
+SLOW = ("app.py", 10, "slow")
+FAST = ("app.py", 20, "fast")
+TINY = ("lib.py", 5, "tiny")
+
+# main (1.0 s) calls slow (0.8 s) and fast (0.15 s); slow calls tiny (0.001 s).
+STATS = {
+    MAIN: (1, 1, 0.05, 1.0, {}),
+    SLOW: (2, 2, 0.799, 0.8, {MAIN: (2, 2, 0.799, 0.8)}),
+    FAST: (5, 5, 0.15, 0.15, {MAIN: (5, 5, 0.15, 0.15)}),
+    TINY: (9, 9, 0.001, 0.001, {SLOW: (9, 9, 0.001, 0.001)}),
+}
+
+
+def work():
+    """Spend most of the time in one helper."""
+    return sum(helper(n) for n in range(50))
+
+
+def helper(n):
+    return sum(range(n * 200))
+
+
+class TestProfileGraph:
+    """Test suite for profile loading and pruning."""
+
+    def test_prunes_below_threshold_and_marks_hot_path(self):
+        """Test threshold pruning, edge weights and the hot path."""
+        data = profile_graph(STATS, threshold=0.01)
+
+        names = [node["name"] for node in data["nodes"]]
+        assert names == ["main", "slow", "fast"]
+        assert data["pruned"] == 1
+        hot = {(edge["from"], edge["to"]) for edge in data["edges"] if edge.get("hot")}
+        assert hot == {("app.py:1(main)", "app.py:10(slow)")}
+        assert [node["depth"] for node in data["nodes"]] == [0, 1, 1]
+        assert not data["nodes"][2].get("hot")
+
+    def test_max_nodes_and_invalid_threshold(self):
+        """Test that only the slowest functions are kept."""
+        data = profile_graph(STATS, threshold=0, max_nodes=2)
+
+        assert [node["name"] for node in data["nodes"]] == ["main", "slow"]
+        with pytest.raises(ValueError, match="threshold"):
+            profile_graph(STATS, threshold=2)
+
+    def test_load_and_merge_sources(self, tmp_path):
+        """Test loading .prof files, Stats objects and profilers."""
+        profiler = cProfile.Profile()
+        profiler.runcall(work)
+        path = tmp_path / "work.prof"
+        profiler.dump_stats(path)
+
+        from_file = load_stats(path)
+        merged = load_stats([path, pstats.Stats(str(path))])
+
+        assert from_file.keys() == merged.keys()
+        key = next(func for func in from_file if func[2] == "helper")
+        assert merged[key][1] == 2 * from_file[key][1]
+        with pytest.raises(TypeError):
+            load_stats(42)
+
+
+class TestProfileGraphGenerator:
+    """Test suite for ProfileGraphGenerator."""
+
+    def test_generate_from_profile_file(self, tmp_path):
+        """Test rendering a recorded profile through the registry."""
+        profiler = cProfile.Profile()
+        profiler.runcall(work)
+        path = tmp_path / "work.prof"
+        profiler.dump_stats(path)
+
+        svg = diagram(path, diagram_type="profile", threshold=0.05).generate()
+
+        assert ">helper<" in svg
+        assert 'class="prof-node hot"' in svg
+        assert "work.prof:" in svg and "hidden" in svg
+
+    def test_sizes_scale_with_time(self):
+        """Test that heavier functions get larger boxes and thicker edges."""
+        svg = ProfileGraphGenerator(STATS, threshold=0.01).generate()
+
+        assert 'width="240.0"' in svg
+        assert 'class="prof-edge hot" stroke-width="6.6"' in svg
+        assert 'class="prof-edge" stroke-width="2.0"' in svg
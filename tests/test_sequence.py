@@ -0,0 +1,173 @@
+"""Unit tests for runtime call tracing and the sequence diagram generator."""
+
+import pytest
+
+from renderschema import diagram
+from renderschema.analysis.tracing import CallTracer, build_sequence
+from renderschema.generators.sequence import SequenceDiagramGenerator
+
+
+class Repository:
+    """Stores orders."""
+
+    def save(self, order):
+        return self.validate(order)
+
+    def validate(self, order):
+        return order
+
+
+class Mailer:
+    """Sends confirmations."""
+
+    def send(self, order):
+        return order
+
+
+class OrderService:
+    """Places orders."""
+
+    def __init__(self):
+        self.repository = Repository()
+        self.mailer = Mailer()
+
+    def place(self, orders):
+        for order in orders:
+            self.repository.save(order)
+            self.mailer.send(order)
+
+
+def checkout():
+    """Place a batch of orders."""
+    OrderService().place(range(5))
+
+
+class Catalog:
+    """Produces items lazily."""
+
+    def items(self):
+        for number in range(3):
+            yield self.load(number)
+
+    def load(self, number):
+        return number
+
+
+class Shelf:
+    """Consumes the catalog."""
+
+    def stock(self, catalog):
+        total = 0
+        for item in catalog.items():
+            total += item
+        return total
+
+
+class TestCallTracer:
+    """Test suite for CallTracer."""
+
+    def test_records_calls_between_objects(self):
+        """Test that calls are attributed to their defining classes."""
+        tracer = CallTracer(include=[__name__], backend="profile")
+        with tracer:
+            checkout()
+
+        calls = [
+            (caller, callee, method) for _, _, caller, callee, method in tracer.events
+        ]
+        service = f"{__name__}.OrderService"
+        assert calls[0] == (None, __name__, "checkout")
+        assert (service, f"{__name__}.Repository", "save") in calls
+        assert (f"{__name__}.Repository", f"{__name__}.Repository", "validate") in calls
+
+    def test_filters_sampling_and_ring_buffer(self):
+        """Test class filters, root call sampling and the bounded buffer."""
+        by_class = CallTracer(include=[__name__], classes=["Mailer"], backend="profile")
+        with by_class:
+            checkout()
+        sampled = CallTracer(include=[__name__], sample_rate=0.5, backend="profile")
+        with sampled:
+            for _ in range(4):
+                Mailer().send(1)
+        bounded = CallTracer(include=[__name__], buffer_size=3, backend="profile")
+        with bounded:
+            checkout()
+
+        assert {event[3] for event in by_class.events} == {f"{__name__}.Mailer"}
+        assert len(sampled.events) == 2
+        assert len(bounded.events) == 3
+
+    def test_generator_resumes_are_not_calls(self):
+        """Test that a generator is one call however often it is resumed."""
+        tracer = CallTracer(include=[__name__], backend="profile")
+        with tracer:
+            Shelf().stock(Catalog())
+
+        catalog = f"{__name__}.Catalog"
+        calls = [
+            (depth, caller, method) for _, depth, caller, _, method in tracer.events
+        ]
+        assert calls == [
+            (0, None, "stock"),
+            (1, f"{__name__}.Shelf", "items"),
+            (2, catalog, "load"),
+            (2, catalog, "load"),
+            (2, catalog, "load"),
+        ]
+        thread = build_sequence(tracer.events)["threads"][0]
+        (items,) = thread["messages"][0]["messages"]
+        assert items["method"] == "items"
+        assert items["messages"][0]["type"] == "loop"
+
+    def test_invalid_options(self):
+        """Test that out-of-range options are rejected."""
+        with pytest.raises(ValueError, match="sample_rate"):
+            CallTracer(sample_rate=0)
+        with pytest.raises(ValueError, match="Unknown tracing backend"):
+            CallTracer(backend="ptrace")
+
+
+class TestSequenceDiagram:
+    """Test suite for SequenceDiagramGenerator."""
+
+    def test_repeated_patterns_collapse_into_loops(self):
+        """Test that a repeated run of calls becomes one loop fragment."""
+        data = SequenceDiagramGenerator(checkout, backend="profile").analyze()
+
+        root = data["threads"][0]["messages"][0]
+        init, place = root["messages"][:2]
+        loop = place["messages"][0]
+        assert init["method"] == "__init__"
+        assert loop["type"] == "loop" and loop["count"] == 5
+        assert [message["method"] for message in loop["messages"]] == ["save", "send"]
+        assert data["participants"][:2] == [__name__, f"{__name__}.OrderService"]
+
+    def test_build_sequence_nests_by_depth(self):
+        """Test that messages are nested by depth and split by thread."""
+        events = [
+            (1, 0, None, "a.A", "run"),
+            (1, 1, "a.A", "a.B", "step"),
+            (2, 0, None, "a.B", "step"),
+            (1, 1, "a.A", "a.B", "step"),
+        ]
+        data = build_sequence(events)
+
+        first, second = data["threads"]
+        assert first["messages"][0]["messages"][0]["type"] == "loop"
+        assert second["messages"][0]["to"] == "a.B"
+        assert data["participants"] == ["a.A", "a.B"]
+
+    def test_generate_and_export(self, tmp_path):
+        """Test rendering through the registry and export pipeline."""
+        generator = diagram(checkout, diagram_type="sequence", backend="profile")
+        output = tmp_path / "checkout.svg"
+        generator.export(output)
+        svg = output.read_text()
+
+        assert svg.count('class="seq-participant"') == 4
+        assert "loop ×5" in svg
+        assert "place()" in svg
+        truncated = SequenceDiagramGenerator.from_analysis(
+            generator.analyzed(), max_messages=2
+        ).generate()
+        assert "Diagram truncated" in truncated
@@ -56,8 +56,85 @@ class TestUMLDiagramGenerator:
         
         assert "#1f2937" in svg  # Dark theme color
 
+    def test_auto_theme(self):
+        """Test that the auto theme emits one SVG for both color schemes."""
+        from renderschema.themes import resolve_variables
+
+        svg = UMLDiagramGenerator(SampleClass, theme="auto").generate()
+        resolved = resolve_variables(svg, "dark")
+
+        assert "fill: var(--rs-surface)" in svg
+        assert "@media (prefers-color-scheme: dark)" in svg
+        assert 'svg[data-theme="dark"]' in svg
+        assert "var(--rs-" not in resolved
+        assert ".class-box { fill: #1f2937;" in resolved
+        assert UMLDiagramGenerator(SampleClass, theme="sepia").generate() == \
+            UMLDiagramGenerator(SampleClass, theme="light").generate()
+
     def test_invalid_target(self):
         """Test error handling for invalid target."""
         with pytest.raises(TypeError):
             generator = UMLDiagramGenerator("not a class")
             generator.analyze()
+
+    def test_properties_are_not_evaluated(self):
+        """Test that analysis never invokes property getters."""
+        calls = []
+
+        class Lazy:
+            @property
+            def expensive(self) -> int:
+                calls.append(True)
+                return 42
+
+        data = UMLDiagramGenerator(Lazy).analyze()
+
+        assert calls == []
+        expensive = {"name": "expensive", "type": "int", "visibility": "public"}
+        assert expensive in data["attributes"]
+
+    def test_inherited_members_included(self):
+        """Test that members defined on base classes are listed."""
+        class Child(SampleClass):
+            def extra(self) -> None:
+                pass
+
+        data = UMLDiagramGenerator(Child).analyze()
+        method_names = [m["name"] for m in data["methods"]]
+
+        assert method_names == ["__init__", "extra", "get_name"]
+
+    def test_streamed_svg_matches_generate(self, tmp_path):
+        """Test that streaming a module produces the batch output."""
+        import sys
+
+        module = sys.modules[__name__]
+        streamed = "".join(UMLDiagramGenerator(module).iter_svg())
+
+        assert streamed == UMLDiagramGenerator(module).generate()
+
+        output = tmp_path / "module.svg"
+        UMLDiagramGenerator(module).stream_export(output)
+        assert output.read_text(encoding="utf-8") == streamed
+
+    def test_streamed_package_matches_generate(self, tmp_path, monkeypatch):
+        """Test streaming a recursively analyzed package in-process."""
+        import importlib
+
+        root = tmp_path / "rs_streampkg"
+        root.mkdir()
+        (root / "__init__.py").write_text("")
+        (root / "a.py").write_text(
+            "class A:\n    def run(self) -> int:\n        return 1\n"
+        )
+        (root / "b.py").write_text(
+            "from rs_streampkg.a import A\n\nclass B(A):\n    pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        package = importlib.import_module("rs_streampkg")
+
+        options = {"recursive": True, "workers": 0}
+        streamed = "".join(UMLDiagramGenerator(package, **options).iter_svg(window=1))
+
+        assert streamed == UMLDiagramGenerator(package, **options).generate()
+        assert streamed.count('class="class-box"') == 2